@@ -0,0 +1,130 @@
+"""
+bench_author_position.py — author_position / author_positions, before/after.
+
+Times the old per-list loop (split, strip and lower every name in Python,
+one call per scholar) against author_position() for one scholar and
+author_positions() for many, on synthetic author lists drawn from 300,
+3,000 and 20,000 distinct coauthor names.  Positions are checked to agree
+with the old loop before timing.
+
+Usage:
+    python bench_author_position.py [--scholars 50] [--papers 1000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+import scholar  # noqa: E402
+
+VOCABULARIES = (300, 3_000, 20_000)
+
+
+def before(author_lists: list[str], author_name: str) -> pd.DataFrame:
+    """author_position() as it was: a Python loop over every name."""
+    last_name = author_name.strip().split()[-1].lower()
+    records = []
+    for authors_str in author_lists:
+        parts = [a.strip() for a in str(authors_str).split(",")]
+        lastnames = [p.split()[-1].lower() if p.split() else "" for p in parts]
+        n = len(parts)
+        has_ellipsis = any("..." in p for p in parts)
+        matches = [i for i, ln in enumerate(lastnames) if last_name in ln]
+        pos = matches[0] + 1 if len(matches) == 1 else None
+        if pos is None or has_ellipsis:
+            norm = None
+        else:
+            norm = 1.0 if n == 1 else (pos - 1) / (n - 1)
+        records.append(
+            {
+                "authors": authors_str,
+                "position": pos,
+                "n_authors": None if has_ellipsis else n,
+                "position_normalized": norm,
+            }
+        )
+    return pd.DataFrame(records)
+
+
+def _corpus(n_scholars: int, n_papers: int, vocabulary: int) -> pd.DataFrame:
+    """Author lists of 2-8 names, each holding its scholar once."""
+    rng = np.random.default_rng(vocabulary)
+    initials = np.array(list("ABCDEFGHJKLMNPRSTW"))
+    lasts = np.array([f"Coauthor{k:05d}" for k in range(vocabulary)])
+    rows = []
+    for k in range(n_scholars):
+        me = f"Q Scholar{k:03d}"
+        for _ in range(n_papers):
+            size = rng.integers(1, 8)
+            names = [
+                f"{i} {last}"
+                for i, last in zip(rng.choice(initials, size), rng.choice(lasts, size))
+            ]
+            names.insert(rng.integers(0, size + 1), me)
+            rows.append((f"S{k:03d}", ", ".join(names)))
+    return pd.DataFrame(rows, columns=["id", "author"])
+
+
+def _best_ms(fn, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000
+
+
+def _agree(old: pd.DataFrame, new: pd.DataFrame) -> bool:
+    return np.array_equal(
+        old["position"].to_numpy(dtype=float),
+        new["position"].to_numpy(dtype=float, na_value=np.nan),
+        equal_nan=True,
+    )
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--scholars", type=int, default=50)
+    ap.add_argument("--papers", type=int, default=1000)
+    args = ap.parse_args()
+
+    print(f"{'names':>7}  {'case':<26}{'before ms':>11}{'after ms':>10}{'speedup':>9}")
+    for vocabulary in VOCABULARIES:
+        pubs = _corpus(args.scholars, args.papers, vocabulary)
+        names = {sid: f"Q Scholar{k:03d}" for k, sid in enumerate(pubs["id"].unique())}
+        groups = {sid: g["author"].tolist() for sid, g in pubs.groupby("id")}
+        one = next(iter(groups))
+
+        after = scholar.author_positions(pubs, names)
+        for sid, lists in groups.items():
+            if not _agree(before(lists, names[sid]), after[after["id"] == sid]):
+                sys.exit(f"positions differ from the old loop for {sid}")
+
+        cases = [
+            (
+                f"one scholar, {args.papers} papers",
+                lambda: before(groups[one], names[one]),
+                lambda: scholar.author_position(groups[one], names[one]),
+            ),
+            (
+                f"{args.scholars} scholars, {len(pubs)} papers",
+                lambda: [before(groups[s], names[s]) for s in groups],
+                lambda: scholar.author_positions(pubs, names),
+            ),
+        ]
+        for label, old, new in cases:
+            old_ms, new_ms = _best_ms(old), _best_ms(new)
+            print(f"{vocabulary:>7}  {label:<26}{old_ms:>11.1f}{new_ms:>10.1f}{old_ms / new_ms:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
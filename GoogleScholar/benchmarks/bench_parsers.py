@@ -0,0 +1,213 @@
+"""
+bench_parsers.py — compare scholar.py's HTML parser backends on fixture pages.
+
+For every installed backend (selectolax, lxml, bs4) and every fixture page,
+reports the median time to parse the page and run the extraction that
+scholar.py performs on it, and the peak resident memory of doing so in a
+fresh process.  Also checks that every backend extracts identical data,
+and compares whole-page parsing with the targeted region parsing used by
+the single-field getters.
+
+Usage:
+    python bench_parsers.py [--repeat N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+import scholar  # noqa: E402
+from make_fixtures import FIXTURE_DIR, write_fixtures  # noqa: E402
+
+
+def _extract_profile(page):
+    return {
+        "profile": scholar._parse_profile(page, "FIXPROFAAAAJ"),
+        "history": scholar._parse_citation_history(page).to_dict("list"),
+        "coauthors": scholar._parse_coauthors(page, "FIXPROFAAAAJ").to_dict("list"),
+        "publications": scholar._parse_publication_rows(page),
+    }
+
+
+def _extract_view_citation(page):
+    return {
+        "fields": scholar._parse_publication_fields(page),
+        "abstract": scholar._parse_publication_abstract(page),
+        "url": scholar._parse_publication_link(page),
+        "history": scholar._parse_article_cite_history(page, "x").to_dict("list"),
+    }
+
+
+# Fixture -> what scholar.py extracts from that kind of page
+EXTRACTORS = {
+    "profile_20.html": _extract_profile,
+    "list_works_100.html": _extract_profile,
+    "view_citation.html": _extract_view_citation,
+}
+
+
+# (fixture, region, extraction) for the single-field getters
+REGION_EXTRACTORS = [
+    ("view_citation.html", "title", lambda p: scholar._parse_publication_link(p)),
+    ("view_citation.html", "abstract", lambda p: scholar._parse_publication_abstract(p)),
+    ("view_citation.html", "fields", lambda p: scholar._parse_publication_fields(p)),
+    (
+        "view_citation.html",
+        "article_history",
+        lambda p: scholar._parse_article_cite_history(p, "x").to_dict("list"),
+    ),
+    (
+        "list_works_100.html",
+        "citation_history",
+        lambda p: scholar._parse_citation_history(p).to_dict("list"),
+    ),
+]
+
+
+def _available_backends() -> list[str]:
+    return [b for b in scholar._PARSER_BACKENDS if scholar._backend_available(b)]
+
+
+def _load(name: str) -> str:
+    path = os.path.join(FIXTURE_DIR, name)
+    if not os.path.exists(path):
+        write_fixtures()
+    with open(path, encoding="utf-8") as fh:
+        return fh.read()
+
+
+def _run_once(backend: str, name: str):
+    page = scholar._parse_document(_load_cached(name), backend)
+    return EXTRACTORS[name](page)
+
+
+_HTML: dict[str, str] = {}
+
+
+def _load_cached(name: str) -> str:
+    if name not in _HTML:
+        _HTML[name] = _load(name)
+    return _HTML[name]
+
+
+def _rss_status_kib(key: str) -> float:
+    with open("/proc/self/status") as fh:
+        for line in fh:
+            if line.startswith(key + ":"):
+                return float(line.split()[1])
+    raise KeyError(key)
+
+
+def _reset_peak() -> bool:
+    """Reset the kernel's peak-RSS counter (Linux >= 4.0); False if unsupported."""
+    try:
+        with open("/proc/self/clear_refs", "w") as fh:
+            fh.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def _child(backend: str, name: str) -> None:
+    """Measure peak RSS growth for one parse+extract in this fresh process."""
+    html = _load_cached(name)
+    scholar._parse_document("<html></html>", backend)  # import the backend
+    if _reset_peak():
+        before = _rss_status_kib("VmRSS")
+        page = scholar._parse_document(html, backend)
+        EXTRACTORS[name](page)
+        peak = _rss_status_kib("VmHWM") - before
+    else:  # ru_maxrss is a lifetime peak: only meaningful if parsing sets it
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        scale = 1 / 1024 if sys.platform == "darwin" else 1
+        before = rss * scale
+        page = scholar._parse_document(html, backend)
+        EXTRACTORS[name](page)
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale - before
+    print(json.dumps({"peak_kib": peak}))
+
+
+def _peak_kib(backend: str, name: str) -> float:
+    out = subprocess.run(
+        [sys.executable, __file__, "--child", backend, name],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(out)["peak_kib"]
+
+
+def _median_ms(fn, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return statistics.median(times) * 1000
+
+
+def _bench_regions(backends: list[str], repeat: int) -> None:
+    print(f"{'region':<18}{'backend':<12}{'full ms':>9}{'region ms':>11}{'speedup':>9}")
+    for name, region, extract in REGION_EXTRACTORS:
+        html = _load_cached(name)
+        for backend in reversed(backends):
+            full = lambda: extract(scholar._parse_document(html, backend))  # noqa: E731
+            part = lambda: extract(  # noqa: E731
+                scholar._parse_document(html, backend, region=region)
+            )
+            if full() != part():
+                print(f"!! {backend} region {region} differs from full parse")
+            t_full = _median_ms(full, repeat)
+            t_part = _median_ms(part, repeat)
+            print(
+                f"{region:<18}{backend:<12}{t_full:>9.2f}{t_part:>11.2f}"
+                f"{t_full / t_part:>8.1f}x"
+            )
+    print()
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--repeat", type=int, default=20)
+    ap.add_argument("--child", nargs=2, help=argparse.SUPPRESS)
+    args = ap.parse_args()
+    if args.child:
+        _child(*args.child)
+        return
+
+    backends = _available_backends()
+    print(f"backends: {', '.join(backends)}\n")
+    print(f"{'fixture':<22}{'backend':<12}{'median ms':>10}{'speedup':>9}{'peak KiB':>10}")
+    for name in EXTRACTORS:
+        reference = None
+        baseline = None
+        for backend in reversed(backends):  # bs4 first, as the baseline
+            result = _run_once(backend, name)
+            if reference is None:
+                reference = result
+            elif result != reference:
+                print(f"!! {backend} extracts different data from {name}")
+
+            median = _median_ms(lambda: _run_once(backend, name), args.repeat)
+            baseline = baseline or median
+            print(
+                f"{name:<22}{backend:<12}{median:>10.2f}"
+                f"{baseline / median:>8.1f}x{_peak_kib(backend, name):>10.0f}"
+            )
+        print()
+
+    _bench_regions(backends, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+bench_publication_table.py — memory of the publication table, before/after.
+
+Builds the table get_publications() returns for 1, 10 and 50 synthetic
+scholars of 1200 publications each, the way scholar.py used to (a list of
+per-row dicts passed to pd.DataFrame, timed including the dicts) and with the typed columnar schema
+(categorical journal, Int32 cites/year, string dtype; pyarrow strings
+when installed).  Reports deep memory usage, build time and peak heap.
+
+Usage:
+    python bench_publication_table.py [--scholars 1 10 50]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+import pandas as pd
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+import scholar  # noqa: E402
+from make_fixtures import publications  # noqa: E402
+
+PUBS_PER_SCHOLAR = 1200
+
+# The old build: per-row dicts into pd.DataFrame.  Text columns come out as
+# object with pandas 2 and as inferred str with pandas 3; both are shown.
+BEFORE = [("before: records, object", False)]
+if int(pd.__version__.split(".")[0]) >= 3:
+    BEFORE.append(("before: records, pandas str", True))
+
+
+def _columns(n_scholars: int) -> dict[str, list]:
+    """Parser output for `n_scholars` synthetic profiles, by column."""
+    columns: dict[str, list] = {col: [] for col in scholar._PUBLICATION_COLUMNS}
+    for k in range(n_scholars):
+        for p in publications(f"BENCH{k:04d}AAJ", PUBS_PER_SCHOLAR):
+            for col in scholar._PUBLICATION_COLUMNS:
+                columns[col].append(p[col])
+    return columns
+
+
+def _records(columns: dict[str, list]) -> list[dict]:
+    return [dict(zip(columns, values)) for values in zip(*columns.values())]
+
+
+def _measure(build) -> tuple[pd.DataFrame, float, float]:
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    df = build()
+    elapsed = time.perf_counter() - t0
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return df, elapsed * 1000, peak / 2**20
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--scholars", type=int, nargs="+", default=[1, 10, 50])
+    args = ap.parse_args()
+
+    storages = ["python"]
+    try:
+        import pyarrow  # noqa: F401
+
+        storages.append("pyarrow")
+    except ImportError:
+        print("(pyarrow not installed: skipping pyarrow-backed strings)\n")
+
+    print(f"{'rows':>7}  {'layout':<28}{'MiB':>9}{'vs before':>11}{'build ms':>10}{'peak MiB':>10}")
+    for n in args.scholars:
+        columns = _columns(n)
+        base = None
+        for label, infer in BEFORE:
+            with pd.option_context("future.infer_string", infer):
+                before, ms, peak = _measure(
+                    lambda: pd.DataFrame(_records(columns))
+                )
+            mib = before.memory_usage(deep=True).sum() / 2**20
+            base = base or mib
+            ratio = f"{base / mib:>10.1f}x" if mib != base else f"{'':>11}"
+            print(f"{len(before):>7}  {label:<28}{mib:>9.1f}{ratio}{ms:>10.1f}{peak:>10.1f}")
+        for storage in storages:
+            scholar.set_string_storage(storage)
+            after, ms, peak = _measure(lambda: scholar._publication_frame(columns))
+            mib = after.memory_usage(deep=True).sum() / 2**20
+            label = f"typed, {storage} strings"
+            print(f"{len(after):>7}  {label:<28}{mib:>9.1f}{base / mib:>10.1f}x{ms:>10.1f}{peak:>10.1f}")
+        print()
+    scholar.set_string_storage("auto")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+"""
+bench_suite.py — end-to-end and parse-only benchmarks for scholar.py.
+
+End to end: each public function runs against stub_server.StubScholar
+(no response cache, memo cleared between runs), reporting median wall
+time, requests per call and peak Python heap.  Parse only: the same
+functions' parsing and extraction over pre-rendered pages, no HTTP.
+Both cover scholars with 10, 100 and 1200 publications.
+
+Results can be saved and compared to catch regressions:
+
+    python bench_suite.py --json before.json
+    # ... change scholar.py ...
+    python bench_suite.py --baseline before.json   # exit 1 if slower
+
+Usage:
+    python bench_suite.py [--repeat N] [--latency S] [--throttle-every N]
+                          [--only SUBSTRING] [--json PATH] [--baseline PATH]
+                          [--tolerance 0.25]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+import warnings
+from urllib.parse import urlsplit
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+import scholar  # noqa: E402
+from make_fixtures import CORPUS, publications  # noqa: E402
+from stub_server import StubScholar, render  # noqa: E402
+
+SIZES = {n: sid for sid, n in CORPUS.items()}  # 10 / 100 / 1200 -> id
+SMALL, MEDIUM, LARGE = SIZES[10], SIZES[100], SIZES[1200]
+
+
+def _pubids(sid: str, n: int) -> list[str]:
+    return [p["pubid"] for p in publications(sid, CORPUS[sid])[:n]]
+
+
+# name -> zero-argument call; every public function that fetches
+END_TO_END = {
+    "get_profile": lambda: scholar.get_profile(MEDIUM),
+    "get_profile_bundle": lambda: scholar.get_profile_bundle(MEDIUM),
+    "get_publications[10]": lambda: scholar.get_publications(SMALL),
+    "get_publications[100]": lambda: scholar.get_publications(MEDIUM),
+    "get_publications[1200]": lambda: scholar.get_publications(LARGE),
+    "iter_publication_pages[1200]": lambda: list(
+        scholar.iter_publication_pages(LARGE, prefetch=True)
+    ),
+    "get_citation_history": lambda: scholar.get_citation_history(MEDIUM),
+    "get_article_cite_history": lambda: scholar.get_article_cite_history(
+        MEDIUM, _pubids(MEDIUM, 1)[0]
+    ),
+    "get_all_article_cite_histories[100]": lambda: (
+        scholar.get_all_article_cite_histories(MEDIUM)
+    ),
+    "get_num_articles[1200]": lambda: scholar.get_num_articles(LARGE),
+    "get_num_top_journals[1200]": lambda: scholar.get_num_top_journals(LARGE),
+    "get_publication_data_extended": lambda: (
+        scholar.get_publication_data_extended(MEDIUM, _pubids(MEDIUM, 1)[0])
+    ),
+    "get_publication_abstract": lambda: scholar.get_publication_abstract(
+        MEDIUM, _pubids(MEDIUM, 1)[0]
+    ),
+    "get_complete_authors[20]": lambda: scholar.get_complete_authors(
+        MEDIUM, _pubids(MEDIUM, 20)
+    ),
+    "get_publication_details[20]": lambda: scholar.get_publication_details(
+        MEDIUM, _pubids(MEDIUM, 20)
+    ),
+    "predict_h_index[1200]": lambda: scholar.predict_h_index(LARGE),
+    "compare_scholars[3]": lambda: scholar.compare_scholars([SMALL, MEDIUM, LARGE]),
+    "compare_scholar_careers[3]": lambda: scholar.compare_scholar_careers(
+        [SMALL, MEDIUM, LARGE]
+    ),
+    "get_coauthors[5x2]": lambda: scholar.get_coauthors(MEDIUM, 5, 2),
+    "get_scholar_id": lambda: scholar.get_scholar_id("Smith", "Jane"),
+    "scholar_summary": lambda: scholar.scholar_summary(MEDIUM),
+}
+
+
+def _page(url: str) -> str:
+    parts = urlsplit(url)
+    return render(f"{parts.path}?{parts.query}")
+
+
+def _parse_cases() -> dict:
+    """name -> (pages, extract(page)) using the parsers behind each function."""
+    s = scholar
+
+    def list_pages(sid):
+        return [
+            _page(s._publications_url(sid, c, 100, "citation"))
+            for c in range(0, CORPUS[sid] + 1, 100)
+        ]
+
+    view = _page(s._publication_page_url(MEDIUM, _pubids(MEDIUM, 1)[0]))
+    profile = _page(s._profile_url(MEDIUM))
+    return {
+        "get_profile": ([profile], None, lambda p: s._parse_profile(p, MEDIUM)),
+        "get_publications[10]": (list_pages(SMALL), None, s._parse_publication_rows),
+        "get_publications[100]": (list_pages(MEDIUM), None, s._parse_publication_rows),
+        "get_publications[1200]": (list_pages(LARGE), None, s._parse_publication_rows),
+        "get_citation_history": ([profile], "citation_history", s._parse_citation_history),
+        "get_coauthors": ([profile], None, lambda p: s._parse_coauthors(p, MEDIUM)),
+        "get_article_cite_history": (
+            [view], "article_history", lambda p: s._parse_article_cite_history(p, "x")
+        ),
+        "get_publication_abstract": ([view], "abstract", s._parse_publication_abstract),
+        "get_publication_details": ([view], None, s._parse_publication_details),
+    }
+
+
+def _median_ms(fn, repeat: int, before=None) -> float:
+    times = []
+    for _ in range(repeat):
+        if before:
+            before()
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return statistics.median(times) * 1000
+
+
+def _peak_mib(fn, before=None) -> float:
+    if before:
+        before()
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1] / 2**20
+    finally:
+        tracemalloc.stop()
+
+
+def _fresh() -> None:
+    scholar.clear_publication_memo()
+
+
+def run_end_to_end(stub: StubScholar, repeat: int, only: str) -> dict:
+    print(f"{'end to end':<38}{'median ms':>10}{'requests':>10}{'429s':>6}{'peak MiB':>10}")
+    results = {}
+    for name, call in END_TO_END.items():
+        if only not in name:
+            continue
+        _fresh()
+        call()  # warm up: imports, parser backend, connections
+        stub.reset_counts()
+        median = _median_ms(call, repeat, before=_fresh)
+        requests, throttled = stub.requests / repeat, stub.throttled / repeat
+        peak = _peak_mib(call, before=_fresh)
+        results[name] = {"ms": median, "requests": requests, "peak_mib": peak}
+        print(f"{name:<38}{median:>10.1f}{requests:>10.1f}{throttled:>6.1f}{peak:>10.1f}")
+    print()
+    return results
+
+
+def run_parse_only(repeat: int, only: str) -> dict:
+    print(f"{'parse only':<38}{'median ms':>10}{'pages':>10}{'peak MiB':>16}")
+    results = {}
+    for name, (pages, region, extract) in _parse_cases().items():
+        if only not in name:
+            continue
+
+        def call():
+            for html in pages:
+                extract(scholar._parse_document(html, region=region))
+
+        call()
+        median = _median_ms(call, repeat)
+        peak = _peak_mib(call)
+        results[name] = {"ms": median, "pages": len(pages), "peak_mib": peak}
+        print(f"{name:<38}{median:>10.2f}{len(pages):>10}{peak:>16.1f}")
+    print()
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Names whose median time grew by more than `tolerance` (0.25 = 25%)."""
+    slower = []
+    for suite, cases in results.items():
+        for name, now in cases.items():
+            before = baseline.get(suite, {}).get(name)
+            if before and now["ms"] > before["ms"] * (1 + tolerance):
+                slower.append(
+                    f"{suite}: {name} {before['ms']:.1f} -> {now['ms']:.1f} ms "
+                    f"({now['ms'] / before['ms'] - 1:+.0%})"
+                )
+    return slower
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--latency", type=float, default=0.0, help="seconds per response")
+    ap.add_argument("--throttle-every", type=int, default=0, help="429 every Nth request")
+    ap.add_argument("--only", default="", help="run cases whose name contains this")
+    ap.add_argument("--json", help="write results to this file")
+    ap.add_argument("--baseline", help="compare against a previous --json file")
+    ap.add_argument("--tolerance", type=float, default=0.25)
+    args = ap.parse_args()
+
+    # Measure the library, not the politeness limits
+    scholar.set_scholar_cache(None)
+    scholar.set_fetch_limits(rate=1e6, burst=10**6)
+    scholar.set_retry_policy(base=0.01)
+    warnings.simplefilter("ignore")
+    print(f"parser backend: {scholar.set_html_parser('auto')}\n")
+
+    with StubScholar(latency=args.latency, throttle_every=args.throttle_every) as stub:
+        scholar.set_scholar_mirror(stub.url)
+        results = {
+            "end_to_end": run_end_to_end(stub, args.repeat, args.only),
+            "parse_only": run_parse_only(args.repeat, args.only),
+        }
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as fh:
+            json.dump(results, fh, indent=2)
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as fh:
+            slower = compare(results, json.load(fh), args.tolerance)
+        for line in slower:
+            print(f"!! slower: {line}")
+        if slower:
+            sys.exit(1)
+        print(f"no regressions beyond {args.tolerance:.0%}")
+
+
+if __name__ == "__main__":
+    main()
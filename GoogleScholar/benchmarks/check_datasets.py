@@ -0,0 +1,91 @@
+"""
+check_datasets.py — round-trip check of save/load/refresh_scholar_dataset.
+
+Saves a dataset mixing a brand-new profile (no publications, coauthors,
+interests, citation history or availability counts, so its partitions hold
+only nulls and empty lists) with full profiles, in both orders, then loads
+every table back, compares it with the live functions and refreshes it.
+Exits 1 on the first mismatch.  Requires: pip install pyarrow
+
+Usage:
+    python check_datasets.py
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import warnings
+
+import pandas as pd
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+import scholar  # noqa: E402
+from stub_server import StubScholar  # noqa: E402
+
+EMPTY, SMALL, MEDIUM = "FIXS0000AAAJ", "FIXS0010AAAJ", "FIXS0100AAAJ"
+
+
+def _check(label: str, ok: bool) -> None:
+    print(f"{'ok  ' if ok else 'FAIL'}  {label}")
+    if not ok:
+        sys.exit(1)
+
+
+def _plain(pubs: pd.DataFrame) -> pd.DataFrame:
+    # The loaded journal categories span the whole dataset, not one scholar
+    return pubs.assign(journal=pubs["journal"].astype(object))
+
+
+def _roundtrip(path: str, ids: list[str]) -> None:
+    saved = scholar.save_scholar_dataset(path, ids)
+    _check(f"save {ids}", saved == ids)
+    data = scholar.load_scholar_dataset(path)
+    for sid in ids:
+        bundle = scholar.get_profile_bundle(sid)
+        profile = data["profiles"].set_index("id").loc[sid]
+        live = bundle.profile
+        _check(
+            f"{sid} profile",
+            profile["name"] == live["name"]
+            and list(profile["fields"]) == live["fields"]
+            and len(profile["coauthors"]) == len(live["coauthors"])
+            and (pd.isna(profile["available"]) == (live["available"] is None)),
+        )
+        pubs = data["publications"]
+        pubs = pubs[pubs["id"] == sid].drop(columns="id").reset_index(drop=True)
+        _check(
+            f"{sid} publications",
+            _plain(pubs).equals(_plain(scholar.get_publications(sid))),
+        )
+        for table, live_df in (
+            ("citation_history", bundle.citation_history),
+            ("coauthors", bundle.coauthors),
+        ):
+            stored = data[table]
+            stored = stored[stored["id"] == sid]
+            _check(f"{sid} {table}", len(stored) == len(live_df))
+    changes = scholar.refresh_scholar_dataset(path)
+    _check("refresh (nothing changed)", changes.empty)
+    reloaded = scholar.load_scholar_dataset(path)
+    _check(
+        "reload after refresh",
+        all(len(reloaded[t]) == len(data[t]) for t in data),
+    )
+
+
+def main() -> None:
+    warnings.simplefilter("ignore")
+    with StubScholar() as stub, tempfile.TemporaryDirectory() as tmp:
+        scholar.set_scholar_mirror(stub.url)
+        scholar.set_fetch_limits(rate=1e6, burst=10**6)
+        scholar.set_publication_memo_ttl(0)
+        for k, ids in enumerate(([EMPTY, SMALL, MEDIUM], [MEDIUM, SMALL, EMPTY])):
+            _roundtrip(os.path.join(tmp, f"ds{k}"), ids)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,269 @@
+"""
+make_fixtures.py — synthesize Google Scholar pages for offline benchmarks.
+
+The pages reproduce the markup scholar.py reads (element ids, classes and
+URL patterns) with invented names, titles and counts, so the corpus can be
+committed without copying anyone's real profile.  Output is deterministic.
+
+Usage:
+    python make_fixtures.py            # (re)write fixtures/
+"""
+
+from __future__ import annotations
+
+import os
+import random
+from html import escape
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+_JOURNALS = [
+    "Nature",
+    "Science",
+    "Neuron",
+    "Nature Neuroscience",
+    "Proceedings of the National Academy of Sciences",
+    "Journal of Neuroscience",
+    "PLoS Computational Biology",
+    "arXiv preprint arXiv:1801.00001",
+    "Advances in Neural Information Processing Systems",
+    "IEEE Transactions on Pattern Analysis and Machine Intelligence",
+]
+_SURNAMES = [
+    "Smith", "Li", "García", "Müller", "Nguyen", "Kowalski", "Okafor",
+    "Tanaka", "Rossi", "Dubois", "Olive", "Lin", "Haddad", "Johansson",
+]
+
+# Real profile pages carry ~100 KB of inline CSS and script before the
+# content; a block of similar size keeps parse timings representative.
+_HEAD_FILLER = (
+    "<style>"
+    + "".join(
+        f".gs_x{i}{{margin:{i % 7}px;padding:{i % 5}px;color:#{i % 999:03d}}}"
+        for i in range(1500)
+    )
+    + "</style><script>"
+    + "var _gsx=[" + ",".join(str(i * 7919 % 10007) for i in range(6000)) + "];"
+    + "</script>"
+)
+
+
+def _rng(*key) -> random.Random:
+    return random.Random("|".join(map(str, key)))
+
+
+def _author(rnd: random.Random) -> str:
+    return f"{rnd.choice('ABCDEFGHJKLMNPRSTW')}{rnd.choice(['', 'J', 'M'])} {rnd.choice(_SURNAMES)}"
+
+
+def publications(scholar_id: str, n_pubs: int) -> list[dict]:
+    """Deterministic publication records for a synthetic scholar."""
+    rnd = _rng("pubs", scholar_id)
+    pubs = []
+    for i in range(n_pubs):
+        authors = ", ".join(_author(rnd) for _ in range(rnd.randint(1, 6)))
+        if rnd.random() < 0.1:
+            authors += ", ..."
+        pubs.append(
+            {
+                "pubid": f"{rnd.getrandbits(40):010x}"[:12],
+                "title": f"On the {rnd.choice(['dynamics', 'structure', 'coding', 'geometry'])} "
+                f"of {rnd.choice(['cortical', 'neural', 'synaptic', 'latent'])} "
+                f"{rnd.choice(['circuits', 'populations', 'representations'])} {i}",
+                "author": authors,
+                "journal": rnd.choice(_JOURNALS),
+                "number": f"{rnd.randint(1, 500)} ({rnd.randint(1, 12)}), {rnd.randint(1, 900)}-{rnd.randint(901, 999)}",
+                "year": None if rnd.random() < 0.05 else rnd.randint(1990, 2025),
+                "cites": max(0, int(20000 / (i + 1) ** 1.1) - rnd.randint(0, 5)),
+                "cid": str(rnd.getrandbits(60)),
+            }
+        )
+    pubs.sort(key=lambda p: -p["cites"])
+    return pubs
+
+
+def _pub_row(scholar_id: str, p: dict) -> str:
+    year = p["year"] or ""
+    cites = p["cites"] or ""
+    return (
+        '<tr class="gsc_a_tr"><td class="gsc_a_t">'
+        f'<a href="/citations?view_op=view_citation&amp;hl=en&amp;user={scholar_id}'
+        f'&amp;pagesize=100&amp;citation_for_view={scholar_id}:{p["pubid"]}" class="gsc_a_at">'
+        f'{escape(p["title"])}</a>'
+        f'<div class="gs_gray">{escape(p["author"])}</div>'
+        f'<div class="gs_gray">{escape(p["journal"])} {p["number"]}'
+        f'<span class="gs_oph">, {year}</span></div></td>'
+        '<td class="gsc_a_c">'
+        f'<a href="https://scholar.google.com/scholar?oi=bibs&amp;hl=en&amp;cites={p["cid"]}" '
+        f'class="gsc_a_ac gs_ibl">{cites}</a></td>'
+        f'<td class="gsc_a_y"><span class="gsc_a_h gsc_a_hc gs_ibl">{year}</span></td></tr>'
+    )
+
+
+def render_profile(
+    scholar_id: str,
+    n_pubs: int,
+    cstart: int = 0,
+    pagesize: int = 20,
+    sortby: str = "citation",
+) -> str:
+    """A `/citations?user=...` page showing rows [cstart, cstart+pagesize)."""
+    rnd = _rng("profile", scholar_id)
+    pubs = publications(scholar_id, n_pubs)
+    if sortby == "year":
+        pubs = sorted(pubs, key=lambda p: -(p["year"] or 0))
+    rows = "".join(_pub_row(scholar_id, p) for p in pubs[cstart : cstart + pagesize])
+
+    total = sum(p["cites"] for p in pubs)
+    cites_sorted = sorted((p["cites"] for p in pubs), reverse=True)
+    h = sum(1 for i, c in enumerate(cites_sorted) if c >= i + 1)
+    i10 = sum(1 for c in cites_sorted if c >= 10)
+
+    years = list(range(2012, 2026))
+    hist_years = "".join(
+        f'<span class="gsc_g_t" style="right:{32 * (len(years) - k)}px">{y}</span>'
+        for k, y in enumerate(years)
+    )
+    hist_bars = "".join(
+        f'<a href="javascript:void(0)" class="gsc_g_a" '
+        f'style="right:{32 * (len(years) - k)}px;height:{k + 2}px;z-index:{len(years) - k}">'
+        f'<span class="gsc_g_al">{total // 40 + 13 * k}</span></a>'
+        for k, y in enumerate(years)
+        if k != 2  # one zero-citation year exercises the z-index path
+    )
+    coauthors = "".join(
+        '<li><div class="gsc_rsb_aa"><span class="gsc_rsb_a_desc">'
+        f'<a tabindex="-1" href="/citations?user={scholar_id[:4]}CO{k:02d}AAAAJ&amp;hl=en">'
+        f"{_author(rnd)}</a><span class=\"gsc_rsb_a_ext\">Synthetic University</span>"
+        "</span></div></li>"
+        for k in range(12)
+    )
+    interests = (
+        '<a href="#" class="gsc_prf_inta gs_ibl">Computational Neuroscience</a>'
+        '<a href="#" class="gsc_prf_inta gs_ibl">Machine Learning</a>'
+    )
+    mandates = (
+        f'<div class="gsc_rsb_m"><div class="gsc_rsb_m_a">{n_pubs // 4} articles</div>'
+        f'<div class="gsc_rsb_m_na">{n_pubs // 20} articles</div></div>'
+    )
+    if n_pubs == 0:
+        # A brand-new profile: no interests, history, mandates or coauthors
+        hist_years = hist_bars = coauthors = interests = mandates = ""
+    return f"""<!doctype html><html><head><title>Scholar {scholar_id}</title>{_HEAD_FILLER}</head>
+<body><div id="gs_top"><div id="gsc_prf_w"><div id="gsc_prf">
+<div id="gsc_prf_i"><div id="gsc_prf_in">Researcher {scholar_id}</div>
+<div class="gsc_prf_il">Professor of Neuroscience, Synthetic University</div>
+<div class="gsc_prf_il" id="gsc_prf_ivh">Verified email at synthetic.edu - <a href="https://synthetic.edu/~{scholar_id}" rel="nofollow" class="gsc_prf_ila">Homepage</a></div>
+<div class="gsc_prf_il" id="gsc_prf_int">{interests}</div>
+</div></div></div>
+<div class="gsc_rsb"><div class="gsc_rsb_s gsc_prf_pnl" id="gsc_rsb_cit">
+<table id="gsc_rsb_st"><thead><tr><th class="gsc_rsb_sth"></th><th class="gsc_rsb_sth">All</th><th class="gsc_rsb_sth">Since 2020</th></tr></thead><tbody>
+<tr><td class="gsc_rsb_sc1"><a href="#" class="gsc_rsb_f gs_ibl">Citations</a></td><td class="gsc_rsb_std">{total}</td><td class="gsc_rsb_std">{total // 3}</td></tr>
+<tr><td class="gsc_rsb_sc1"><a href="#" class="gsc_rsb_f gs_ibl">h-index</a></td><td class="gsc_rsb_std">{h}</td><td class="gsc_rsb_std">{h // 2}</td></tr>
+<tr><td class="gsc_rsb_sc1"><a href="#" class="gsc_rsb_f gs_ibl">i10-index</a></td><td class="gsc_rsb_std">{i10}</td><td class="gsc_rsb_std">{i10 // 2}</td></tr>
+</tbody></table>
+<div class="gsc_md_hist_w"><div class="gsc_md_hist_b">{hist_years}{hist_bars}</div></div></div>
+<div class="gsc_rsb_s gsc_prf_pnl" id="gsc_rsb_mnd">{mandates}</div>
+<div class="gsc_rsb_s gsc_prf_pnl" id="gsc_rsb_co"><ul class="gsc_rsb_a">{coauthors}</ul></div></div>
+<div id="gsc_art"><table id="gsc_a_t"><thead><tr id="gsc_a_tr0"><th class="gsc_a_t">Title</th><th class="gsc_a_c">Cited by</th><th class="gsc_a_y">Year</th></tr></thead>
+<tbody id="gsc_a_b">{rows}</tbody></table></div></div></body></html>"""
+
+
+def render_view_citation(scholar_id: str, pubid: str) -> str:
+    """A `view_op=view_citation` publication detail page."""
+    rnd = _rng("view", scholar_id, pubid)
+    authors = ", ".join(
+        f"{rnd.choice(['Alice', 'Bruno', 'Chen', 'Dana', 'Élodie'])} "
+        f"{rnd.choice(['M.', 'Q.', ''])} {rnd.choice(_SURNAMES)}".replace("  ", " ")
+        for _ in range(rnd.randint(2, 8))
+    )
+    years = list(range(2014, 2026))
+    bars = "".join(
+        f'<a href="/scholar?oi=bibs&amp;hl=en&amp;cites=1&amp;as_sdt=5&amp;as_ylo={y}&amp;as_yhi={y}" '
+        f'class="gsc_oci_g_a" style="left:{k * 20}px;height:{k}px;z-index:{k}">'
+        f'<span class="gsc_oci_g_al">{rnd.randint(1, 300)}</span></a>'
+        for k, y in enumerate(years)
+        if rnd.random() > 0.15
+    )
+    ticks = "".join(
+        f'<span class="gsc_oci_g_t" style="left:{k * 20}px">{y}</span>'
+        for k, y in enumerate(years)
+    )
+    abstract = " ".join(
+        rnd.choice(["neural", "population", "dynamics", "we", "show", "that", "model"])
+        for _ in range(180)
+    )
+    fields = [
+        ("Authors", authors),
+        ("Publication date", f"{rnd.randint(1995, 2024)}/{rnd.randint(1, 12)}/{rnd.randint(1, 28)}"),
+        ("Journal", rnd.choice(_JOURNALS)),
+        ("Volume", str(rnd.randint(1, 500))),
+        ("Issue", str(rnd.randint(1, 12))),
+        ("Pages", f"{rnd.randint(1, 900)}-{rnd.randint(901, 999)}"),
+        ("Publisher", "Synthetic Press"),
+    ]
+    rows = "".join(
+        f'<div class="gs_scl"><div class="gsc_oci_field">{k}</div>'
+        f'<div class="gsc_oci_value">{escape(v)}</div></div>'
+        for k, v in fields
+    )
+    return f"""<!doctype html><html><head><title>Scholar citation</title>{_HEAD_FILLER}</head>
+<body><div id="gs_top"><div id="gsc_vcpb"><div id="gsc_oci_title_wrapper">
+<div id="gsc_oci_title_gg"><div class="gsc_oci_title_ggi"><a href="https://synthetic.edu/pdf/{pubid}.pdf"><span class="gsc_vcd_title_ggt">[PDF]</span> synthetic.edu</a></div></div>
+<div id="gsc_oci_title"><a class="gsc_oci_title_link" href="https://synthetic.edu/papers/{pubid}" data-clk="hl=en">Synthetic article {pubid}</a></div></div>
+<div id="gsc_oci_table">{rows}
+<div class="gs_scl"><div class="gsc_oci_field">Description</div><div class="gsc_oci_value" id="gsc_oci_descr"><div class="gsh_small"><div class="gsh_csp">{abstract}</div></div></div></div>
+<div class="gs_scl"><div class="gsc_oci_field">Total citations</div><div class="gsc_oci_value"><div style="margin-bottom:1em"><a href="/scholar?oi=bibs&amp;hl=en&amp;cites=1">Cited by {rnd.randint(10, 3000)}</a></div>
+<div id="gsc_oci_graph"><div id="gsc_oci_graph_wrapper"><div id="gsc_oci_graph_bars" style="width:{len(years) * 20}px">{ticks}{bars}</div></div></div></div></div>
+</div></div></div></body></html>"""
+
+
+def render_search_authors(query: str, n_results: int = 10) -> str:
+    """A `view_op=search_authors` results page."""
+    rnd = _rng("search", query)
+    cards = "".join(
+        '<div class="gsc_1usr"><div class="gs_ai gs_scl gs_ai_chpr">'
+        f'<h3 class="gs_ai_name"><a href="/citations?hl=en&amp;user={rnd.getrandbits(40):010x}AAJ">'
+        f"{escape(query.replace('+', ' '))} {k}</a></h3>"
+        '<div class="gs_ai_aff">Synthetic University</div></div></div>'
+        for k in range(n_results)
+    )
+    return f"""<!doctype html><html><head><title>Search</title>{_HEAD_FILLER}</head>
+<body><div id="gsc_sa_ccl">{cards}</div></body></html>"""
+
+
+# Synthetic scholars served by stub_server.py: id -> number of publications.
+# Any other id is served with DEFAULT_PUBS publications.
+CORPUS = {
+    "FIXS0000AAAJ": 0,
+    "FIXS0010AAAJ": 10,
+    "FIXS0100AAAJ": 100,
+    "FIXS1200AAAJ": 1200,
+}
+DEFAULT_PUBS = 100
+
+# Fixture files: name -> (renderer, args)
+FIXTURES = {
+    "profile_20.html": (render_profile, ("FIXPROFAAAAJ", 150, 0, 20)),
+    "list_works_10.html": (render_profile, ("FIXS0010AAAJ", 10, 0, 100)),
+    "list_works_100.html": (render_profile, ("FIXPROFAAAAJ", 150, 0, 100)),
+    "view_citation.html": (render_view_citation, ("FIXPROFAAAAJ", "u5HHmVD_uO8C")),
+    "search_authors.html": (render_search_authors, ("Jane+Smith",)),
+}
+
+
+def write_fixtures(directory: str = FIXTURE_DIR) -> list[str]:
+    """Render every fixture into `directory`; returns the paths written."""
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for name, (render, args) in FIXTURES.items():
+        path = os.path.join(directory, name)
+        with open(path, "w", encoding="utf-8") as fh:
+            fh.write(render(*args))
+        paths.append(path)
+    return paths
+
+
+if __name__ == "__main__":
+    for path in write_fixtures():
+        print(f"{os.path.getsize(path):>9,d}  {os.path.relpath(path)}")
@@ -0,0 +1,192 @@
+"""
+stub_server.py — a local stand-in for scholar.google.com.
+
+Serves the synthetic pages from make_fixtures.py at the URLs scholar.py
+requests, so any function can be run end to end offline:
+
+    from stub_server import StubScholar
+    with StubScholar(latency=0.05, throttle_every=20) as stub:
+        scholar.set_scholar_mirror(stub.url)
+        scholar.get_publications("FIXS1200AAAJ")
+
+Scholar ids listed in make_fixtures.CORPUS have that many publications
+(0, 10, 100, 1200); any other id gets DEFAULT_PUBS.  Latency and HTTP 429
+responses can be injected to exercise the scheduler and retry policy.
+
+Usage:
+    python stub_server.py [--port 8000] [--latency 0.05] [--throttle-every 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import threading
+import time
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qsl, urlsplit
+
+from make_fixtures import (
+    CORPUS,
+    DEFAULT_PUBS,
+    render_profile,
+    render_search_authors,
+    render_view_citation,
+)
+
+
+@lru_cache(maxsize=4096)
+def render(path: str) -> Optional[str]:
+    """The page for a request path such as `/citations?user=...`, or None."""
+    parts = urlsplit(path)
+    if parts.path != "/citations":
+        return None
+    q = dict(parse_qsl(parts.query))
+    view_op = q.get("view_op", "")
+    if view_op == "view_citation":
+        sid, _, pubid = q.get("citation_for_view", "").partition(":")
+        return render_view_citation(sid, pubid) if pubid else None
+    if view_op == "search_authors":
+        return render_search_authors(q.get("mauthors", ""))
+    sid = q.get("user")
+    if not sid:
+        return None
+    return render_profile(
+        sid,
+        CORPUS.get(sid, DEFAULT_PUBS),
+        cstart=int(q.get("cstart", 0)),
+        pagesize=int(q.get("pagesize", 20)),
+        sortby="year" if q.get("sortby") == "pubdate" else "citation",
+    )
+
+
+class StubScholar:
+    """
+    Threaded HTTP/1.1 server on 127.0.0.1 serving the synthetic corpus.
+
+    Parameters
+    ----------
+    port : int — 0 picks a free port; see `.url`
+    latency : float — seconds added before every response
+    throttle_every : int — answer every Nth request with 429 (0 = never)
+    throttle_rate : float — or answer a random share of requests with 429
+    retry_after : int — Retry-After seconds sent with each 429 (None = omit)
+    seed : int — seeds the random throttling
+    """
+
+    def __init__(
+        self,
+        port: int = 0,
+        latency: float = 0.0,
+        throttle_every: int = 0,
+        throttle_rate: float = 0.0,
+        retry_after: Optional[int] = 0,
+        seed: int = 0,
+    ):
+        self.latency = latency
+        self.throttle_every = throttle_every
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.requests = 0
+        self.throttled = 0
+        self.bytes_sent = 0
+        self._lock = threading.Lock()
+        self._random = random.Random(seed)
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), self._handler())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> StubScholar:
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="stub-scholar", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def reset_counts(self) -> None:
+        with self._lock:
+            self.requests = self.throttled = self.bytes_sent = 0
+
+    def __enter__(self) -> StubScholar:
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def _throttle(self) -> bool:
+        with self._lock:
+            self.requests += 1
+            hit = (
+                self.throttle_every and self.requests % self.throttle_every == 0
+            ) or (self.throttle_rate and self._random.random() < self.throttle_rate)
+            self.throttled += bool(hit)
+            return bool(hit)
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                if stub.latency:
+                    time.sleep(stub.latency)
+                if stub._throttle():
+                    self.send_response(429)
+                    if stub.retry_after is not None:
+                        self.send_header("Retry-After", str(stub.retry_after))
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                page = render(self.path)
+                if page is None:
+                    self.send_error(404)
+                    return
+                body = page.encode("utf-8")
+                with stub._lock:
+                    stub.bytes_sent += len(body)
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--port", type=int, default=8000)
+    ap.add_argument("--latency", type=float, default=0.0)
+    ap.add_argument("--throttle-every", type=int, default=0)
+    ap.add_argument("--throttle-rate", type=float, default=0.0)
+    args = ap.parse_args()
+    stub = StubScholar(
+        port=args.port,
+        latency=args.latency,
+        throttle_every=args.throttle_every,
+        throttle_rate=args.throttle_rate,
+    )
+    print(f"Serving synthetic Scholar at {stub.url}  (Ctrl-C to stop)")
+    try:
+        stub._server.serve_forever()
+    except KeyboardInterrupt:
+        stub.stop()
+
+
+if __name__ == "__main__":
+    main()
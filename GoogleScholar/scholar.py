@@ -8,23 +8,52 @@ networks.
 Requirements:
     pip install requests beautifulsoup4 pandas numpy
 
-Optional (for co-author network plotting):
-    pip install networkx matplotlib
+Optional (for co-author network plotting and analytics):
+    pip install networkx matplotlib scipy
+
+Optional (for the async API, scholar.aio; add [http2] for set_transport(http2=True)):
+    pip install httpx            # or: pip install "httpx[http2]"
+
+Optional (brotli-compressed transfers):
+    pip install brotli
+
+Optional (compact Arrow-backed text columns; Parquet datasets):
+    pip install pyarrow
+
+Optional (faster HTML parsing; picked automatically when installed):
+    pip install selectolax        # or: pip install lxml cssselect
 
 Usage:
     from scholar import get_profile, get_publications, get_citation_history, ...
 
     profile = get_profile("B7vSqZsAAAAJ")
     pubs = get_publications("B7vSqZsAAAAJ")
+
+    # Optional: keep fetched pages on disk between runs
+    set_scholar_cache("~/.cache/scholar/responses.sqlite")
 """
 
 from __future__ import annotations
 
+import asyncio
+import contextvars
+import copy
+import inspect
+import json
+import os
+import random
 import re
+import sqlite3
+import threading
 import time
+import unicodedata
 import warnings
-from typing import Optional
-from functools import lru_cache
+import weakref
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from typing import Any, Callable, Iterable, Iterator, Optional
+from functools import lru_cache, wraps
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 import numpy as np
 import pandas as pd
@@ -36,7 +65,6 @@ from bs4 import BeautifulSoup
 # ---------------------------------------------------------------------------
 
 _SCHOLAR_SITE = "https://scholar.google.com"
-_SESSION: Optional[requests.Session] = None
 
 
 def set_scholar_mirror(mirror: str) -> None:
@@ -45,893 +73,5401 @@ def set_scholar_mirror(mirror: str) -> None:
     _SCHOLAR_SITE = mirror.rstrip("/")
 
 
-def _get_session() -> requests.Session:
-    """Return a shared requests session (cookie persistence)."""
-    global _SESSION
-    if _SESSION is None:
-        _SESSION = requests.Session()
-        _SESSION.headers.update(
-            {
-                "User-Agent": (
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/124.0.0.0 Safari/537.36"
-                ),
-                "Accept-Language": "en-US,en;q=0.9",
-            }
-        )
-    return _SESSION
-
-
 # ---------------------------------------------------------------------------
-# Low-level helpers  (mirrors R: utils.R)
+# Transport
 # ---------------------------------------------------------------------------
+# Each thread gets its own session (requests.Session is not thread-safe)
+# with a tuned connection pool, so fetch workers keep their sockets alive
+# between requests instead of reconnecting.  All sessions share one cookie
+# jar.  With http2=True the sessions are httpx clients instead.
+
+_TRANSPORT = {
+    "http2": False,
+    "pool_connections": 10,
+    "pool_maxsize": None,  # None: the per-host limit (see set_fetch_limits)
+    "connect_retries": 2,
+    "generation": 0,
+}
+_TRANSPORT_LOCK = threading.Lock()
+_THREAD_SESSION = threading.local()
+_SESSIONS: list = []
+_COOKIES = requests.cookies.RequestsCookieJar()
+
+
+def _default_headers() -> dict:
+    try:
+        import brotli  # noqa: F401  (lets urllib3/httpx decode br)
+
+        encodings = "gzip, deflate, br"
+    except ImportError:
+        encodings = "gzip, deflate"
+    return {
+        "User-Agent": (
+            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+            "AppleWebKit/537.36 (KHTML, like Gecko) "
+            "Chrome/124.0.0.0 Safari/537.36"
+        ),
+        "Accept-Language": "en-US,en;q=0.9",
+        "Accept-Encoding": encodings,
+    }
 
 
-def tidy_id(scholar_id: str) -> str:
-    """Ensure a single, clean scholar ID."""
-    if isinstance(scholar_id, (list, tuple)):
-        if len(scholar_id) != 1:
-            warnings.warn(
-                f"Only one ID at a time; using first: {scholar_id[0]}"
-            )
-        scholar_id = scholar_id[0]
-    # Strip common trailing fragments
-    return scholar_id.split("&")[0].strip()
+def set_transport(
+    http2: bool = False,
+    pool_connections: int = 10,
+    pool_maxsize: Optional[int] = None,
+    connect_retries: int = 2,
+) -> None:
+    """
+    Configure the HTTP transport used by every fetch.
 
+    Call before starting work: existing sessions are closed and each thread
+    opens a new one on its next request.
 
-def get_scholar_resp(
-    url: str, attempts_left: int = 5, delay: float = 1.0
-) -> requests.Response:
-    """GET a Google Scholar page with retries and rate-limit detection."""
-    assert attempts_left > 0, "No attempts remaining"
+    Parameters
+    ----------
+    http2 : bool — use httpx clients with HTTP/2 (pip install "httpx[http2]")
+    pool_connections : int — number of hosts whose pools are kept per session
+    pool_maxsize : int — kept-alive connections per host (default: per-host limit)
+    connect_retries : int — transparent retries of failed connects; HTTP
+        errors such as 429 are still handled by get_scholar_resp
+    """
+    if http2:
+        try:
+            import h2  # noqa: F401
+            import httpx  # noqa: F401
+        except ImportError as exc:
+            raise ImportError(
+                'HTTP/2 needs httpx with h2: pip install "httpx[http2]"'
+            ) from exc
+    with _TRANSPORT_LOCK:
+        _TRANSPORT.update(
+            http2=http2,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            connect_retries=connect_retries,
+            generation=_TRANSPORT["generation"] + 1,
+        )
+        sessions, _SESSIONS[:] = list(_SESSIONS), []
+    for session in sessions:
+        session.close()
+
+
+def _get_session():
+    """Return the calling thread's session (requests.Session or httpx.Client)."""
+    local = _THREAD_SESSION
+    if getattr(local, "generation", None) != _TRANSPORT["generation"]:
+        with _TRANSPORT_LOCK:
+            session = _new_session()
+            _SESSIONS.append(session)
+            generation = _TRANSPORT["generation"]
+        # The thread-local is dropped when its thread exits, and with it
+        # this handle, whose finalizer releases the session.  Assigned
+        # outside the lock: replacing a handle may release the old session.
+        handle = _SessionHandle()
+        weakref.finalize(handle, _release_session, session)
+        local.session, local.generation, local.handle = session, generation, handle
+    return local.session
+
+
+class _SessionHandle:
+    """Per-thread token tying a session's lifetime to its thread."""
+
+
+def _release_session(session) -> None:
+    """Close a session whose thread has gone (unless set_transport did)."""
+    with _TRANSPORT_LOCK:
+        if not any(s is session for s in _SESSIONS):
+            return
+        _SESSIONS[:] = [s for s in _SESSIONS if s is not session]
+    session.close()
+
+
+def _new_session():
+    maxsize = _TRANSPORT["pool_maxsize"] or _PER_HOST
+    if _TRANSPORT["http2"]:
+        import httpx
+
+        return httpx.Client(
+            headers=_default_headers(),
+            cookies=_COOKIES,
+            timeout=30,
+            follow_redirects=True,
+            transport=httpx.HTTPTransport(
+                http2=True,
+                retries=_TRANSPORT["connect_retries"],
+                limits=httpx.Limits(max_keepalive_connections=maxsize),
+            ),
+        )
 
-    session = _get_session()
-    resp = session.get(url, timeout=30)
+    from urllib3.util.retry import Retry
 
-    if resp.status_code == 200:
-        return resp
-    if resp.status_code == 429:
-        raise RuntimeError(
-            "HTTP 429 — Google is rate-limiting you. "
-            "Wait a few minutes before retrying."
+    retry = Retry(
+        total=_TRANSPORT["connect_retries"],
+        connect=_TRANSPORT["connect_retries"],
+        read=0,
+        status=0,  # status codes are retried by _fetch_scholar_resp
+        redirect=10,
+        backoff_factor=0.5,
+        raise_on_status=False,
+    )
+    adapter = _StatsAdapter(
+        pool_connections=_TRANSPORT["pool_connections"],
+        pool_maxsize=maxsize,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.headers.update(_default_headers())
+    session.cookies = _COOKIES
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _send(url: str):
+    """One GET over the calling thread's session, recording transport stats."""
+    session = _get_session()
+    if isinstance(session, requests.Session):
+        resp = session.get(url, timeout=30)
+        body = resp.content  # read fully so the connection goes back to the pool
+        _CONN_STATS.add(
+            requests=1, bytes_wire=resp.raw.tell(), bytes_body=len(body)
         )
-    if attempts_left == 1:
-        raise ConnectionError(
-            f"Cannot connect to Google Scholar (HTTP {resp.status_code}). "
-            "Is the ID correct?"
+    else:
+        resp = session.get(url, extensions={"trace": _httpx_trace()})
+        _CONN_STATS.add(
+            requests=1,
+            bytes_wire=resp.num_bytes_downloaded,
+            bytes_body=len(resp.content),
         )
-    time.sleep(delay)
-    return get_scholar_resp(url, attempts_left - 1, delay)
+    return resp
 
 
-def _parse_html(url: str) -> BeautifulSoup:
-    """Fetch URL and return a BeautifulSoup tree."""
-    resp = get_scholar_resp(url)
-    return BeautifulSoup(resp.text, "html.parser")
+class _ConnectionStats:
+    """Thread-safe counters behind get_connection_stats()."""
 
+    _FIELDS = (
+        "requests", "connections", "bytes_wire", "bytes_body",
+        "connect_seconds", "tls_handshakes", "tls_seconds",
+    )
 
-def _grab_id(url: str) -> Optional[str]:
-    """Extract the scholar ID from a URL."""
-    m = re.search(r"user=([A-Za-z0-9_-]+)", url or "")
-    return m.group(1) if m else None
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts = dict.fromkeys(self._FIELDS, 0)
+
+    def add(self, **counts) -> None:
+        with self._lock:
+            for key, value in counts.items():
+                self._counts[key] += value
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            out = dict(self._counts)
+        n, conns = out["requests"], out["connections"]
+        out["reuse_rate"] = max(0.0, 1 - conns / n) if n else 0.0
+        out["compression_ratio"] = (
+            out["bytes_body"] / out["bytes_wire"] if out["bytes_wire"] else 1.0
+        )
+        return out
 
 
-# ---------------------------------------------------------------------------
-# Profile  (mirrors R: get_profile, get_scholar_id)
-# ---------------------------------------------------------------------------
+_CONN_STATS = _ConnectionStats()
 
 
-def get_profile(scholar_id: str) -> dict:
+def get_connection_stats(reset: bool = False) -> dict:
     """
-    Get profile information for a Google Scholar researcher.
+    Transport counters since start-up (or the last reset).
 
-    Returns a dict with: id, name, affiliation, total_cites, h_index,
-    i10_index, fields, homepage, coauthors, available, not_available.
+    Keys: requests, connections (new sockets opened), reuse_rate (share of
+    requests served over an existing connection), bytes_wire (compressed
+    bytes received), bytes_body, compression_ratio, connect_seconds and
+    tls_seconds (time in TCP connects and TLS handshakes), tls_handshakes.
+    Cached responses are not counted.
     """
-    scholar_id = tidy_id(scholar_id)
-    url = f"{_SCHOLAR_SITE}/citations?hl=en&user={scholar_id}"
-    page = _parse_html(url)
+    stats = _CONN_STATS.snapshot()
+    if reset:
+        _CONN_STATS.reset()
+    return stats
+
+
+def _timed_connection(base, tls: bool):
+    """Subclass a urllib3 connection class to time TCP connect and TLS."""
+
+    class Timed(base):
+        def _new_conn(self):
+            t0 = time.perf_counter()
+            sock = super()._new_conn()
+            self._tcp_seconds = time.perf_counter() - t0
+            return sock
+
+        def connect(self):
+            self._tcp_seconds = 0.0
+            t0 = time.perf_counter()
+            super().connect()
+            total = time.perf_counter() - t0
+            _CONN_STATS.add(
+                connections=1,
+                connect_seconds=self._tcp_seconds,
+                tls_handshakes=int(tls),
+                tls_seconds=total - self._tcp_seconds if tls else 0.0,
+            )
 
-    # Name
-    name_el = page.select_one("#gsc_prf_in")
-    name = name_el.text.strip() if name_el else ""
+    Timed.__name__ = f"Timed{base.__name__}"
+    return Timed
+
+
+class _StatsAdapter(requests.adapters.HTTPAdapter):
+    """HTTPAdapter whose pools open timed connections."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+        super().init_poolmanager(*args, **kwargs)
+        pools = {}
+        for scheme, pool in (
+            ("http", HTTPConnectionPool),
+            ("https", HTTPSConnectionPool),
+        ):
+            pools[scheme] = type(
+                f"Timed{pool.__name__}",
+                (pool,),
+                {
+                    "ConnectionCls": _timed_connection(
+                        pool.ConnectionCls, tls=scheme == "https"
+                    )
+                },
+            )
+        self.poolmanager.pool_classes_by_scheme = pools
+
+
+def _httpx_trace(is_async: bool = False):
+    """An httpx `trace` extension feeding connection events into the stats."""
+    started: dict[str, float] = {}
+
+    def record(event: str, info: dict) -> None:
+        step, _, phase = event.rpartition(".")
+        if step not in ("connection.connect_tcp", "connection.start_tls"):
+            return
+        if phase == "started":
+            started[step] = time.perf_counter()
+        elif phase == "complete" and step in started:
+            elapsed = time.perf_counter() - started.pop(step)
+            if step == "connection.connect_tcp":
+                _CONN_STATS.add(connections=1, connect_seconds=elapsed)
+            else:
+                _CONN_STATS.add(tls_handshakes=1, tls_seconds=elapsed)
 
-    # Affiliation
-    bio_divs = page.select("div.gsc_prf_il")
-    affiliation = bio_divs[0].text.strip() if bio_divs else ""
+    if not is_async:
+        return record
 
-    # Research interests
-    fields = [a.text.strip() for a in page.select("a.gsc_prf_inta")]
+    async def arecord(event: str, info: dict) -> None:
+        record(event, info)
 
-    # Homepage
-    hp_el = page.select_one("#gsc_prf_ivh a")
-    homepage = hp_el["href"] if hp_el else ""
+    return arecord
 
-    # Citation table
-    stats = page.select("#gsc_rsb_st tr")
-    total_cites = h_index = i10_index = 0
-    for row in stats:
-        cells = row.select("td")
-        if len(cells) >= 2:
-            label = cells[0].text.strip().lower()
-            val = cells[1].text.strip()
-            if "citations" in label:
-                total_cites = int(val) if val.isdigit() else 0
-            elif "h-index" in label:
-                h_index = int(val) if val.isdigit() else 0
-            elif "i10-index" in label:
-                i10_index = int(val) if val.isdigit() else 0
 
-    # Coauthors (listed on profile, up to 20)
-    coauthors = []
-    for a_tag in page.select("a[tabindex='-1']"):
-        href = a_tag.get("href", "")
-        coauthor_name = a_tag.text.strip()
-        if coauthor_name and "Sort by" not in coauthor_name:
-            coauthors.append(
-                {"name": coauthor_name, "url": href, "id": _grab_id(href)}
-            )
+# ---------------------------------------------------------------------------
+# Response cache
+# ---------------------------------------------------------------------------
+# Scholar pages change slowly, so successful responses can be kept in a
+# local SQLite file keyed by the normalized URL.  Each kind of page gets its
+# own TTL and the file is kept under a byte budget by evicting the least
+# recently used entries.
+
+_CACHE: Optional["_ResponseCache"] = None
+
+_DEFAULT_CACHE_TTL = {
+    "profile": 24 * 3600.0,
+    "list_works": 24 * 3600.0,
+    "view_citation": 30 * 24 * 3600.0,
+    "search_authors": 7 * 24 * 3600.0,
+}
+
+
+def _normalize_url(url: str) -> str:
+    """Canonical form of a URL: lowercase host, sorted query, no fragment."""
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit(
+        (parts.scheme.lower(), parts.netloc.lower(), parts.path, query, "")
+    )
 
-    # Availability metrics
-    available = not_available = None
-    avail_el = page.select_one("div.gsc_rsb_m_a")
-    if avail_el:
-        m = re.match(r"(\d+)", avail_el.text)
-        available = int(m.group(1)) if m else None
-    navail_el = page.select_one("div.gsc_rsb_m_na")
-    if navail_el:
-        m = re.match(r"(\d+)", navail_el.text)
-        not_available = int(m.group(1)) if m else None
 
-    return {
-        "id": scholar_id,
-        "name": name,
-        "affiliation": affiliation,
-        "total_cites": total_cites,
-        "h_index": h_index,
-        "i10_index": i10_index,
-        "fields": fields,
-        "homepage": homepage,
-        "coauthors": coauthors,
-        "available": available,
-        "not_available": not_available,
-    }
+def _url_kind(url: str) -> str:
+    """Classify a Scholar URL as profile, list_works, view_citation or search_authors."""
+    query = dict(parse_qsl(urlsplit(url).query))
+    view_op = query.get("view_op", "")
+    if view_op in ("view_citation", "search_authors", "list_works"):
+        return view_op
+    if "cstart" in query or "pagesize" in query:
+        return "list_works"
+    return "profile"
+
+
+class _ResponseCache:
+    """SQLite-backed store of successful responses with TTL and LRU eviction."""
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int,
+        ttl: dict[str, float],
+        offline: bool,
+    ):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.offline = offline
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY, kind TEXT, fetched REAL,"
+                " accessed REAL, size INTEGER, encoding TEXT, body BLOB)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed"
+                " ON responses (accessed)"
+            )
+            self._conn.commit()
+
+    def get(self, url: str) -> Optional[requests.Response]:
+        """Return a cached response, or None if missing or expired.
+
+        Expired entries are still served in offline mode.
+        """
+        key = _normalize_url(url)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT kind, fetched, encoding, body FROM responses"
+                " WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            kind, fetched, encoding, body = row
+            ttl = self.ttl.get(kind, 0.0)
+            if now - fetched > ttl and not self.offline:
+                return None
+            self._conn.execute(
+                "UPDATE responses SET accessed = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
 
+        resp = requests.Response()
+        resp.status_code = 200
+        resp._content = body
+        resp.encoding = encoding
+        resp.url = url
+        return resp
 
-def get_scholar_id(
-    last_name: str = "",
-    first_name: str = "",
-    affiliation: Optional[str] = None,
-) -> Optional[str]:
+    def put(self, url: str, resp: requests.Response) -> None:
+        """Store a response body and evict LRU entries beyond max_bytes."""
+        body = resp.content
+        if len(body) > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses"
+                " (key, kind, fetched, accessed, size, encoding, body)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    _normalize_url(url),
+                    _url_kind(url),
+                    now,
+                    now,
+                    len(body),
+                    resp.encoding,
+                    body,
+                ),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        total = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        stale = []
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed"
+        ):
+            stale.append((key,))
+            total -= size
+            if total <= self.max_bytes:
+                break
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def set_scholar_cache(
+    path: Optional[str] = "~/.cache/scholar/responses.sqlite",
+    max_bytes: int = 512 * 1024 * 1024,
+    ttl: Optional[dict[str, float]] = None,
+    offline: bool = False,
+) -> None:
     """
-    Search for a Google Scholar ID by name (and optional affiliation).
+    Enable (or disable, with path=None) the persistent response cache.
 
-    Returns the scholar ID string, or None if not found.
+    Parameters
+    ----------
+    path : str or None — SQLite file; None turns caching off
+    max_bytes : int — size budget; least recently used pages are evicted
+    ttl : dict — seconds per page kind, overriding the defaults for
+        "profile", "list_works", "view_citation" and "search_authors"
+    offline : bool — never touch the network; serve cached pages only
+        (expired ones included) and raise ConnectionError on a miss
     """
-    if not (first_name or last_name):
-        raise ValueError("At least one of first_name / last_name is required.")
-
-    query = f"{first_name}+{last_name}".strip("+")
-    url = (
-        f"{_SCHOLAR_SITE}/citations?view_op=search_authors"
-        f"&mauthors={query}&hl=en&oi=ao"
+    global _CACHE
+    if _CACHE is not None:
+        _CACHE.close()
+        _CACHE = None
+    if path is None:
+        return
+
+    path = os.path.expanduser(path)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    _CACHE = _ResponseCache(
+        path,
+        max_bytes=max_bytes,
+        ttl={**_DEFAULT_CACHE_TTL, **(ttl or {})},
+        offline=offline,
     )
-    resp = get_scholar_resp(url)
-    ids = list(set(re.findall(r"user=([A-Za-z0-9_-]+)", resp.text)))
 
-    if not ids:
-        warnings.warn("No Scholar ID found.")
-        return None
 
-    if len(ids) == 1:
-        return ids[0]
+def clear_scholar_cache() -> None:
+    """Remove every entry from the response cache, if one is enabled."""
+    if _CACHE is not None:
+        _CACHE.clear()
 
-    # Multiple matches — use affiliation to disambiguate
-    if affiliation is None:
-        warnings.warn(
-            f"Found {len(ids)} candidates; returning first: {ids[0]}"
-        )
-        return ids[0]
 
-    for sid in ids:
-        try:
-            prof = get_profile(sid)
-            if affiliation.lower() in prof["affiliation"].lower():
-                return sid
-        except Exception:
-            continue
+# ---------------------------------------------------------------------------
+# Fetch scheduler
+# ---------------------------------------------------------------------------
+# Multi-ID functions fan out over a bounded thread pool.  Every network
+# request, from any thread, first takes a token from one global bucket and a
+# slot from its host's semaphore, so adding workers never raises the request
+# rate above the configured limit.
+
+_MAX_WORKERS = 4
+_PER_HOST = 4
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_EXECUTOR_LOCK = threading.Lock()
+_HOST_SLOTS: dict[str, threading.BoundedSemaphore] = {}
+_HOST_SLOTS_LOCK = threading.Lock()
+_WORKER = threading.local()
+
+
+class _TokenBucket:
+    """Thread-safe token bucket: `rate` requests/second, bursts up to `burst`."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._stamp = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token and return how long to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._stamp) * self.rate
+            )
+            self._stamp = now
+            self._tokens -= 1.0
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
 
-    warnings.warn("No researcher found at the indicated affiliation.")
-    return None
+    def acquire(self) -> None:
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
 
 
-# ---------------------------------------------------------------------------
-# Publications  (mirrors R: publications.r)
-# ---------------------------------------------------------------------------
+_RATE_LIMITER = _TokenBucket(rate=3.0, burst=6)
 
 
-def get_publications(
-    scholar_id: str,
-    cstart: int = 0,
-    cstop: int = float("inf"),
-    pagesize: int = 100,
-    sortby: str = "citation",
-) -> pd.DataFrame:
+def set_fetch_limits(
+    max_workers: Optional[int] = None,
+    rate: Optional[float] = None,
+    burst: Optional[int] = None,
+    per_host: Optional[int] = None,
+) -> None:
     """
-    Get all publications for a scholar.
+    Configure the shared fetch scheduler.  Unspecified values are unchanged.
 
-    Returns a DataFrame with columns: title, author, journal, number,
-    cites, year, cid, pubid.
+    Parameters
+    ----------
+    max_workers : int — threads used by multi-ID functions (1 = serial)
+    rate : float — sustained requests per second across all threads
+    burst : int — requests allowed back-to-back before `rate` applies
+    per_host : int — concurrent in-flight requests per host
     """
-    scholar_id = tidy_id(scholar_id)
-    if pagesize > 100:
-        warnings.warn("pagesize exceeds 100; capping at 100.")
-        pagesize = 100
+    global _MAX_WORKERS, _PER_HOST, _EXECUTOR, _RATE_LIMITER
+    if rate is not None or burst is not None:
+        _RATE_LIMITER = _TokenBucket(
+            rate=rate if rate is not None else _RATE_LIMITER.rate,
+            burst=burst if burst is not None else _RATE_LIMITER.burst,
+        )
+    if per_host is not None:
+        _PER_HOST = per_host
+        with _HOST_SLOTS_LOCK:
+            _HOST_SLOTS.clear()
+    if max_workers is not None:
+        _MAX_WORKERS = max_workers
+        with _EXECUTOR_LOCK:
+            if _EXECUTOR is not None:
+                _EXECUTOR.shutdown(wait=False)
+                _EXECUTOR = None
+
+
+@contextmanager
+def _host_slot(url: str) -> Iterator[None]:
+    """Hold one of the per-host concurrency slots for `url`."""
+    host = urlsplit(url).netloc.lower()
+    with _HOST_SLOTS_LOCK:
+        slot = _HOST_SLOTS.get(host)
+        if slot is None:
+            slot = _HOST_SLOTS[host] = threading.BoundedSemaphore(_PER_HOST)
+    with slot:
+        yield
+
+
+def _backoff_delay(attempt: int, base: float, cap: float = 60.0) -> float:
+    """
+    Backoff before retry number `attempt` (0-based): base * 2**attempt,
+    jittered by ±50% so workers that failed together spread out, at most cap.
+    """
+    return min(cap, random.uniform(0.5, 1.5) * base * 2**attempt)
 
-    assert sortby in ("citation", "year"), "sortby must be 'citation' or 'year'"
 
-    sort_param = "&sortby=pubdate" if sortby == "year" else ""
-    url = (
-        f"{_SCHOLAR_SITE}/citations?hl=en&user={scholar_id}"
-        f"&cstart={cstart}&pagesize={pagesize}{sort_param}"
-    )
-    page = _parse_html(url)
-    rows = page.select("tr.gsc_a_tr")
+def _get_executor() -> ThreadPoolExecutor:
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ThreadPoolExecutor(
+                max_workers=_MAX_WORKERS, thread_name_prefix="scholar"
+            )
+        return _EXECUTOR
 
-    records = []
-    for row in rows:
-        # Title & pubid
-        title_el = row.select_one(".gsc_a_at")
-        title = title_el.text.strip() if title_el else ""
-        pubid = ""
-        if title_el and title_el.get("href"):
-            m = re.search(r":(.+)$", title_el["href"])
-            pubid = m.group(1) if m else ""
 
-        # Citation count & cid
-        cite_el = row.select_one(".gsc_a_ac")
-        cites = 0
-        cid = ""
-        if cite_el:
-            cites_text = cite_el.text.strip()
-            cites = int(cites_text) if cites_text.isdigit() else 0
-            href = cite_el.get("href", "")
-            m = re.search(r"cites=(\d+)", href)
-            cid = m.group(1) if m else ""
+def _map_concurrent(
+    fn: Callable, items: Iterable, return_exceptions: bool = False
+) -> list:
+    """
+    Apply `fn` to each item on the shared pool; results keep input order.
 
-        # Year
-        year_el = row.select_one(".gsc_a_y span")
-        year_text = year_el.text.strip() if year_el else ""
-        year = int(year_text) if year_text.isdigit() else None
+    With return_exceptions=True a failed item yields its exception instead
+    of aborting the batch.  Calls made from inside a worker run serially so
+    nested fan-out cannot deadlock the bounded pool.
+    """
+    items = list(items)
 
-        # Author & journal/details (two grey lines)
-        grey = row.select("td .gs_gray")
-        author = grey[0].text.strip() if len(grey) > 0 else ""
-        details = grey[1].text.strip() if len(grey) > 1 else ""
+    def _run(item):
+        try:
+            return fn(item)
+        except Exception as exc:
+            if return_exceptions:
+                return exc
+            raise
 
-        # Parse journal vs number from details
-        first_digit = re.search(r"[\[\(]?\d", details)
-        if first_digit:
-            pos = first_digit.start()
-            journal = details[:pos].strip().rstrip(",")
-            number = (
-                details[pos:].strip().rstrip(",").rstrip()
-            )
-            # Remove trailing year portion like ", 2019"
-            number = re.sub(r",?\s*\d{4}\s*$", "", number).strip().rstrip(",")
-        else:
-            journal = details.rstrip(",").strip()
-            number = ""
+    if _MAX_WORKERS <= 1 or len(items) <= 1 or getattr(_WORKER, "active", False):
+        return [_run(item) for item in items]
 
-        records.append(
-            {
-                "title": title,
-                "author": author,
-                "journal": journal,
-                "number": number,
-                "cites": cites,
-                "year": year,
-                "cid": cid,
-                "pubid": pubid,
-            }
-        )
+    futures = _submit_all(_run, items)
+    try:
+        return [f.result() for f in futures]
+    except BaseException:
+        for f in futures:
+            f.cancel()
+        raise
 
-    df = pd.DataFrame(records)
 
-    # Paginate if needed
-    if len(df) == pagesize and cstart + pagesize < cstop:
-        more = get_publications(
-            scholar_id,
-            cstart=cstart + pagesize,
-            cstop=cstop,
-            pagesize=pagesize,
-            sortby=sortby,
-        )
-        df = pd.concat([df, more], ignore_index=True)
+def _iter_concurrent(fn: Callable, items: Iterable) -> Iterator[tuple]:
+    """
+    Like _map_concurrent(..., return_exceptions=True), but yield
+    (item, result) pairs as they finish instead of in input order.
+    """
+    items = list(items)
 
-    return df
+    def _run(item):
+        try:
+            return fn(item)
+        except Exception as exc:
+            return exc
+
+    if _MAX_WORKERS <= 1 or len(items) <= 1 or getattr(_WORKER, "active", False):
+        for item in items:
+            yield item, _run(item)
+        return
+
+    futures = _submit_all(_run, items)
+    pending = dict(zip(futures, items))
+    try:
+        for f in as_completed(futures):
+            yield pending.pop(f), f.result()
+    finally:
+        # The consumer stopped early: drop work that has not started
+        for f in pending:
+            f.cancel()
+
+
+def _submit_all(run: Callable, items: list) -> list:
+    """Submit run(item) for every item to the shared pool, as a worker."""
+
+    def _in_worker(item):
+        _WORKER.active = True
+        try:
+            return run(item)
+        finally:
+            _WORKER.active = False
+
+    executor = _get_executor()
+    return [
+        executor.submit(contextvars.copy_context().run, _in_worker, item)
+        for item in items
+    ]
 
 
-def get_article_cite_history(
-    scholar_id: str, article_pubid: str
-) -> pd.DataFrame:
+# ---------------------------------------------------------------------------
+# Retry policy and circuit breaker
+# ---------------------------------------------------------------------------
+# How a failed request is retried is decided by a RetryPolicy: which status
+# codes are retried, how long to back off (or what Retry-After says), and a
+# total deadline across attempts.  Repeated 429s trip a circuit breaker
+# shared by every thread and coroutine, which holds all requests for a
+# cooldown instead of letting each worker discover the block on its own.
+
+
+class RetryPolicy:
     """
-    Get yearly citation history for a single article.
+    Retry rules for get_scholar_resp().
 
-    Returns DataFrame with columns: year, cites, pubid.
+    Parameters
+    ----------
+    attempts : int — maximum requests per URL, including the first
+    base : float — first backoff delay in seconds; doubles per retry,
+        jittered by ±50%
+    cap : float — longest single backoff delay
+    deadline : float — give up once this many seconds have passed (None: no limit)
+    respect_retry_after : bool — wait as long as a Retry-After header asks
+        (still bounded by `deadline`)
+    status_rules : dict — per-status action, "retry" or "fail"; merged over
+        the defaults (429 and 5xx retried, anything else fails at once)
+    breaker_threshold : int — consecutive 429s, from any caller, that open
+        the circuit breaker
+    breaker_cooldown : float — seconds all requests are held once it opens
     """
-    scholar_id = tidy_id(scholar_id)
-    url = (
-        f"{_SCHOLAR_SITE}/citations?view_op=view_citation&hl=en"
-        f"&citation_for_view={scholar_id}:{article_pubid}"
-    )
-    page = _parse_html(url)
 
-    years, vals = [], []
-    for a_tag in page.select(".gsc_oci_g_a"):
-        href = a_tag.get("href", "")
-        m = re.search(r"as_ylo=(\d{4})", href)
-        if m:
-            years.append(int(m.group(1)))
-    for span in page.select(".gsc_oci_g_al"):
-        vals.append(int(span.text.strip()))
-
-    if not years:
-        return pd.DataFrame(columns=["year", "cites", "pubid"])
+    DEFAULT_RULES = dict.fromkeys((429, 500, 502, 503, 504), "retry")
+
+    def __init__(
+        self,
+        attempts: int = 5,
+        base: float = 1.0,
+        cap: float = 60.0,
+        deadline: Optional[float] = 300.0,
+        respect_retry_after: bool = True,
+        status_rules: Optional[dict[int, str]] = None,
+        breaker_threshold: int = 3,
+        breaker_cooldown: float = 60.0,
+    ):
+        if attempts < 1:
+            raise ValueError("attempts must be at least 1.")
+        rules = {**self.DEFAULT_RULES, **(status_rules or {})}
+        bad = {a for a in rules.values() if a not in ("retry", "fail")}
+        if bad:
+            raise ValueError(f"Unknown status rule(s): {sorted(bad)}")
+        self.attempts = attempts
+        self.base = base
+        self.cap = cap
+        self.deadline = deadline
+        self.respect_retry_after = respect_retry_after
+        self.status_rules = rules
+        self.breaker_threshold = breaker_threshold
+        self.breaker_cooldown = breaker_cooldown
+
+    def __repr__(self) -> str:
+        return (
+            f"RetryPolicy(attempts={self.attempts}, base={self.base}, "
+            f"cap={self.cap}, deadline={self.deadline})"
+        )
 
-    # Fill gaps
-    full_years = list(range(min(years), max(years) + 1))
-    cite_map = dict(zip(years, vals))
-    df = pd.DataFrame(
-        {
-            "year": full_years,
-            "cites": [cite_map.get(y, 0) for y in full_years],
-            "pubid": article_pubid,
-        }
-    )
-    return df
+    def replace(self, **changes) -> "RetryPolicy":
+        """A copy of this policy with some settings changed."""
+        new = copy.copy(self)
+        for key, value in changes.items():
+            if not hasattr(new, key):
+                raise TypeError(f"RetryPolicy has no setting {key!r}")
+            setattr(new, key, value)
+        if new.attempts < 1:
+            raise ValueError("attempts must be at least 1.")
+        return new
+
+    def should_retry(self, status: int) -> bool:
+        return self.status_rules.get(status, "fail") == "retry"
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Seconds to wait after failed attempt number `attempt` (0-based)."""
+        if retry_after is not None and self.respect_retry_after:
+            return retry_after
+        return _backoff_delay(attempt, self.base, self.cap)
+
+
+def _retry_after_seconds(resp) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP date), if any."""
+    value = resp.headers.get("Retry-After")
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        from email.utils import parsedate_to_datetime
+
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+class _CircuitBreaker:
+    """Holds every request for a cooldown after repeated 429 responses."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._strikes = 0
+        self._open_until = 0.0
+
+    def wait_time(self) -> float:
+        with self._lock:
+            return max(0.0, self._open_until - time.monotonic())
+
+    def record(
+        self, status: int, policy: RetryPolicy, retry_after: Optional[float]
+    ) -> None:
+        with self._lock:
+            if status != 429:
+                if status == 200:
+                    self._strikes = 0
+                return
+            self._strikes += 1
+            if self._strikes < policy.breaker_threshold:
+                return
+            cooldown = max(policy.breaker_cooldown, retry_after or 0.0)
+            now = time.monotonic()
+            tripped = self._open_until <= now
+            self._open_until = max(self._open_until, now + cooldown)
+        if tripped:
+            warnings.warn(
+                f"Google Scholar is rate-limiting; pausing all requests "
+                f"for {cooldown:.0f}s."
+            )
 
+    def reset(self) -> None:
+        with self._lock:
+            self._strikes = 0
+            self._open_until = 0.0
 
-def get_num_articles(scholar_id: str) -> int:
-    """Return the number of publications for a scholar."""
-    return len(get_publications(scholar_id))
 
+_RETRY_POLICY = RetryPolicy()
+_BREAKER = _CircuitBreaker()
 
-def get_oldest_article(scholar_id: str) -> Optional[int]:
-    """Return the year of the oldest publication."""
-    pubs = get_publications(scholar_id)
-    years = pubs["year"].dropna()
-    return int(years.min()) if len(years) > 0 else None
 
+def set_retry_policy(policy: Optional[RetryPolicy] = None, **kwargs) -> RetryPolicy:
+    """
+    Set the retry policy used by every fetch and return it.
 
-def get_num_distinct_journals(scholar_id: str) -> int:
-    """Return the number of distinct journals a scholar has published in."""
-    pubs = get_publications(scholar_id)
-    return pubs["journal"].nunique()
+    Pass a RetryPolicy, or keyword arguments for one (see RetryPolicy).
+    Also closes the circuit breaker if it is open.
+    """
+    global _RETRY_POLICY
+    if policy is not None and kwargs:
+        raise ValueError(
+            "Pass either a RetryPolicy or keyword arguments, not both."
+        )
+    _RETRY_POLICY = policy if policy is not None else RetryPolicy(**kwargs)
+    _BREAKER.reset()
+    return _RETRY_POLICY
 
 
-def get_num_top_journals(
-    scholar_id: str,
-    journals: Optional[list[str]] = None,
-) -> int:
+class _RetryRun:
     """
-    Return number of publications in top journals.
+    Retry bookkeeping for one URL, shared by the sync and async fetch loops.
 
-    Default journal list follows Acuna et al. (Nature, Science,
-    Nature Neuroscience, PNAS, Neuron).
+    The loop asks wait() how long to sleep before each attempt (circuit
+    breaker), then passes each outcome to record(), which returns None when
+    the response is final, a number of seconds to back off before the next
+    attempt, or raises once the policy gives up.
     """
-    if journals is None:
-        journals = [
-            "Nature",
-            "Science",
-            "Nature Neuroscience",
-            "Proceedings of the National Academy of Sciences",
-            "Neuron",
-        ]
-    pubs = get_publications(scholar_id)
-    return int(pubs["journal"].isin(journals).sum())
+
+    def __init__(self, url: str, policy: RetryPolicy):
+        self.url = url
+        self.policy = policy
+        self.attempt = 0
+        self._start = time.monotonic()
+
+    def _remaining(self) -> float:
+        if self.policy.deadline is None:
+            return float("inf")
+        return self.policy.deadline - (time.monotonic() - self._start)
+
+    def wait(self) -> float:
+        pause = _BREAKER.wait_time()
+        if pause > self._remaining():
+            raise RuntimeError(
+                "HTTP 429 — Google is rate-limiting you. "
+                "Wait a few minutes before retrying."
+            )
+        return pause
+
+    def record(
+        self, resp=None, error: Optional[Exception] = None
+    ) -> Optional[float]:
+        retry_after = None
+        if resp is not None:
+            retry_after = _retry_after_seconds(resp)
+            _BREAKER.record(resp.status_code, self.policy, retry_after)
+            if resp.status_code == 200:
+                return None
+            retryable = self.policy.should_retry(resp.status_code)
+        else:
+            retryable = True  # timeouts and dropped connections
+
+        pause = self.policy.backoff(self.attempt, retry_after)
+        self.attempt += 1
+        if (
+            retryable
+            and self.attempt < self.policy.attempts
+            and pause <= self._remaining()
+        ):
+            return pause
+        if error is not None:
+            raise error
+        if resp.status_code == 429:
+            raise RuntimeError(
+                "HTTP 429 — Google is rate-limiting you. "
+                "Wait a few minutes before retrying."
+            )
+        raise ConnectionError(
+            f"Cannot connect to Google Scholar (HTTP {resp.status_code}). "
+            "Is the ID correct?"
+        )
+
+
+@lru_cache(maxsize=1)
+def _transient_errors() -> tuple:
+    """Network exceptions worth retrying, for whichever HTTP clients exist."""
+    errors: tuple = (requests.ConnectionError, requests.Timeout)
+    try:
+        import httpx
+
+        errors += (httpx.TransportError,)
+    except ImportError:
+        pass
+    return errors
 
 
 # ---------------------------------------------------------------------------
-# Publication details  (mirrors R: get_publication_*)
+# Instrumentation
 # ---------------------------------------------------------------------------
+# Every fetch, parse and public call emits an event dict to the registered
+# hooks and to any collectors active in the current context (see
+# collect_metrics).  Event kinds:
+#   fetch: url, kind, seconds, status, bytes, retries, cache (hit/miss/off), error
+#   parse: url, kind, seconds, bytes, backend, region
+#   call:  name, seconds, error
+# With no hook or collector registered the cost is one check per event.
 
+_HOOKS: list[Callable[[dict], None]] = []
+_COLLECTORS: contextvars.ContextVar[tuple] = contextvars.ContextVar(
+    "scholar_collectors", default=()
+)
 
-def _get_publication_page(scholar_id: str, pub_id: str) -> BeautifulSoup:
-    """Fetch the detail page for a single publication."""
-    scholar_id = tidy_id(scholar_id)
-    url = (
-        f"{_SCHOLAR_SITE}/citations?view_op=view_citation&hl=en"
-        f"&user={scholar_id}&citation_for_view={scholar_id}:{pub_id}"
-    )
-    return _parse_html(url)
 
+def add_instrumentation_hook(hook: Callable[[dict], None]) -> None:
+    """Call `hook(event)` for every fetch, parse and public call, in any thread."""
+    if hook not in _HOOKS:
+        _HOOKS.append(hook)
 
-def get_publication_abstract(scholar_id: str, pub_id: str) -> str:
-    """Return the abstract text for a publication."""
-    page = _get_publication_page(scholar_id, pub_id)
-    el = page.select_one("div.gsh_csp")
-    return el.text.strip() if el else ""
 
+def remove_instrumentation_hook(hook: Callable[[dict], None]) -> None:
+    if hook in _HOOKS:
+        _HOOKS.remove(hook)
 
-def get_publication_url(scholar_id: str, pub_id: str) -> str:
-    """Return the URL to the full publication."""
-    page = _get_publication_page(scholar_id, pub_id)
-    el = page.select_one("a.gsc_oci_title_link")
-    return el["href"] if el else ""
 
+def _instrumenting() -> bool:
+    return bool(_HOOKS) or bool(_COLLECTORS.get())
 
-def get_publication_date(scholar_id: str, pub_id: str) -> str:
-    """Return the publication date string."""
-    page = _get_publication_page(scholar_id, pub_id)
-    fields = page.select("div.gsc_oci_field")
-    values = page.select("div.gsc_oci_value")
-    for f, v in zip(fields, values):
-        if "publication date" in f.text.strip().lower():
-            return v.text.strip()
-    return ""
 
+def _emit(event: dict) -> None:
+    for sink in (*_HOOKS, *_COLLECTORS.get()):
+        try:
+            sink(event)
+        except Exception as exc:  # a broken hook must not break a crawl
+            warnings.warn(f"Instrumentation hook failed: {exc!r}")
+
+
+def _emit_fetch(
+    url: str,
+    started: float,
+    resp=None,
+    cache: str = "off",
+    retries: int = 0,
+    error: Optional[Exception] = None,
+) -> None:
+    if not _instrumenting():
+        return
+    _emit(
+        {
+            "event": "fetch",
+            "url": url,
+            "kind": _url_kind(url),
+            "seconds": time.perf_counter() - started,
+            "status": resp.status_code if resp is not None else None,
+            "bytes": len(resp.content) if resp is not None else 0,
+            "retries": retries,
+            "cache": cache,
+            "error": type(error).__name__ if error is not None else None,
+        }
+    )
 
-def get_publication_data_extended(scholar_id: str, pub_id: str) -> dict:
-    """Return all metadata fields for a publication as a dict."""
-    page = _get_publication_page(scholar_id, pub_id)
-    fields = page.select("div.gsc_oci_field")
-    values = page.select("div.gsc_oci_value")
-    return {f.text.strip(): v.text.strip() for f, v in zip(fields, values)}
 
+def _timed_parse(url: str, html: str, region: Optional[str]) -> _Node:
+    """_parse_document(), emitting a parse event when instrumenting."""
+    if not _instrumenting():
+        return _parse_document(html, region=region)
+    started = time.perf_counter()
+    page = _parse_document(html, region=region)
+    _emit(
+        {
+            "event": "parse",
+            "url": url,
+            "kind": _url_kind(url),
+            "seconds": time.perf_counter() - started,
+            "bytes": len(html),
+            "backend": _PARSER_BACKEND,
+            "region": region,
+        }
+    )
+    return page
 
-def get_article_scholar_url(scholar_id: str, pubid: str) -> str:
-    """Return the Google Scholar URL for an article's detail page."""
-    scholar_id = tidy_id(scholar_id)
-    return (
-        f"{_SCHOLAR_SITE}/citations?view_op=view_citation&hl=en"
-        f"&user={scholar_id}&citation_for_view={scholar_id}:{pubid}"
+
+def _instrumented(fn: Optional[Callable] = None, *, name: Optional[str] = None):
+    """
+    Decorator: emit a `call` event with the duration of each call.
+
+    For a generator function the duration is the time spent producing
+    items, summed over the iteration, not the time the caller holds it.
+    """
+    if fn is None:
+        return lambda f: _instrumented(f, name=name)
+    label = name or fn.__qualname__
+
+    if inspect.iscoroutinefunction(fn):
+
+        @wraps(fn)
+        async def async_wrapper(*args, **kwargs):
+            if not _instrumenting():
+                return await fn(*args, **kwargs)
+            started, error = time.perf_counter(), None
+            try:
+                return await fn(*args, **kwargs)
+            except Exception as exc:
+                error = exc
+                raise
+            finally:
+                _emit_call(label, time.perf_counter() - started, error)
+
+        return async_wrapper
+
+    if inspect.isgeneratorfunction(fn):
+
+        @wraps(fn)
+        def generator_wrapper(*args, **kwargs):
+            if not _instrumenting():
+                return (yield from fn(*args, **kwargs))
+            gen, busy, error = fn(*args, **kwargs), 0.0, None
+            try:
+                while True:
+                    started = time.perf_counter()
+                    try:
+                        item = next(gen)
+                    except StopIteration as stop:
+                        return stop.value
+                    finally:
+                        busy += time.perf_counter() - started
+                    yield item
+            except Exception as exc:
+                error = exc
+                raise
+            finally:
+                gen.close()
+                _emit_call(label, busy, error)
+
+        return generator_wrapper
+
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        if not _instrumenting():
+            return fn(*args, **kwargs)
+        started, error = time.perf_counter(), None
+        try:
+            return fn(*args, **kwargs)
+        except Exception as exc:
+            error = exc
+            raise
+        finally:
+            _emit_call(label, time.perf_counter() - started, error)
+
+    return wrapper
+
+
+def _emit_call(name: str, seconds: float, error: Optional[Exception]) -> None:
+    _emit(
+        {
+            "event": "call",
+            "name": name,
+            "seconds": seconds,
+            "error": type(error).__name__ if error is not None else None,
+        }
     )
 
 
-def get_complete_authors(
-    scholar_id: str,
-    pubid: str | list[str],
-    delay: float = 0.4,
-    initials: bool = True,
-) -> str | list[str]:
+def _label_value(value) -> str:
+    """Escape a label value for the OpenMetrics text format."""
+    text = str(value).replace("\\", "\\\\").replace('"', '\\"')
+    return text.replace("\n", "\\n")
+
+
+class MetricsCollector:
     """
-    Get the complete author list for one or more publications.
+    In-memory aggregator of instrumentation events.
+
+    Use as a context (`with collect_metrics() as m:`) or register it with
+    add_instrumentation_hook().  summary() gives count and p50/p95/p99
+    latency per public function, page kind and parse; to_openmetrics()
+    renders the same data in Prometheus/OpenMetrics text format.
 
     Parameters
     ----------
-    scholar_id : str
-    pubid : str or list of str
-    delay : float — average delay between requests (jittered ± 0.5s)
-    initials : bool — abbreviate first/middle names
+    keep_events : bool — also keep every raw event in `.events`
+    """
 
-    Returns
-    -------
-    str or list of str
+    def __init__(self, keep_events: bool = False):
+        self.events: list[dict] = []
+        self.keep_events = keep_events
+        self._lock = threading.Lock()
+        self._series: dict[tuple, dict] = {}
+
+    def __call__(self, event: dict) -> None:
+        if event["event"] == "call":
+            key = ("call", event["name"], "")
+        elif event["event"] == "fetch":
+            key = ("fetch", event["kind"], event["cache"])
+        else:
+            key = ("parse", event["kind"], event["backend"] or "")
+        with self._lock:
+            if self.keep_events:
+                self.events.append(event)
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = {
+                    "seconds": [], "errors": 0, "bytes": 0, "retries": 0,
+                }
+            series["seconds"].append(event["seconds"])
+            series["errors"] += event.get("error") is not None
+            series["bytes"] += event.get("bytes", 0)
+            series["retries"] += event.get("retries", 0)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.events.clear()
+            self._series.clear()
+
+    def summary(self) -> pd.DataFrame:
+        """One row per (event, name, detail): count, errors, latency quantiles."""
+        with self._lock:
+            items = [(k, dict(v, seconds=list(v["seconds"])))
+                     for k, v in self._series.items()]
+        rows = []
+        for (event, name, detail), series in items:
+            secs = np.asarray(series["seconds"])
+            p50, p95, p99 = np.percentile(secs, [50, 95, 99])
+            rows.append(
+                {
+                    "event": event,
+                    "name": name,
+                    "detail": detail,
+                    "count": len(secs),
+                    "errors": series["errors"],
+                    "total_s": secs.sum(),
+                    "p50_s": p50,
+                    "p95_s": p95,
+                    "p99_s": p99,
+                    "max_s": secs.max(),
+                    "bytes": series["bytes"],
+                    "retries": series["retries"],
+                }
+            )
+        columns = [
+            "event", "name", "detail", "count", "errors", "total_s",
+            "p50_s", "p95_s", "p99_s", "max_s", "bytes", "retries",
+        ]
+        return (
+            pd.DataFrame(rows, columns=columns)
+            .sort_values(["event", "total_s"], ascending=[True, False])
+            .reset_index(drop=True)
+        )
+
+    def to_openmetrics(self, prefix: str = "scholar") -> str:
+        """Render the collected metrics as OpenMetrics text (ends with # EOF)."""
+        summary = self.summary()
+        labels_for = {
+            "call": lambda r: f'function="{_label_value(r.name)}"',
+            "fetch": lambda r: (
+                f'kind="{_label_value(r.name)}",cache="{_label_value(r.detail)}"'
+            ),
+            "parse": lambda r: (
+                f'kind="{_label_value(r.name)}",backend="{_label_value(r.detail)}"'
+            ),
+        }
+        lines = []
+        for event, group in summary.groupby("event", sort=True):
+            metric = f"{prefix}_{event}_seconds"
+            lines.append(f"# TYPE {metric} summary")
+            lines.append(f"# UNIT {metric} seconds")
+            for r in group.itertuples(index=False):
+                labels = labels_for[event](r)
+                for q, col in (("0.5", "p50_s"), ("0.95", "p95_s"), ("0.99", "p99_s")):
+                    lines.append(
+                        f'{metric}{{{labels},quantile="{q}"}} {getattr(r, col):.6g}'
+                    )
+                lines.append(f"{metric}_sum{{{labels}}} {r.total_s:.6g}")
+                lines.append(f"{metric}_count{{{labels}}} {r.count}")
+            counters = [("errors", "errors")]
+            if event == "fetch":
+                counters += [("bytes", "bytes"), ("retries", "retries")]
+            for suffix, col in counters:
+                name = f"{prefix}_{event}_{suffix}"
+                lines.append(f"# TYPE {name} counter")
+                for r in group.itertuples(index=False):
+                    lines.append(
+                        f"{name}_total{{{labels_for[event](r)}}} {getattr(r, col)}"
+                    )
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+
+@contextmanager
+def collect_metrics(keep_events: bool = False) -> Iterator[MetricsCollector]:
     """
-    scholar_id = tidy_id(scholar_id)
+    Collect instrumentation events raised inside the `with` block.
 
-    def _fetch_one(pid: str) -> str:
-        url = (
-            f"{_SCHOLAR_SITE}/citations?view_op=view_citation"
-            f"&citation_for_view={scholar_id}:{pid}"
-        )
-        page = _parse_html(url)
-        el = page.select_one(".gsc_oci_value")
-        return el.text.strip() if el else ""
-
-    def _to_initials(author_str: str) -> str:
-        authors = [a.strip() for a in author_str.split(",")]
-        formatted = []
-        for author in authors:
-            parts = author.split()
-            if not parts:
-                continue
-            last = parts[-1]
-            firsts = "".join(p[0] for p in parts[:-1] if p)
-            formatted.append(f"{firsts} {last}".strip())
-        return ", ".join(formatted)
+    Work fanned out to the shared thread pool is included; collectors nest.
 
-    single = isinstance(pubid, str)
-    pubids = [pubid] if single else list(pubid)
+        with collect_metrics() as m:
+            compare_scholars(ids)
+        print(m.summary())
+    """
+    collector = MetricsCollector(keep_events=keep_events)
+    token = _COLLECTORS.set(_COLLECTORS.get() + (collector,))
+    try:
+        yield collector
+    finally:
+        _COLLECTORS.reset(token)
+
+
+# ---------------------------------------------------------------------------
+# HTML parser backends
+# ---------------------------------------------------------------------------
+# All page parsing goes through a small node interface: select(css),
+# select_one(css), .text, .get(attr) and node[attr].  BeautifulSoup
+# provides it natively; lxml and selectolax trees are wrapped to match,
+# so the extraction code is the same whichever backend is active.
+
+# A parsed document or element from any backend.
+_Node = Any
+
+_PARSER_BACKENDS = ("selectolax", "lxml", "bs4")
+_PARSER_BACKEND: Optional[str] = None  # resolved on first use
+
+
+class _LxmlNode:
+    """lxml.html element with the BeautifulSoup-style node interface."""
+
+    __slots__ = ("_el",)
+
+    def __init__(self, el):
+        self._el = el
+
+    def select(self, css: str) -> list[_LxmlNode]:
+        return [_LxmlNode(e) for e in _lxml_selector(css)(self._el)]
+
+    def select_one(self, css: str) -> Optional[_LxmlNode]:
+        found = _lxml_selector(css)(self._el)
+        return _LxmlNode(found[0]) if found else None
+
+    @property
+    def text(self) -> str:
+        return self._el.text_content()
+
+    def get(self, attr: str, default=None):
+        return self._el.get(attr, default)
+
+    def __getitem__(self, attr: str) -> str:
+        value = self._el.get(attr)
+        if value is None:
+            raise KeyError(attr)
+        return value
+
+
+@lru_cache(maxsize=None)
+def _lxml_selector(css: str):
+    """Compile a CSS selector once per process."""
+    from lxml.cssselect import CSSSelector
+
+    return CSSSelector(css)
 
-    if len(pubids) > 50:
+
+class _SelectolaxNode:
+    """selectolax node with the BeautifulSoup-style node interface."""
+
+    __slots__ = ("_node",)
+
+    def __init__(self, node):
+        self._node = node
+
+    def select(self, css: str) -> list[_SelectolaxNode]:
+        return [_SelectolaxNode(n) for n in self._node.css(css)]
+
+    def select_one(self, css: str) -> Optional[_SelectolaxNode]:
+        found = self._node.css_first(css)
+        return _SelectolaxNode(found) if found is not None else None
+
+    @property
+    def text(self) -> str:
+        return self._node.text(deep=True)
+
+    def get(self, attr: str, default=None):
+        value = self._node.attributes.get(attr, default)
+        return default if value is None else value
+
+    def __getitem__(self, attr: str) -> str:
+        value = self._node.attributes.get(attr)
+        if value is None:
+            raise KeyError(attr)
+        return value
+
+
+def _backend_available(backend: str) -> bool:
+    try:
+        if backend == "selectolax":
+            import selectolax.lexbor  # noqa: F401
+        elif backend == "lxml":
+            import lxml.html  # noqa: F401
+            import lxml.cssselect  # noqa: F401  (needs the cssselect package)
+    except ImportError:
+        return False
+    return True
+
+
+def set_html_parser(backend: str = "auto") -> str:
+    """
+    Choose the HTML parser used for every page.
+
+    backend : "selectolax", "lxml", "bs4" (BeautifulSoup + html.parser), or
+        "auto" for the fastest one installed.  Returns the backend chosen.
+
+    Optional: pip install selectolax   or   pip install lxml cssselect
+    """
+    global _PARSER_BACKEND
+    if backend == "auto":
+        backend = next(b for b in _PARSER_BACKENDS if _backend_available(b))
+    elif backend not in _PARSER_BACKENDS:
         raise ValueError(
-            "Requesting >50 publications risks Google blocking your IP."
+            f"Unknown parser backend {backend!r}; "
+            f"choose from {', '.join(_PARSER_BACKENDS)} or 'auto'."
         )
+    elif not _backend_available(backend):
+        raise ImportError(f"Parser backend {backend!r} is not installed.")
+    _PARSER_BACKEND = backend
+    return backend
+
+
+# Targeted parsing: most callers need one small part of a page, so the raw
+# HTML is cut down to that element before any tree is built.  Regions are
+# located with a start-tag regex and closed by counting nested tags of the
+# same name; if the markup is not found the full page is parsed instead.
+
+# region -> (tag, attribute, value) of the element that contains it
+_REGIONS = {
+    "title": ("div", "id", "gsc_oci_title"),
+    "abstract": ("div", "class", "gsh_csp"),
+    "fields": ("div", "id", "gsc_oci_table"),
+    "article_history": ("div", "id", "gsc_oci_graph_bars"),
+    "citation_history": ("div", "class", "gsc_md_hist_b"),
+}
+
+
+@lru_cache(maxsize=None)
+def _region_patterns(region: str) -> tuple[re.Pattern, re.Pattern]:
+    tag, attr, value = _REGIONS[region]
+    start = re.compile(
+        rf"<{tag}\b[^>]*?\s{attr}\s*=\s*[\"']"
+        rf"(?:[^\"']*\s)?{re.escape(value)}(?:\s[^\"']*)?[\"']",
+        re.IGNORECASE,
+    )
+    nesting = re.compile(rf"<(/?){tag}\b", re.IGNORECASE)
+    return start, nesting
 
-    results = []
-    for i, pid in enumerate(pubids):
-        if i > 0:
-            jitter = max(0, delay + (np.random.random() - 0.5))
-            time.sleep(jitter)
-        text = _fetch_one(pid)
-        results.append(_to_initials(text) if initials else text)
 
-    return results[0] if single else results
+def _extract_region(html: str, region: str) -> Optional[str]:
+    """Return the HTML of the first element for `region`, or None."""
+    start, nesting = _region_patterns(region)
+    m = start.search(html)
+    if not m:
+        return None
+    depth = 0
+    for tag in nesting.finditer(html, m.start()):
+        depth += -1 if tag.group(1) else 1
+        if depth == 0:
+            end = html.find(">", tag.end())
+            return html[m.start() : end + 1] if end >= 0 else None
+    return None
+
+
+def _parse_document(
+    html: str, backend: Optional[str] = None, region: Optional[str] = None
+) -> _Node:
+    """
+    Parse an HTML document with the active (or given) backend.
+
+    With `region` (a key of _REGIONS) only that element is parsed, falling
+    back to the whole document when it cannot be located.
+    """
+    if region is not None:
+        html = _extract_region(html, region) or html
+    backend = backend or _PARSER_BACKEND or set_html_parser("auto")
+    if backend == "selectolax":
+        from selectolax.lexbor import LexborHTMLParser
+
+        return _SelectolaxNode(LexborHTMLParser(html).root)
+    if backend == "lxml":
+        import lxml.html
+
+        return _LxmlNode(lxml.html.document_fromstring(html or "<html/>"))
+    return BeautifulSoup(html, "html.parser")
 
 
 # ---------------------------------------------------------------------------
-# Citation history  (mirrors R: get_citation_history)
+# Low-level helpers  (mirrors R: utils.R)
 # ---------------------------------------------------------------------------
 
 
-def get_citation_history(scholar_id: str) -> pd.DataFrame:
+def tidy_id(scholar_id: str) -> str:
+    """Ensure a single, clean scholar ID."""
+    if isinstance(scholar_id, (list, tuple)):
+        if len(scholar_id) != 1:
+            warnings.warn(
+                f"Only one ID at a time; using first: {scholar_id[0]}"
+            )
+        scholar_id = scholar_id[0]
+    # Strip common trailing fragments
+    return scholar_id.split("&")[0].strip()
+
+
+def get_scholar_resp(
+    url: str,
+    attempts_left: Optional[int] = None,
+    delay: Optional[float] = None,
+    policy: Optional[RetryPolicy] = None,
+) -> requests.Response:
+    """GET a Google Scholar page with retries and rate-limit detection.
+
+    Retries follow `policy` (default: the one from set_retry_policy);
+    `attempts_left` and `delay` override its attempts and base backoff.
+    Served from the response cache when one is enabled and holds a fresh
+    copy (see set_scholar_cache).
     """
-    Get annual citation counts for a scholar (past ~12 years).
+    started = time.perf_counter()
+    cache = _CACHE
+    if cache is not None:
+        cached = cache.get(url)
+        if cached is not None:
+            _emit_fetch(url, started, cached, cache="hit")
+            return cached
+        if cache.offline:
+            raise ConnectionError(
+                f"Offline mode: {url} is not in the response cache."
+            )
 
-    Returns DataFrame with columns: year, cites.
+    run = _RetryRun(url, _effective_policy(policy, attempts_left, delay))
+    cache_state = "off" if cache is None else "miss"
+    try:
+        resp = _fetch_scholar_resp(run)
+    except Exception as exc:
+        _emit_fetch(
+            url, started, cache=cache_state, retries=run.attempt, error=exc
+        )
+        raise
+    if cache is not None:
+        cache.put(url, resp)
+    _emit_fetch(url, started, resp, cache=cache_state, retries=run.attempt)
+    return resp
+
+
+def _effective_policy(
+    policy: Optional[RetryPolicy],
+    attempts_left: Optional[int],
+    delay: Optional[float],
+) -> RetryPolicy:
+    policy = policy or _RETRY_POLICY
+    changes = {}
+    if attempts_left is not None:
+        changes["attempts"] = attempts_left
+    if delay is not None:
+        changes["base"] = delay
+    return policy.replace(**changes) if changes else policy
+
+
+def _fetch_scholar_resp(run: _RetryRun) -> requests.Response:
     """
-    scholar_id = tidy_id(scholar_id)
-    url = (
+    Network half of get_scholar_resp: GET with retries, no caching.
+
+    Each attempt waits out the circuit breaker, then goes through the
+    global rate limiter and per-host slot; `run` decides what to retry.
+    """
+    url = run.url
+    while True:
+        pause = run.wait()
+        if pause > 0:
+            time.sleep(pause)
+        _RATE_LIMITER.acquire()
+        try:
+            with _host_slot(url):
+                resp = _send(url)
+        except _transient_errors() as exc:
+            pause = run.record(error=exc)
+        else:
+            pause = run.record(resp)
+            if pause is None:
+                return resp
+        time.sleep(pause)
+
+
+def _parse_html(url: str, region: Optional[str] = None) -> _Node:
+    """Fetch URL and return a parsed document, or just one `region` of it."""
+    resp = get_scholar_resp(url)
+    return _timed_parse(url, resp.text, region)
+
+
+def _grab_id(url: str) -> Optional[str]:
+    """Extract the scholar ID from a URL."""
+    m = re.search(r"user=([A-Za-z0-9_-]+)", url or "")
+    return m.group(1) if m else None
+
+
+def _profile_url(scholar_id: str) -> str:
+    return f"{_SCHOLAR_SITE}/citations?hl=en&user={scholar_id}"
+
+
+def _publications_url(
+    scholar_id: str, cstart: int, pagesize: int, sortby: str
+) -> str:
+    sort_param = "&sortby=pubdate" if sortby == "year" else ""
+    return (
         f"{_SCHOLAR_SITE}/citations?hl=en&user={scholar_id}"
-        f"&pagesize=100&view_op=list_works"
+        f"&cstart={cstart}&pagesize={pagesize}{sort_param}"
     )
-    page = _parse_html(url)
 
-    years = [
-        int(s.text) for s in page.select("span.gsc_g_t") if s.text.isdigit()
-    ]
-    vals = [
-        int(s.text) for s in page.select("span.gsc_g_al") if s.text.isdigit()
-    ]
 
-    if len(years) > len(vals):
-        # Some years have zero citations — use z-index to map
-        style_tags = page.select("a.gsc_g_a")
-        allvals = [0] * len(years)
-        for tag in style_tags:
-            style = tag.get("style", "")
-            m = re.search(r"z-index:(\d+)", style)
-            if m:
-                z = int(m.group(1))
-                al = tag.select_one(".gsc_g_al")
-                if al and z <= len(allvals):
-                    allvals[z - 1] = int(al.text)
-        vals = list(reversed(allvals))
+def _publication_page_url(scholar_id: str, pubid: str) -> str:
+    return (
+        f"{_SCHOLAR_SITE}/citations?view_op=view_citation&hl=en"
+        f"&user={scholar_id}&citation_for_view={scholar_id}:{pubid}"
+    )
+
+
+# ---------------------------------------------------------------------------
+# Profile  (mirrors R: get_profile, get_scholar_id)
+# ---------------------------------------------------------------------------
+
+
+@_instrumented
+def get_profile(
+    scholar_id: str, bundle: Optional[ScholarProfilePage] = None
+) -> dict:
+    """
+    Get profile information for a Google Scholar researcher.
+
+    Returns a dict with: id, name, affiliation, total_cites, h_index,
+    i10_index, fields, homepage, coauthors, available, not_available.
+
+    Pass a bundle from get_profile_bundle() to skip the fetch.
+    """
+    scholar_id = tidy_id(scholar_id)
+    if _check_bundle(bundle, scholar_id):
+        return dict(bundle.profile)
+    return _parse_profile(_parse_html(_profile_url(scholar_id)), scholar_id)
+
+
+def _parse_profile(page: _Node, scholar_id: str) -> dict:
+    """Extract the profile dict from a parsed profile page."""
+    # Name
+    name_el = page.select_one("#gsc_prf_in")
+    name = name_el.text.strip() if name_el else ""
+
+    # Affiliation
+    bio_divs = page.select("div.gsc_prf_il")
+    affiliation = bio_divs[0].text.strip() if bio_divs else ""
+
+    # Research interests
+    fields = [a.text.strip() for a in page.select("a.gsc_prf_inta")]
+
+    # Homepage
+    hp_el = page.select_one("#gsc_prf_ivh a")
+    homepage = hp_el["href"] if hp_el else ""
+
+    # Citation table
+    stats = page.select("#gsc_rsb_st tr")
+    total_cites = h_index = i10_index = 0
+    for row in stats:
+        cells = row.select("td")
+        if len(cells) >= 2:
+            label = cells[0].text.strip().lower()
+            val = cells[1].text.strip()
+            if "citations" in label:
+                total_cites = int(val) if val.isdigit() else 0
+            elif "h-index" in label:
+                h_index = int(val) if val.isdigit() else 0
+            elif "i10-index" in label:
+                i10_index = int(val) if val.isdigit() else 0
+
+    # Coauthors (listed on profile, up to 20)
+    coauthors = []
+    for a_tag in page.select("a[tabindex='-1']"):
+        href = a_tag.get("href", "")
+        coauthor_name = a_tag.text.strip()
+        if coauthor_name and "Sort by" not in coauthor_name:
+            coauthors.append(
+                {"name": coauthor_name, "url": href, "id": _grab_id(href)}
+            )
+
+    # Availability metrics
+    available = not_available = None
+    avail_el = page.select_one("div.gsc_rsb_m_a")
+    if avail_el:
+        m = re.match(r"(\d+)", avail_el.text)
+        available = int(m.group(1)) if m else None
+    navail_el = page.select_one("div.gsc_rsb_m_na")
+    if navail_el:
+        m = re.match(r"(\d+)", navail_el.text)
+        not_available = int(m.group(1)) if m else None
+
+    return {
+        "id": scholar_id,
+        "name": name,
+        "affiliation": affiliation,
+        "total_cites": total_cites,
+        "h_index": h_index,
+        "i10_index": i10_index,
+        "fields": fields,
+        "homepage": homepage,
+        "coauthors": coauthors,
+        "available": available,
+        "not_available": not_available,
+    }
+
+
+@_instrumented
+def get_scholar_id(
+    last_name: str = "",
+    first_name: str = "",
+    affiliation: Optional[str] = None,
+) -> Optional[str]:
+    """
+    Search for a Google Scholar ID by name (and optional affiliation).
+
+    Returns the scholar ID string, or None if not found.
+    """
+    if not (first_name or last_name):
+        raise ValueError("At least one of first_name / last_name is required.")
+
+    query = f"{first_name}+{last_name}".strip("+")
+    url = (
+        f"{_SCHOLAR_SITE}/citations?view_op=search_authors"
+        f"&mauthors={query}&hl=en&oi=ao"
+    )
+    resp = get_scholar_resp(url)
+    ids = list(set(re.findall(r"user=([A-Za-z0-9_-]+)", resp.text)))
+
+    if not ids:
+        warnings.warn("No Scholar ID found.")
+        return None
+
+    if len(ids) == 1:
+        return ids[0]
+
+    # Multiple matches — use affiliation to disambiguate
+    if affiliation is None:
+        warnings.warn(
+            f"Found {len(ids)} candidates; returning first: {ids[0]}"
+        )
+        return ids[0]
+
+    # Stop at the first match; candidates not yet fetched are cancelled
+    for sid, prof in _iter_concurrent(get_profile, ids):
+        if isinstance(prof, Exception):
+            continue
+        if affiliation.lower() in prof["affiliation"].lower():
+            return sid
+
+    warnings.warn("No researcher found at the indicated affiliation.")
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Publications  (mirrors R: publications.r)
+# ---------------------------------------------------------------------------
+
+
+_PUBLICATION_COLUMNS = (
+    "title", "author", "journal", "number", "cites", "year", "cid", "pubid",
+)
+_STRING_STORAGE = "auto"
+
+
+def set_string_storage(storage: str = "auto") -> str:
+    """
+    Choose the storage of text columns in publication tables.
+
+    "pyarrow" keeps strings in Arrow buffers (pip install pyarrow), which
+    takes far less memory than Python string objects; "python" uses Python
+    objects; "auto" picks pyarrow when installed.  Returns the storage used.
+    """
+    global _STRING_STORAGE
+    if storage not in ("auto", "pyarrow", "python"):
+        raise ValueError("storage must be 'auto', 'pyarrow' or 'python'.")
+    if storage == "pyarrow":
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError as exc:
+            raise ImportError(
+                "pyarrow string storage needs: pip install pyarrow"
+            ) from exc
+    _STRING_STORAGE = storage
+    _string_dtype.cache_clear()
+    return _string_dtype().storage
+
+
+@lru_cache(maxsize=1)
+def _string_dtype() -> pd.StringDtype:
+    storage = _STRING_STORAGE
+    if storage == "auto":
+        try:
+            import pyarrow  # noqa: F401
+
+            storage = "pyarrow"
+        except ImportError:
+            storage = "python"
+    return pd.StringDtype(storage)
+
+
+def _publication_frame(columns: dict[str, list]) -> pd.DataFrame:
+    """Build the typed publication table straight from per-column lists."""
+    string = _string_dtype()
+    return pd.DataFrame(
+        {
+            "title": pd.array(columns["title"], dtype=string),
+            "author": pd.array(columns["author"], dtype=string),
+            "journal": pd.Categorical(columns["journal"]),
+            "number": pd.array(columns["number"], dtype=string),
+            "cites": pd.array(columns["cites"], dtype="Int32"),
+            "year": pd.array(columns["year"], dtype="Int32"),
+            "cid": pd.array(columns["cid"], dtype=string),
+            "pubid": pd.array(columns["pubid"], dtype=string),
+        }
+    )
+
+
+@_instrumented
+def get_publications(
+    scholar_id: str,
+    cstart: int = 0,
+    cstop: int = float("inf"),
+    pagesize: int = 100,
+    sortby: str = "citation",
+    bundle: Optional[ScholarProfilePage] = None,
+    min_cites: Optional[int] = None,
+    since_year: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    Get all publications for a scholar.
+
+    Returns a DataFrame with columns: title, author, journal, number,
+    cites, year, cid, pubid.  `journal` is categorical, `cites` and `year`
+    are nullable Int32 (<NA> for a missing year) and the text columns use
+    pandas' string dtype (see set_string_storage).
+
+    A bundle from get_profile_bundle() stands in for the first page when
+    cstart=0, pagesize=100 and sortby="citation".
+
+    min_cites and since_year keep only publications with at least that
+    many cites / from that year on.  Paging stops as soon as the sort order
+    rules out further matches: min_cites stops the citation-sorted list,
+    since_year the year-sorted one.  Given since_year alone, the
+    year-sorted list is fetched and re-sorted by cites if sortby="citation"
+    (papers with equal cites may then be ordered differently).
+    """
+    by_year = since_year is not None and min_cites is None
+    fetch_sort = "year" if by_year else sortby
+
+    columns: dict[str, list] = {col: [] for col in _PUBLICATION_COLUMNS}
+    for page in _iter_publication_columns(
+        scholar_id,
+        cstart,
+        cstop,
+        pagesize,
+        fetch_sort,
+        bundle=bundle if fetch_sort == sortby else None,
+    ):
+        for col, values in page.items():
+            columns[col].extend(values)
+        if not page["pubid"]:
+            break
+        if fetch_sort == "citation" and min_cites is not None:
+            if page["cites"][-1] < min_cites:
+                break
+        elif fetch_sort == "year" and since_year is not None:
+            last_year = page["year"][-1]
+            if last_year is None or last_year < since_year:
+                break  # undated papers come last in year order
+    pubs = _publication_frame(columns)
+
+    if min_cites is None and since_year is None:
+        return pubs
+    keep = np.ones(len(pubs), dtype=bool)
+    if min_cites is not None:
+        keep &= (pubs["cites"] >= min_cites).to_numpy(dtype=bool, na_value=False)
+    if since_year is not None:
+        keep &= (pubs["year"] >= since_year).to_numpy(dtype=bool, na_value=False)
+    pubs = pubs[keep]
+    if fetch_sort != sortby:
+        pubs = pubs.sort_values("cites", ascending=False, kind="stable")
+    return pubs.reset_index(drop=True)
+
+
+@_instrumented
+def get_top_publications(
+    scholar_id: str,
+    n: int = 10,
+    sortby: str = "citation",
+    bundle: Optional[ScholarProfilePage] = None,
+) -> pd.DataFrame:
+    """
+    The `n` most cited (or, with sortby="year", most recent) publications.
+
+    Fetches only the pages needed: one for n <= 100.  Same columns as
+    get_publications().
+    """
+    if n <= 0:
+        raise ValueError("n must be positive.")
+    pubs = get_publications(scholar_id, cstop=n, sortby=sortby, bundle=bundle)
+    return pubs.head(n).reset_index(drop=True)
+
+
+@_instrumented
+def iter_publication_pages(
+    scholar_id: str,
+    cstart: int = 0,
+    cstop: int = float("inf"),
+    pagesize: int = 100,
+    sortby: str = "citation",
+    prefetch: bool = False,
+    bundle: Optional[ScholarProfilePage] = None,
+) -> Iterator[pd.DataFrame]:
+    """
+    Yield a scholar's publications one page (DataFrame) at a time.
+
+    Same columns and arguments as get_publications().  Pages are only
+    fetched as the caller asks for them, so breaking out of the loop
+    skips the rest of the list.  With prefetch=True, after a full page
+    the next one is requested in the background while the caller works
+    on the current one; that request is wasted if iteration stops there.
+
+    Each page has its own `journal` categories, so pd.concat() of pages
+    gives an object column; get_publications() builds one shared set.
+    """
+    for page in _iter_publication_columns(
+        scholar_id, cstart, cstop, pagesize, sortby, prefetch, bundle
+    ):
+        yield _publication_frame(page)
+
+
+def _iter_publication_columns(
+    scholar_id: str,
+    cstart: int = 0,
+    cstop: int = float("inf"),
+    pagesize: int = 100,
+    sortby: str = "citation",
+    prefetch: bool = False,
+    bundle: Optional[ScholarProfilePage] = None,
+) -> Iterator[dict[str, list]]:
+    """Paginate a publication list, yielding each page's parsed columns."""
+    scholar_id = tidy_id(scholar_id)
+    if pagesize > 100:
+        warnings.warn("pagesize exceeds 100; capping at 100.")
+        pagesize = 100
+
+    assert sortby in ("citation", "year"), "sortby must be 'citation' or 'year'"
+
+    if (
+        _check_bundle(bundle, scholar_id)
+        and cstart == 0
+        and pagesize == 100
+        and sortby == "citation"
+    ):
+        pubs = bundle.publications
+        yield {col: pubs[col].tolist() for col in _PUBLICATION_COLUMNS}
+        if len(pubs) < pagesize or cstart + pagesize >= cstop:
+            return
+        cstart += pagesize
+
+    # The next page is prefetched on the shared pool, whose threads keep
+    # their sessions.  Not from inside a worker: a nested task queued
+    # behind the worker could wait on it.  A prefetch still queued when
+    # its page is wanted is cancelled and fetched here instead.
+    prefetch = prefetch and not getattr(_WORKER, "active", False)
+    pending = None
+    try:
+        while True:
+            url = _publications_url(scholar_id, cstart, pagesize, sortby)
+            if pending is None or pending.cancel():
+                resp = get_scholar_resp(url)
+            else:
+                resp = pending.result()
+            pending = None
+            page = _parse_publication_columns(_timed_parse(url, resp.text, None))
+            if len(page["title"]) < pagesize or cstart + pagesize >= cstop:
+                yield page
+                return
+            # A full page: the next one is fetched while the caller works
+            if prefetch:
+                next_url = _publications_url(
+                    scholar_id, cstart + pagesize, pagesize, sortby
+                )
+                pending = _get_executor().submit(
+                    contextvars.copy_context().run, get_scholar_resp, next_url
+                )
+            yield page
+            cstart += pagesize
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
+def _parse_publication_rows(page: _Node) -> list[dict]:
+    """One record per row of a publication list page (for JSON checkpoints)."""
+    columns = _parse_publication_columns(page)
+    return [dict(zip(columns, values)) for values in zip(*columns.values())]
+
+
+def _parse_publication_columns(page: _Node) -> dict[str, list]:
+    """Extract the `tr.gsc_a_tr` rows of a publication list page by column."""
+    columns: dict[str, list] = {col: [] for col in _PUBLICATION_COLUMNS}
+    title_col, author_col = columns["title"], columns["author"]
+    journal_col, number_col = columns["journal"], columns["number"]
+    cites_col, year_col = columns["cites"], columns["year"]
+    cid_col, pubid_col = columns["cid"], columns["pubid"]
+
+    for row in page.select("tr.gsc_a_tr"):
+        # Title & pubid
+        title_el = row.select_one(".gsc_a_at")
+        title_col.append(title_el.text.strip() if title_el else "")
+        pubid = ""
+        if title_el and title_el.get("href"):
+            m = re.search(r":(.+)$", title_el["href"])
+            pubid = m.group(1) if m else ""
+        pubid_col.append(pubid)
+
+        # Citation count & cid
+        cite_el = row.select_one(".gsc_a_ac")
+        cites = 0
+        cid = ""
+        if cite_el:
+            cites_text = cite_el.text.strip()
+            cites = int(cites_text) if cites_text.isdigit() else 0
+            href = cite_el.get("href", "")
+            m = re.search(r"cites=(\d+)", href)
+            cid = m.group(1) if m else ""
+        cites_col.append(cites)
+        cid_col.append(cid)
+
+        # Year
+        year_el = row.select_one(".gsc_a_y span")
+        year_text = year_el.text.strip() if year_el else ""
+        year_col.append(int(year_text) if year_text.isdigit() else None)
+
+        # Author & journal/details (two grey lines)
+        grey = row.select("td .gs_gray")
+        author_col.append(grey[0].text.strip() if len(grey) > 0 else "")
+        details = grey[1].text.strip() if len(grey) > 1 else ""
+
+        # Parse journal vs number from details
+        first_digit = re.search(r"[\[\(]?\d", details)
+        if first_digit:
+            pos = first_digit.start()
+            journal = details[:pos].strip().rstrip(",")
+            number = (
+                details[pos:].strip().rstrip(",").rstrip()
+            )
+            # Remove trailing year portion like ", 2019"
+            number = re.sub(r",?\s*\d{4}\s*$", "", number).strip().rstrip(",")
+        else:
+            journal = details.rstrip(",").strip()
+            number = ""
+        journal_col.append(journal)
+        number_col.append(number)
+
+    return columns
+
+
+@_instrumented
+def get_article_cite_history(
+    scholar_id: str, article_pubid: str
+) -> pd.DataFrame:
+    """
+    Get yearly citation history for a single article.
+
+    Returns DataFrame with columns: year, cites, pubid.
+    """
+    scholar_id = tidy_id(scholar_id)
+    url = _publication_page_url(scholar_id, article_pubid)
+    page = _parse_html(url, region="article_history")
+    return _parse_article_cite_history(page, article_pubid)
+
+
+def _parse_article_cite_history(
+    page: _Node, article_pubid: str
+) -> pd.DataFrame:
+    """Extract the per-year citation bars from a publication detail page."""
+    years, vals = _parse_article_cite_points(page)
+    if len(years) == 0:
+        return pd.DataFrame(columns=["year", "cites", "pubid"])
+
+    # Fill gaps: years without a bar had zero citations
+    first = years.min()
+    full_years = np.arange(first, years.max() + 1)
+    cites = np.zeros(len(full_years), dtype=np.int64)
+    cites[years - first] = vals
+    return pd.DataFrame(
+        {"year": full_years, "cites": cites, "pubid": article_pubid}
+    )
+
+
+def _parse_article_cite_points(page: _Node) -> tuple[np.ndarray, np.ndarray]:
+    """The (year, cites) pairs of the bars that are present, as arrays."""
+    years, vals = [], []
+    for a_tag in page.select(".gsc_oci_g_a"):
+        href = a_tag.get("href", "")
+        m = re.search(r"as_ylo=(\d{4})", href)
+        if m:
+            years.append(int(m.group(1)))
+    for span in page.select(".gsc_oci_g_al"):
+        vals.append(int(span.text.strip()))
+    n = min(len(years), len(vals))
+    return (
+        np.asarray(years[:n], dtype=np.int64),
+        np.asarray(vals[:n], dtype=np.int64),
+    )
+
+
+@_instrumented
+def get_all_article_cite_histories(
+    scholar_id: str, pubids: Optional[list[str]] = None
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Yearly citation histories for many articles at once.
+
+    Detail pages are fetched concurrently under the shared rate limiter;
+    articles whose page fails are left out with a warning.
+
+    Parameters
+    ----------
+    scholar_id : str
+    pubids : list of str — defaults to every cited publication on the profile
+
+    Returns
+    -------
+    (long, wide): long has columns year, cites, pubid, each article's gaps
+    filled between its first and last year, as get_article_cite_history()
+    gives; wide is a year x pubid matrix of cites (0 where none).
+    """
+    scholar_id = tidy_id(scholar_id)
+    if pubids is None:
+        pubs = _publication_table(scholar_id)
+        pubids = pubs.loc[pubs["cites"] > 0, "pubid"].tolist() if len(pubs) else []
+    pubids = list(dict.fromkeys(pubids))
+
+    def _one(pid: str) -> tuple[np.ndarray, np.ndarray]:
+        url = _publication_page_url(scholar_id, pid)
+        return _parse_article_cite_points(_parse_html(url, region="article_history"))
+
+    points = _map_concurrent(_one, pubids, return_exceptions=True)
+    failed = [pid for pid, pt in zip(pubids, points) if isinstance(pt, Exception)]
+    if failed:
+        warnings.warn(
+            f"Could not fetch citation history for {len(failed)} articles: "
+            + ", ".join(failed[:10])
+            + (" ..." if len(failed) > 10 else "")
+        )
+    kept = [(pid, pt) for pid, pt in zip(pubids, points) if pid not in failed]
+    return _cite_history_frames(kept)
+
+
+def _cite_history_frames(
+    points: list[tuple[str, tuple[np.ndarray, np.ndarray]]],
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Scatter per-article (year, cites) points into one year x article matrix."""
+    pubids = [pid for pid, _ in points]
+    lengths = np.array([len(y) for _, (y, _v) in points], dtype=np.int64)
+    if lengths.sum() == 0:
+        long = pd.DataFrame(columns=["year", "cites", "pubid"])
+        wide = pd.DataFrame(0, index=pd.Index([], name="year"), columns=pubids)
+        return long, wide
+
+    years = np.concatenate([y for _, (y, _v) in points])
+    vals = np.concatenate([v for _, (_y, v) in points])
+    cols = np.repeat(np.arange(len(points)), lengths)
+
+    first_year = years.min()
+    all_years = np.arange(first_year, years.max() + 1)
+    matrix = np.zeros((len(all_years), len(points)), dtype=np.int64)
+    matrix[years - first_year, cols] = vals
+    wide = pd.DataFrame(
+        matrix, index=pd.Index(all_years, name="year"), columns=pubids
+    )
+
+    # Long form keeps each article's own [first, last] year span
+    has = lengths > 0
+    starts = np.full(len(points), len(all_years))
+    ends = np.full(len(points), -1)
+    np.minimum.at(starts, cols, years - first_year)
+    np.maximum.at(ends, cols, years - first_year)
+    row_idx = np.arange(len(all_years))[:, None]
+    mask = (row_idx >= starts) & (row_idx <= ends) & has
+    r, c = np.nonzero(mask.T)  # article-major, years ascending
+    long = pd.DataFrame(
+        {
+            "year": all_years[c],
+            "cites": matrix[c, r],
+            "pubid": np.asarray(pubids, dtype=object)[r],
+        }
+    )
+    return long, wide
+
+
+# Full publication lists are memoized per scholar so that the get_num_*
+# helpers and predict_h_index share one paginated fetch.
+
+_PUB_MEMO: dict[str, tuple[float, pd.DataFrame]] = {}
+_PUB_MEMO_LOCK = threading.Lock()
+_PUB_MEMO_TTL = 3600.0
+
+_ACUNA_TOP_JOURNALS = [
+    "Nature",
+    "Science",
+    "Nature Neuroscience",
+    "Proceedings of the National Academy of Sciences",
+    "Neuron",
+]
+
+
+def set_publication_memo_ttl(seconds: float) -> None:
+    """Set how long memoized publication tables stay valid (0 disables)."""
+    global _PUB_MEMO_TTL
+    _PUB_MEMO_TTL = float(seconds)
+    if _PUB_MEMO_TTL <= 0:
+        clear_publication_memo()
+
+
+def clear_publication_memo(scholar_id: Optional[str] = None) -> None:
+    """Forget the memoized publication table for one scholar, or for all."""
+    with _PUB_MEMO_LOCK:
+        if scholar_id is None:
+            _PUB_MEMO.clear()
+        else:
+            _PUB_MEMO.pop(tidy_id(scholar_id), None)
+
+
+def _publication_table(
+    scholar_id: str, bundle: Optional[ScholarProfilePage] = None
+) -> pd.DataFrame:
+    """
+    Full citation-sorted publication list, memoized per scholar.
+
+    The frame is shared between callers and must not be modified.
+    """
+    scholar_id = tidy_id(scholar_id)
+    now = time.time()
+    with _PUB_MEMO_LOCK:
+        hit = _PUB_MEMO.get(scholar_id)
+    if hit is not None and now - hit[0] <= _PUB_MEMO_TTL:
+        return hit[1]
+
+    pubs = get_publications(scholar_id, bundle=bundle)
+    if _PUB_MEMO_TTL > 0:
+        with _PUB_MEMO_LOCK:
+            _PUB_MEMO[scholar_id] = (now, pubs)
+    return pubs
+
+
+def _publication_features(
+    pubs: pd.DataFrame, journals: Optional[list[str]] = None
+) -> tuple[int, Optional[int], int, int]:
+    """Article count, oldest year, distinct and top journals in one pass."""
+    if journals is None:
+        journals = _ACUNA_TOP_JOURNALS
+    if pubs.empty:
+        return 0, None, 0, 0
+    years = pubs["year"].dropna()
+    oldest = int(years.min()) if len(years) > 0 else None
+    journal = pubs["journal"]
+    return (
+        len(pubs),
+        oldest,
+        int(journal.nunique()),
+        int(journal.isin(journals).sum()),
+    )
+
+
+@_instrumented
+def get_num_articles(scholar_id: str) -> int:
+    """Return the number of publications for a scholar."""
+    return len(_publication_table(scholar_id))
+
+
+@_instrumented
+def get_oldest_article(scholar_id: str) -> Optional[int]:
+    """Return the year of the oldest publication."""
+    return _publication_features(_publication_table(scholar_id))[1]
+
+
+@_instrumented
+def get_num_distinct_journals(scholar_id: str) -> int:
+    """Return the number of distinct journals a scholar has published in."""
+    return _publication_features(_publication_table(scholar_id))[2]
+
+
+@_instrumented
+def get_num_top_journals(
+    scholar_id: str,
+    journals: Optional[list[str]] = None,
+) -> int:
+    """
+    Return number of publications in top journals.
+
+    Default journal list follows Acuna et al. (Nature, Science,
+    Nature Neuroscience, PNAS, Neuron).
+    """
+    pubs = _publication_table(scholar_id)
+    return _publication_features(pubs, journals)[3]
+
+
+# ---------------------------------------------------------------------------
+# Publication details  (mirrors R: get_publication_*)
+# ---------------------------------------------------------------------------
+
+
+def _get_publication_page(
+    scholar_id: str, pub_id: str, region: Optional[str] = None
+) -> _Node:
+    """Fetch the detail page for a single publication (or one region of it)."""
+    scholar_id = tidy_id(scholar_id)
+    return _parse_html(_publication_page_url(scholar_id, pub_id), region)
+
+
+@_instrumented
+def get_publication_abstract(scholar_id: str, pub_id: str) -> str:
+    """Return the abstract text for a publication."""
+    page = _get_publication_page(scholar_id, pub_id, region="abstract")
+    return _parse_publication_abstract(page)
+
+
+def _parse_publication_abstract(page: _Node) -> str:
+    el = page.select_one("div.gsh_csp")
+    return el.text.strip() if el else ""
+
+
+@_instrumented
+def get_publication_url(scholar_id: str, pub_id: str) -> str:
+    """Return the URL to the full publication."""
+    page = _get_publication_page(scholar_id, pub_id, region="title")
+    return _parse_publication_link(page)
+
+
+def _parse_publication_link(page: _Node) -> str:
+    el = page.select_one("a.gsc_oci_title_link")
+    return el["href"] if el else ""
+
+
+@_instrumented
+def get_publication_date(scholar_id: str, pub_id: str) -> str:
+    """Return the publication date string."""
+    page = _get_publication_page(scholar_id, pub_id, region="fields")
+    for field, value in _parse_publication_fields(page).items():
+        if "publication date" in field.lower():
+            return value
+    return ""
+
+
+@_instrumented
+def get_publication_data_extended(scholar_id: str, pub_id: str) -> dict:
+    """Return all metadata fields for a publication as a dict."""
+    page = _get_publication_page(scholar_id, pub_id)
+    return _parse_publication_fields(page)
+
+
+def _parse_publication_fields(page: _Node) -> dict:
+    """Pair each `gsc_oci_field` label with its `gsc_oci_value` text."""
+    fields = page.select("div.gsc_oci_field")
+    values = page.select("div.gsc_oci_value")
+    return {f.text.strip(): v.text.strip() for f, v in zip(fields, values)}
+
+
+def get_article_scholar_url(scholar_id: str, pubid: str) -> str:
+    """Return the Google Scholar URL for an article's detail page."""
+    return _publication_page_url(tidy_id(scholar_id), pubid)
+
+
+@_instrumented
+def get_complete_authors(
+    scholar_id: str,
+    pubid: str | list[str],
+    delay: Optional[float] = None,
+    initials: bool = True,
+) -> str | list[str]:
+    """
+    Get the complete author list for one or more publications.
+
+    Parameters
+    ----------
+    scholar_id : str
+    pubid : str or list of str
+    delay : float or None — if given, fetch one at a time with this average
+        delay between requests (jittered ± 0.5s); by default pages are
+        fetched concurrently, paced by the shared rate limiter
+    initials : bool — abbreviate first/middle names
+
+    Returns
+    -------
+    str or list of str
+    """
+    scholar_id = tidy_id(scholar_id)
+    single = isinstance(pubid, str)
+    pubids = [pubid] if single else list(pubid)
+
+    def _one(pid: str) -> str:
+        url = _publication_page_url(scholar_id, pid)
+        text = _parse_complete_authors(_parse_html(url, region="fields"))
+        return _to_initials(text) if initials else text
+
+    if delay is None:
+        results = _map_concurrent(_one, pubids)
+    else:
+        results = []
+        for i, pid in enumerate(pubids):
+            if i > 0:
+                jitter = max(0, delay + (np.random.random() - 0.5))
+                time.sleep(jitter)
+            results.append(_one(pid))
+
+    return results[0] if single else results
+
+
+@_instrumented
+def get_publication_details(
+    scholar_id: str,
+    pubids: str | list[str],
+    resume_from: Optional[pd.DataFrame] = None,
+) -> pd.DataFrame:
+    """
+    Fetch each publication's detail page once and return every field.
+
+    Pages are fetched concurrently under the shared rate limiter.  A page
+    that fails does not abort the batch: its row has the message in the
+    `error` column.  Pass a previous result as `resume_from` to keep its
+    successful rows and only fetch the rest.
+
+    Returns
+    -------
+    DataFrame with one row per pubid (input order): pubid, title, url,
+    one snake_case column per `gsc_oci_field` (authors, publication_date,
+    journal, ..., description holds the abstract), and error.
+    """
+    scholar_id = tidy_id(scholar_id)
+    pubids = [pubids] if isinstance(pubids, str) else list(pubids)
+
+    done: dict[str, dict] = {}
+    if resume_from is not None and not resume_from.empty:
+        ok = resume_from
+        if "error" in ok.columns:
+            ok = ok[ok["error"].isna()]
+        done = {row["pubid"]: row for row in ok.to_dict("records")}
+
+    def _one(pid: str) -> dict:
+        page = _parse_html(_publication_page_url(scholar_id, pid))
+        return {"pubid": pid, **_parse_publication_details(page)}
+
+    todo = [pid for pid in dict.fromkeys(pubids) if pid not in done]
+    for pid, row in zip(todo, _map_concurrent(_one, todo, return_exceptions=True)):
+        if isinstance(row, Exception):
+            row = {"pubid": pid, "error": f"{type(row).__name__}: {row}"}
+        done[pid] = row
+
+    df = pd.DataFrame([done[pid] for pid in pubids])
+    if "error" not in df.columns:
+        df["error"] = None
+    return df[[c for c in df.columns if c != "error"] + ["error"]]
+
+
+def _parse_publication_details(page: _Node) -> dict:
+    """Title, link and every metadata field of a detail page, snake_cased."""
+    title_el = page.select_one("a.gsc_oci_title_link") or page.select_one(
+        "#gsc_oci_title"
+    )
+    details = {
+        "title": title_el.text.strip() if title_el else "",
+        "url": _parse_publication_link(page),
+    }
+    for field, value in _parse_publication_fields(page).items():
+        key = re.sub(r"\W+", "_", field.lower()).strip("_")
+        details[key] = value
+    return details
+
+
+def _parse_complete_authors(page: _Node) -> str:
+    """The first metadata value on a detail page is the full author list."""
+    el = page.select_one(".gsc_oci_value")
+    return el.text.strip() if el else ""
+
+
+def _to_initials(author_str: str) -> str:
+    """Abbreviate first/middle names: "Jane Q Doe" -> "JQ Doe"."""
+    authors = [a.strip() for a in author_str.split(",")]
+    formatted = []
+    for author in authors:
+        parts = author.split()
+        if not parts:
+            continue
+        last = parts[-1]
+        firsts = "".join(p[0] for p in parts[:-1] if p)
+        formatted.append(f"{firsts} {last}".strip())
+    return ", ".join(formatted)
+
+
+# ---------------------------------------------------------------------------
+# Citation history  (mirrors R: get_citation_history)
+# ---------------------------------------------------------------------------
+
+
+@_instrumented
+def get_citation_history(
+    scholar_id: str, bundle: Optional[ScholarProfilePage] = None
+) -> pd.DataFrame:
+    """
+    Get annual citation counts for a scholar (past ~12 years).
+
+    Returns DataFrame with columns: year, cites.
+    Pass a bundle from get_profile_bundle() to skip the fetch.
+    """
+    scholar_id = tidy_id(scholar_id)
+    if _check_bundle(bundle, scholar_id):
+        return bundle.citation_history.copy()
+    url = (
+        f"{_SCHOLAR_SITE}/citations?hl=en&user={scholar_id}"
+        f"&pagesize=100&view_op=list_works"
+    )
+    return _parse_citation_history(_parse_html(url, region="citation_history"))
+
+
+def _parse_citation_history(page: _Node) -> pd.DataFrame:
+    """Extract the yearly citation bar chart from a profile page."""
+    years = [
+        int(s.text) for s in page.select("span.gsc_g_t") if s.text.isdigit()
+    ]
+    vals = [
+        int(s.text) for s in page.select("span.gsc_g_al") if s.text.isdigit()
+    ]
+
+    if len(years) > len(vals):
+        # Some years have zero citations — use z-index to map
+        style_tags = page.select("a.gsc_g_a")
+        allvals = [0] * len(years)
+        for tag in style_tags:
+            style = tag.get("style", "")
+            m = re.search(r"z-index:(\d+)", style)
+            if m:
+                z = int(m.group(1))
+                al = tag.select_one(".gsc_g_al")
+                if al and z <= len(allvals):
+                    allvals[z - 1] = int(al.text)
+        vals = list(reversed(allvals))
+
+    # Truncate to same length
+    n = min(len(years), len(vals))
+    return pd.DataFrame({"year": years[:n], "cites": vals[:n]})
+
+
+# ---------------------------------------------------------------------------
+# Profile bundle  (one fetch for profile, history, coauthors, publications)
+# ---------------------------------------------------------------------------
+
+
+class ScholarProfilePage:
+    """
+    Everything on a scholar's `pagesize=100` profile page, parsed once.
+
+    Attributes
+    ----------
+    scholar_id : str
+    url : str — the page that was fetched
+    profile : dict — as returned by get_profile()
+    coauthors : DataFrame — as returned by _list_coauthors(), all listed
+    citation_history : DataFrame — as returned by get_citation_history()
+    publications : DataFrame — the first 100 rows of get_publications()
+    """
+
+    def __init__(self, scholar_id: str, page: _Node, url: str):
+        self.scholar_id = scholar_id
+        self.url = url
+        self.profile = _parse_profile(page, scholar_id)
+        self.coauthors = _parse_coauthors(page, scholar_id)
+        self.citation_history = _parse_citation_history(page)
+        self.publications = _publication_frame(_parse_publication_columns(page))
+
+    def __repr__(self) -> str:
+        return (
+            f"ScholarProfilePage({self.scholar_id!r}, "
+            f"name={self.profile['name']!r}, "
+            f"publications={len(self.publications)})"
+        )
+
+
+@_instrumented
+def get_profile_bundle(scholar_id: str) -> ScholarProfilePage:
+    """
+    Fetch a scholar's profile page once and parse every section of it.
+
+    The result can be passed as `bundle=` to get_profile, get_publications,
+    get_citation_history and scholar_summary to avoid refetching.
+    """
+    scholar_id = tidy_id(scholar_id)
+    url = _publications_url(scholar_id, 0, 100, "citation")
+    return ScholarProfilePage(scholar_id, _parse_html(url), url)
+
+
+def _check_bundle(
+    bundle: Optional[ScholarProfilePage], scholar_id: str
+) -> bool:
+    """True if a bundle was supplied; raise if it belongs to someone else."""
+    if bundle is None:
+        return False
+    if bundle.scholar_id != scholar_id:
+        raise ValueError(
+            f"Bundle is for {bundle.scholar_id}, not {scholar_id}."
+        )
+    return True
+
+
+# ---------------------------------------------------------------------------
+# Comparing scholars  (mirrors R: compare.r)
+# ---------------------------------------------------------------------------
+
+
+@_instrumented
+def compare_scholars(
+    ids: list[str], pagesize: int = 100
+) -> pd.DataFrame:
+    """
+    Compare citation records of multiple scholars.
+
+    Returns DataFrame with: id, name, year, cites, total (cumulative).
+    """
+
+    def _one(sid: str) -> tuple[pd.DataFrame, str]:
+        # The bundle is the first publication page only at pagesize=100
+        if pagesize == 100:
+            bundle = get_profile_bundle(sid)
+            pubs = get_publications(sid, bundle=bundle)
+            return _yearly_citations(pubs, sid), bundle.profile["name"]
+        pubs = get_publications(sid, pagesize=pagesize)
+        return _yearly_citations(pubs, sid), get_profile(sid)["name"]
+
+    ids = [tidy_id(sid) for sid in ids]
+    return _combine_comparison(ids, _map_concurrent(_one, ids))
+
+
+def _yearly_citations(pubs: pd.DataFrame, sid: str) -> pd.DataFrame:
+    """Cites per publication year plus running total, for compare_scholars."""
+    yearly = (
+        pubs.dropna(subset=["year"])
+        .groupby("year")["cites"]
+        .sum()
+        .reset_index()
+    )
+    yearly["id"] = sid
+    yearly = yearly.sort_values("year")
+    yearly["total"] = yearly["cites"].cumsum()
+    return yearly
+
+
+def _combine_comparison(
+    ids: list[str], results: list[tuple[pd.DataFrame, str]]
+) -> pd.DataFrame:
+    frames = [yearly for yearly, _ in results]
+    names_map = {sid: name for sid, (_, name) in zip(ids, results)}
+    df = pd.concat(frames, ignore_index=True)
+    df["name"] = df["id"].map(names_map)
+    return df[["id", "name", "year", "cites", "total"]]
+
+
+@_instrumented
+def compare_scholar_careers(
+    ids: list[str], career: bool = True
+) -> pd.DataFrame:
+    """
+    Compare citation careers of multiple scholars.
+
+    If career=True, adds a career_year column relative to first citation year.
+    Returns DataFrame with: id, name, year, cites, (career_year).
+    """
+
+    def _one(sid: str) -> tuple[pd.DataFrame, str]:
+        bundle = get_profile_bundle(sid)
+        hist = get_citation_history(sid, bundle=bundle)
+        hist["id"] = sid
+        if career and len(hist) > 0:
+            hist["career_year"] = hist["year"] - hist["year"].min()
+        return hist, bundle.profile["name"]
+
+    ids = [tidy_id(sid) for sid in ids]
+    results = _map_concurrent(_one, ids)
+    frames = [hist for hist, _ in results]
+    names_map = {sid: name for sid, (_, name) in zip(ids, results)}
+
+    df = pd.concat(frames, ignore_index=True)
+    df["name"] = df["id"].map(names_map)
+    cols = ["id", "name", "year", "cites"]
+    if career:
+        cols.append("career_year")
+    return df[cols]
+
+
+# ---------------------------------------------------------------------------
+# Author position  (mirrors R: author_position)
+# ---------------------------------------------------------------------------
+
+
+# Names are compared after folding: lower case, accents stripped, dots and
+# other punctuation (except hyphens and apostrophes) turned into spaces.
+# A name matches on its last word, plus its first initial when both sides
+# have one ("J Smith" matches "JM Smith" and "John Smith", not "A Smith").
+# Author lists are folded as one block and searched with a single regex of
+# the targets' last names, so only entries that can match reach Python.
+
+_NAME_PUNCT = re.compile(r"[^\w\s'-]+")
+_COMBINING = re.compile("[\u0300-\u036f\u1ab0-\u1aff\u1dc0-\u1dff\u20d0-\u20ff]+")
+# What may precede a last name in its entry; group 1 is the first initial
+_ENTRY_HEAD = re.compile(r"[^\w'-]*(?:(\w).*[^\w'-])?")
+
+
+@lru_cache(maxsize=1024)
+def _fold_name(name: str) -> tuple[str, str]:
+    """(last name, first initial or "") of one folded author name."""
+    name = unicodedata.normalize("NFKD", name)
+    name = "".join(ch for ch in name if not unicodedata.combining(ch))
+    words = _NAME_PUNCT.sub(" ", name.lower()).split()
+    if not words:
+        return "", ""
+    return words[-1], words[0][0] if len(words) > 1 else ""
+
+
+def _fold_text(text: str) -> str:
+    """_fold_name's case and accent folding, applied to a whole text."""
+    if not text.isascii():
+        text = _COMBINING.sub("", unicodedata.normalize("NFKD", text))
+    return text.lower()
+
+
+@lru_cache(maxsize=64)
+def _last_name_pattern(lasts: tuple[str, ...]) -> re.Pattern:
+    """Regex for any of lasts as the last word of an entry in folded lists."""
+    names = "|".join(re.escape(x) for x in sorted(lasts, key=len, reverse=True))
+    return re.compile(
+        rf"({names})(?![\w'-])[^\w,\n]*(?=,|$)", re.MULTILINE
+    )
+
+
+def _name_variants(names: dict) -> pd.DataFrame:
+    """One row (key, last, v_initial) per name variant of each target."""
+    rows = []
+    for key, variants in names.items():
+        if isinstance(variants, str):
+            variants = [variants]
+        for variant in variants:
+            last, initial = _fold_name(variant.strip())
+            if last:
+                rows.append((key, last, initial))
+    return pd.DataFrame(rows, columns=["key", "last", "v_initial"])
+
+
+def _match_positions(
+    authors: pd.Series,
+    owners: np.ndarray,
+    variants: pd.DataFrame,
+    initials: bool = True,
+) -> pd.DataFrame:
+    """
+    Position of each paper's target author in its author list.
+
+    authors[i] is paper i's comma-separated author list and owners[i] the
+    key of the target to look for in it.
+    """
+    values = pd.Series(authors).to_numpy(dtype=object, na_value="").tolist()
+    n_papers = len(values)
+    # One line per paper; offsets into the folded block locate each entry
+    text = "\n".join(t if isinstance(t, str) else str(t) for t in values)
+    if text.count("\n") != max(n_papers - 1, 0):
+        text = "\n".join(
+            (t if isinstance(t, str) else str(t)).replace("\n", " ")
+            for t in values
+        )
+    text = _fold_text(text)
+    chars = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+    commas = np.flatnonzero(chars == ord(","))
+    lines = np.flatnonzero(chars == ord("\n")) + 1
+    starts = np.concatenate(([0], lines))[:n_papers]
+    ends = np.append(lines - 1, len(text))[:n_papers]
+    before = np.searchsorted(commas, starts)
+    n = np.searchsorted(commas, ends) - before + 1
+
+    # Only entries ending in a target's last name can match
+    allowed: dict[tuple, set] = {}
+    for key, last, v_initial in variants.itertuples(index=False):
+        allowed.setdefault((key, last), set()).add(v_initial)
+    lasts = tuple(variants["last"].unique())
+    found = (
+        [(m.start(), m.group(1)) for m in _last_name_pattern(lasts).finditer(text)]
+        if lasts
+        else []
+    )
+    at = np.array([f[0] for f in found], dtype=np.int64)
+    entry = np.searchsorted(commas, at)
+    paper = np.searchsorted(starts, at, side="right") - 1
+    begin = np.maximum(starts[paper], np.append(-1, commas)[entry] + 1)
+    # Check each candidate's owner, whole last name and first initial
+    keep = np.zeros(len(found), dtype=bool)
+    for k, ((end, last), start, p) in enumerate(
+        zip(found, begin.tolist(), paper.tolist())
+    ):
+        v_initials = allowed.get((owners[p], last))
+        head = _ENTRY_HEAD.fullmatch(text, start, end) if v_initials else None
+        if head is None:
+            continue
+        initial = head.group(1)
+        keep[k] = (
+            not initials or not initial or "" in v_initials or initial in v_initials
+        )
+    # Only a single match is a position; two namesakes are ambiguous
+    hit_papers, counts = np.unique(paper[keep], return_counts=True)
+    unique_hit = np.isin(paper, hit_papers[counts == 1]) & keep
+    pos = np.zeros(n_papers, dtype=np.int64)
+    pos[paper[unique_hit]] = (entry - before[paper] + 1)[unique_hit]
+
+    truncated = np.zeros(n_papers, dtype=bool)
+    dots = [m.start() for m in re.finditer(r"\.\.\.", text)]
+    truncated[np.searchsorted(starts, dots, side="right") - 1] = True
+    with np.errstate(divide="ignore", invalid="ignore"):
+        norm = np.where(n == 1, 1.0, (pos - 1) / (n - 1))
+    norm[(pos == 0) | truncated] = np.nan
+
+    return pd.DataFrame(
+        {
+            "authors": pd.Series(authors).reset_index(drop=True),
+            "position": pd.arrays.IntegerArray(pos.astype(np.int32), pos == 0),
+            "n_authors": pd.arrays.IntegerArray(n.astype(np.int32), truncated),
+            "position_normalized": norm,
+        }
+    )
+
+
+def author_position(
+    author_lists: list[str] | pd.Series,
+    author_name: str | list[str],
+    initials: bool = True,
+) -> pd.DataFrame:
+    """
+    Find the position of an author in each publication's author list.
+
+    Parameters
+    ----------
+    author_lists : list of str — e.g. from get_publications()['author']
+    author_name : str or list of str — the author to search for, or
+        several spellings of their name ("J Smith", "Smith-Jones", ...);
+        matched on the whole last name, ignoring case and accents
+    initials : bool — also require the first initial to agree when both
+        names have one
+
+    Returns
+    -------
+    DataFrame with: authors, position (1-indexed), n_authors,
+    position_normalized (0=first, 1=last, NaN if unknown).  Lists that are
+    cut short with "..." have no n_authors; lists where the name matches
+    no or several authors have no position.
+    """
+    authors = pd.Series(author_lists, dtype=object)
+    variants = _name_variants({0: author_name})
+    owners = np.zeros(len(authors), dtype=np.int64)
+    return _match_positions(authors, owners, variants, initials)
+
+
+def author_positions(
+    pubs: pd.DataFrame,
+    names: dict[str, str | list[str]],
+    initials: bool = True,
+) -> pd.DataFrame:
+    """
+    author_position() for many scholars' publications in one pass.
+
+    Parameters
+    ----------
+    pubs : DataFrame — publications with `id` and `author` columns, e.g.
+        from CrawlJob.publications() or load_scholar_dataset()
+    names : dict — scholar ID -> name or list of name variants; each paper
+        is searched for its own scholar's names
+    initials : bool — as for author_position()
+
+    Returns
+    -------
+    DataFrame with: id, pubid (if pubs has it), authors, position,
+    n_authors, position_normalized; one row per paper, in pubs order.
+    """
+    variants = _name_variants(names)
+    owners = pubs["id"].to_numpy(dtype=object)
+    out = _match_positions(pubs["author"], owners, variants, initials)
+    if "pubid" in pubs.columns:
+        out.insert(0, "pubid", pubs["pubid"].to_numpy())
+    out.insert(0, "id", owners)
+    return out
+
+
+def authorship_shares(positions: pd.DataFrame) -> pd.DataFrame:
+    """
+    First- and last-author counts and shares per scholar.
+
+    Takes the output of author_positions() (or author_position(), treated
+    as one scholar).  Returns DataFrame with: [id,] n_papers, n_matched,
+    first_author, last_author, first_share, last_share, mean_position
+    (mean position_normalized).  Shares are over matched papers; a sole
+    author counts as first and last.
+    """
+    pos = positions["position"]
+    first = (pos == 1).to_numpy(dtype=bool, na_value=False)
+    last = (pos == positions["n_authors"]).to_numpy(dtype=bool, na_value=False)
+    frame = pd.DataFrame(
+        {
+            "id": positions["id"].to_numpy() if "id" in positions.columns else 0,
+            "matched": pos.notna().to_numpy(),
+            "first": first,
+            "last": last,
+            "norm": positions["position_normalized"].to_numpy(),
+        }
+    )
+    grouped = frame.groupby("id", sort=False)
+    out = pd.DataFrame(
+        {
+            "n_papers": grouped.size(),
+            "n_matched": grouped["matched"].sum(),
+            "first_author": grouped["first"].sum(),
+            "last_author": grouped["last"].sum(),
+        }
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out["first_share"] = out["first_author"] / out["n_matched"]
+        out["last_share"] = out["last_author"] / out["n_matched"]
+    out["mean_position"] = grouped["norm"].mean()
+    out = out.reset_index()
+    if "id" not in positions.columns:
+        out = out.drop(columns="id")
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Citation metrics
+# ---------------------------------------------------------------------------
+# Computed locally from publication tables, so they work on any subset of
+# papers (a year range, selected venues) and on many scholars at once: one
+# lexsort orders every scholar's cites, and each paper's within-scholar
+# rank is compared against its cites (h) or running cite sum (g).
+
+_METRIC_COLUMNS = [
+    "n_papers",
+    "total_cites",
+    "h_index",
+    "g_index",
+    "i10_index",
+    "first_year",
+    "m_quotient",
+]
+
+
+def _index_metrics(
+    groups: np.ndarray, cites: np.ndarray, n_groups: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """h, g and i10 index per group; groups are codes 0..n_groups-1."""
+    order = np.lexsort((-cites, groups))
+    grp = groups[order]
+    c = cites[order]
+    counts = np.bincount(groups, minlength=n_groups)
+    starts = np.cumsum(counts) - counts
+    rank = np.arange(len(c)) - starts[grp] + 1
+
+    # Both conditions hold on a prefix of each group's descending cites,
+    # so counting the rows that satisfy them gives the index.
+    total = np.cumsum(c)
+    before = (total - c)[starts[grp]]
+    h = np.bincount(grp, weights=c >= rank, minlength=n_groups)
+    g = np.bincount(grp, weights=total - before >= rank * rank, minlength=n_groups)
+    i10 = np.bincount(groups, weights=cites >= 10, minlength=n_groups)
+    return h.astype(np.int64), g.astype(np.int64), i10.astype(np.int64)
+
+
+def citation_metrics(
+    pubs: pd.DataFrame,
+    published_since: Optional[int] = None,
+    exclude_journals: Optional[list[str]] = None,
+    current_year: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    h-index, g-index, i10-index and m-quotient from a publication table.
+
+    Parameters
+    ----------
+    pubs : DataFrame — from get_publications(); with an `id` column (as
+        from CrawlJob.publications() or load_scholar_dataset()) metrics
+        are computed per scholar
+    published_since : int — only count papers published in or after this
+        year (papers without a year are left out)
+    exclude_journals : list of str — leave out papers in these venues
+    current_year : int — for the m-quotient; defaults to this year
+
+    Returns
+    -------
+    DataFrame with: [id,] n_papers, total_cites, h_index, g_index,
+    i10_index, first_year, m_quotient (h-index per year since the first
+    counted paper, NaN without a dated paper).
+    """
+    if current_year is None:
+        import datetime
+
+        current_year = datetime.datetime.now().year
+
+    keep = np.ones(len(pubs), dtype=bool)
+    if published_since is not None:
+        keep &= (pubs["year"] >= published_since).to_numpy(
+            dtype=bool, na_value=False
+        )
+    if exclude_journals:
+        keep &= ~pubs["journal"].isin(exclude_journals).to_numpy(dtype=bool)
+
+    if "id" in pubs.columns:
+        codes, ids = pd.factorize(pubs["id"])
+    else:
+        codes, ids = np.zeros(len(pubs), dtype=np.int64), None
+    n_groups = len(ids) if ids is not None else 1
+    groups = codes[keep]
+    cites = pubs["cites"].to_numpy(dtype=np.int64, na_value=0)[keep]
+    years = pubs["year"].to_numpy(dtype=np.float64, na_value=np.nan)[keep]
+
+    h, g, i10 = _index_metrics(groups, cites, n_groups)
+    first = np.full(n_groups, np.inf)
+    dated = ~np.isnan(years)
+    np.minimum.at(first, groups[dated], years[dated])
+    first[np.isinf(first)] = np.nan
+    with np.errstate(invalid="ignore"):
+        m = h / (current_year - first + 1)
+
+    out = pd.DataFrame(
+        {
+            "n_papers": np.bincount(groups, minlength=n_groups),
+            "total_cites": np.bincount(groups, weights=cites, minlength=n_groups)
+            .astype(np.int64),
+            "h_index": h,
+            "g_index": g,
+            "i10_index": i10,
+            "first_year": pd.array(first, dtype="Int32"),
+            "m_quotient": m,
+        }
+    )
+    if ids is not None:
+        out.insert(0, "id", np.asarray(ids, dtype=object))
+    return out
+
+
+@_instrumented
+def get_citation_metrics(
+    scholar_ids: list[str] | str,
+    published_since: Optional[int] = None,
+    exclude_journals: Optional[list[str]] = None,
+) -> pd.DataFrame:
+    """
+    citation_metrics() for one or more scholars.
+
+    Publication lists come from the shared memo and are fetched
+    concurrently.  Returns one row per scholar, with an `id` column.
+    """
+    if isinstance(scholar_ids, str):
+        scholar_ids = [scholar_ids]
+    ids = list(dict.fromkeys(tidy_id(sid) for sid in scholar_ids))
+    tables = _map_concurrent(_publication_table, ids)
+    frames = [pubs.assign(id=sid) for sid, pubs in zip(ids, tables)]
+    if not frames:
+        return pd.DataFrame(columns=["id"] + _METRIC_COLUMNS)
+    pubs = pd.concat(frames, ignore_index=True)
+    out = citation_metrics(pubs, published_since, exclude_journals)
+    # Scholars with no publications at all still get a row
+    return (
+        out.set_index("id")
+        .reindex(ids)
+        .fillna({c: 0 for c in _METRIC_COLUMNS[:5]})
+        .astype({c: np.int64 for c in _METRIC_COLUMNS[:5]})
+        .rename_axis("id")
+        .reset_index()
+    )
+
+
+def windowed_h_index(
+    histories: pd.DataFrame,
+    since: int,
+    until: Optional[int] = None,
+) -> int | pd.Series:
+    """
+    h-index counting only citations received in [since, until].
+
+    This is Scholar's "h-index since <year>", computed from per-article
+    citation histories instead of read off the profile.
+
+    Parameters
+    ----------
+    histories : DataFrame — the long frame from
+        get_all_article_cite_histories() (year, cites, pubid), optionally
+        with an `id` column for several scholars; or its wide year x pubid
+        matrix
+    since, until : int — inclusive year range (until defaults to the last
+        year present)
+
+    Returns
+    -------
+    int, or a Series of h-index by id when histories has an `id` column.
+    """
+    if "pubid" not in histories.columns:
+        window = histories.loc[since:until] if until is not None else histories.loc[since:]
+        cites = window.to_numpy(dtype=np.int64).sum(axis=0)
+        h, _, _ = _index_metrics(np.zeros(len(cites), dtype=np.int64), cites, 1)
+        return int(h[0])
+
+    years = histories["year"].to_numpy(dtype=np.int64)
+    keep = years >= since
+    if until is not None:
+        keep &= years <= until
+    sub = histories[keep]
+    keys = ["id", "pubid"] if "id" in histories.columns else ["pubid"]
+    per_article = sub.groupby(keys, sort=False)["cites"].sum()
+    cites = per_article.to_numpy(dtype=np.int64)
+    if "id" not in histories.columns:
+        h, _, _ = _index_metrics(np.zeros(len(cites), dtype=np.int64), cites, 1)
+        return int(h[0])
+
+    ids = pd.unique(histories["id"])
+    group_of = pd.Index(ids).get_indexer(per_article.index.get_level_values("id"))
+    h, _, _ = _index_metrics(group_of, cites, len(ids))
+    return pd.Series(h, index=pd.Index(ids, name="id"), name="h_index")
+
+
+# ---------------------------------------------------------------------------
+# Predict h-index  (mirrors R: predict.r)
+# ---------------------------------------------------------------------------
+
+
+# Regression coefficients from Acuna et al., one row per year ahead (1-10),
+# applied to [1, sqrt(n_articles), h_index, career_years, distinct_journals,
+# top_journals].
+_ACUNA_COEFS = np.array(
+    [
+        [0.760, 0.373, 0.967, -0.069, 0.018, 0.033],
+        [1.413, 0.781, 0.936, -0.132, 0.018, 0.064],
+        [2.227, 1.105, 0.903, -0.193, 0.027, 0.096],
+        [3.196, 1.386, 0.871, -0.274, 0.039, 0.145],
+        [3.997, 1.578, 0.858, -0.345, 0.063, 0.198],
+        [4.752, 1.671, 0.817, -0.377, 0.117, 0.282],
+        [5.741, 1.761, 0.761, -0.420, 0.170, 0.394],
+        [6.531, 1.796, 0.669, -0.420, 0.252, 0.508],
+        [7.482, 1.653, 0.561, -0.415, 0.383, 0.629],
+        [8.734, 1.326, 0.478, -0.411, 0.522, 0.823],
+    ]
+)
+
+_H_FEATURE_COLUMNS = [
+    "h_index",
+    "n_articles",
+    "career_years",
+    "distinct_journals",
+    "top_journals",
+]
+
+
+def _acuna_trajectories(features: np.ndarray) -> np.ndarray:
+    """(N, 11) h-index trajectories, years 0-10, from (N, 5) feature rows."""
+    features = np.asarray(features, dtype=np.float64).reshape(-1, 5)
+    h, n, y, j, q = features.T
+    x = np.column_stack([np.ones(len(h)), np.sqrt(n), h, y, j, q])
+    return np.column_stack([h, x @ _ACUNA_COEFS.T])
+
+
+def _h_index_feature_row(
+    scholar_id: str, journals: Optional[list[str]], current_year: int
+) -> list:
+    """The model inputs of one scholar, then their papers per journal."""
+    bundle = get_profile_bundle(scholar_id)
+    pubs = _publication_table(scholar_id, bundle=bundle)
+    n, oldest, j, q = _publication_features(pubs, journals or None)
+    y = current_year - oldest if oldest else 0
+    counts = pubs["journal"].value_counts(sort=False)
+    return [bundle.profile["h_index"], n, y, j, q, counts[counts > 0].to_dict()]
+
+
+@_instrumented
+def predict_h_index(
+    scholar_id: str,
+    journals: Optional[list[str]] = None,
+) -> pd.DataFrame:
+    """
+    Predict future h-index using Acuna et al. (Nature 489, 201-202, 2012).
+
+    Calibrated on neuroscience data — use with caution for other fields.
+
+    Returns DataFrame with: years_ahead (0-10), h_index.
+    """
+    scholar_id = tidy_id(scholar_id)
+    import datetime
+
+    current_year = datetime.datetime.now().year
+    row = _h_index_feature_row(scholar_id, journals, current_year)
+    h_vals = _acuna_trajectories(row[:5])[0]
+
+    if any(np.diff(h_vals) < 0):
+        warnings.warn(
+            "Decreasing h-values predicted. "
+            "Model calibrated on neuroscientists — results may not apply."
+        )
+    if any(h_vals < 0):
+        warnings.warn("Negative h-values predicted. See above warning.")
+
+    return pd.DataFrame(
+        {"years_ahead": list(range(11)), "h_index": h_vals}
+    )
+
+
+@_instrumented
+def get_h_index_features(
+    ids: list[str],
+    journals: Optional[list[str]] = None,
+) -> pd.DataFrame:
+    """
+    The Acuna et al. model inputs for many scholars, gathered concurrently.
+
+    Returns DataFrame with: id, h_index, n_articles, career_years,
+    distinct_journals, top_journals, journal_counts (dict of journal ->
+    papers, from which top_journals can be recounted for another list).
+    Scholars whose pages cannot be fetched are left out with a warning.
+    Pass the result to predict_h_index_batch(features=...) to predict
+    again without fetching.
+    """
+    import datetime
+
+    current_year = datetime.datetime.now().year
+    ids = list(dict.fromkeys(tidy_id(sid) for sid in ids))
+    rows = _map_concurrent(
+        lambda sid: _h_index_feature_row(sid, journals, current_year),
+        ids,
+        return_exceptions=True,
+    )
+    failed = [sid for sid, row in zip(ids, rows) if isinstance(row, Exception)]
+    if failed:
+        warnings.warn(
+            f"Could not gather h-index features for {len(failed)} scholars: "
+            + ", ".join(failed)
+        )
+    kept = [(sid, row) for sid, row in zip(ids, rows) if sid not in failed]
+    features = pd.DataFrame(
+        [row for _, row in kept], columns=[*_H_FEATURE_COLUMNS, "journal_counts"]
+    )
+    features = features.astype(dict.fromkeys(_H_FEATURE_COLUMNS, np.int64))
+    features.insert(0, "id", [sid for sid, _ in kept])
+    return features
+
+
+@_instrumented
+def predict_h_index_batch(
+    ids: Optional[list[str]] = None,
+    journals: Optional[list[str]] = None,
+    features: Optional[pd.DataFrame] = None,
+) -> pd.DataFrame:
+    """
+    predict_h_index() for many scholars with one matrix multiply.
+
+    Parameters
+    ----------
+    ids : list of str — scholars to predict; features are gathered with
+        get_h_index_features()
+    journals : list of str — top-journal list (Acuna et al.'s when None
+        or empty, as for predict_h_index())
+    features : DataFrame — from get_h_index_features(), used instead of
+        fetching.  top_journals is recounted for `journals` from its
+        journal_counts column, whatever list the features were built with.
+
+    Returns
+    -------
+    Long DataFrame with: id, years_ahead (0-10), h_index, decreasing,
+    negative.  The two flags mark scholars whose trajectory falls at some
+    step or goes below zero, where predict_h_index() would warn.
+    """
+    if features is None:
+        if ids is None:
+            raise ValueError("Provide ids or features.")
+        features = get_h_index_features(ids, journals)
+    else:
+        if "journal_counts" not in features.columns:
+            raise ValueError(
+                "features has no journal_counts column to recount top "
+                "journals from; gather it with get_h_index_features()."
+            )
+        top = set(journals or _ACUNA_TOP_JOURNALS)
+        features = features.copy()
+        features["top_journals"] = [
+            sum(counts.get(name, 0) for name in top)
+            for counts in features["journal_counts"]
+        ]
+
+    traj = _acuna_trajectories(features[_H_FEATURE_COLUMNS].to_numpy())
+    decreasing = (np.diff(traj, axis=1) < 0).any(axis=1)
+    negative = (traj < 0).any(axis=1)
+    steps = traj.shape[1]
+    return pd.DataFrame(
+        {
+            "id": np.repeat(features["id"].to_numpy(dtype=object), steps),
+            "years_ahead": np.tile(np.arange(steps), len(traj)),
+            "h_index": traj.ravel(),
+            "decreasing": np.repeat(decreasing, steps),
+            "negative": np.repeat(negative, steps),
+        }
+    )
+
+
+# ---------------------------------------------------------------------------
+# Co-authors & network  (mirrors R: coauthors.R)
+# ---------------------------------------------------------------------------
+
+
+def _list_coauthors(
+    scholar_id: str,
+    n_coauthors: int = 5,
+    bundle: Optional[ScholarProfilePage] = None,
+) -> pd.DataFrame:
+    """List coauthors shown on a scholar's profile page."""
+    scholar_id = tidy_id(scholar_id)
+    if not scholar_id or scholar_id == "nan":
+        return pd.DataFrame(
+            columns=["author", "author_url", "coauthors", "coauthors_url"]
+        )
+    if _check_bundle(bundle, scholar_id):
+        return bundle.coauthors.head(n_coauthors).reset_index(drop=True)
+
+    page = _parse_html(_profile_url(scholar_id))
+    return _parse_coauthors(page, scholar_id, n_coauthors)
+
+
+def _parse_coauthors(
+    page: _Node, scholar_id: str, n_coauthors: Optional[int] = None
+) -> pd.DataFrame:
+    """Extract the coauthor sidebar of a profile page as an edge list."""
+    url = _profile_url(scholar_id)
+    author_el = page.select_one("#gsc_prf_in")
+    author_name = author_el.text.strip() if author_el else ""
+
+    ca_links = page.select("a[tabindex='-1']")
+    records = []
+    for i, a_tag in enumerate(ca_links[:n_coauthors]):
+        ca_name = a_tag.text.strip()
+        ca_href = a_tag.get("href", "")
+        if "Sort by" in ca_name:
+            continue
+        records.append(
+            {
+                "author": author_name,
+                "author_url": url,
+                "coauthors": ca_name,
+                "coauthors_url": f"{_SCHOLAR_SITE}{ca_href}"
+                if ca_href.startswith("/")
+                else ca_href,
+            }
+        )
+
+    return pd.DataFrame(records) if records else pd.DataFrame(
+        columns=["author", "author_url", "coauthors", "coauthors_url"]
+    )
+
+
+@_instrumented
+def get_coauthors(
+    scholar_id: str, n_coauthors: int = 5, n_deep: int = 1
+) -> pd.DataFrame:
+    """
+    Get a network of co-authors.
+
+    Parameters
+    ----------
+    scholar_id : str
+    n_coauthors : int — how many coauthors to fetch per level
+    n_deep : int — depth of network exploration (1 recommended)
+
+    Returns
+    -------
+    DataFrame with columns: author, coauthors.
+    """
+    base = _list_coauthors(scholar_id, n_coauthors)
+    if base.empty:
+        return pd.DataFrame(columns=["author", "coauthors"])
+
+    all_frames = [base]
+    # A coauthor reached again is listed again, but not fetched again
+    seen: dict[str, Any] = {tidy_id(scholar_id): base}
+
+    current_urls = base["coauthors_url"].tolist()
+    for depth in range(n_deep):
+        ca_ids = [i for i in map(_grab_id, current_urls) if i]
+        new_ids = [i for i in dict.fromkeys(ca_ids) if i not in seen]
+        subs = _map_concurrent(
+            lambda ca_id: _list_coauthors(ca_id, n_coauthors),
+            new_ids,
+            return_exceptions=True,
+        )
+        seen.update(zip(new_ids, subs))
+        next_frames = [
+            seen[i] for i in ca_ids if not isinstance(seen[i], Exception)
+        ]
+        if not next_frames:
+            break
+        depth_df = pd.concat(next_frames, ignore_index=True)
+        all_frames.append(depth_df)
+        current_urls = depth_df["coauthors_url"].tolist()
+
+    return _tidy_coauthor_network(all_frames)
+
+
+def _tidy_coauthor_network(frames: list[pd.DataFrame]) -> pd.DataFrame:
+    """Stack per-profile coauthor frames into the get_coauthors() result."""
+    result = pd.concat(frames, ignore_index=True)
+    result = result[~result["coauthors"].str.contains("Sort by", na=False)]
+    result["author"] = result["author"].str.title()
+    result["coauthors"] = result["coauthors"].str.title()
+    return result[["author", "coauthors"]].reset_index(drop=True)
+
+
+# Breadth-first crawl of the coauthor graph.  Unlike get_coauthors(), every
+# scholar is fetched at most once, a whole BFS level is fetched concurrently,
+# and nodes are handed out as soon as their page is parsed.
+
+
+class CoauthorNode:
+    """
+    One scholar fetched by iter_coauthor_network().
+
+    Attributes
+    ----------
+    scholar_id : str
+    depth : int — hops from the starting scholar
+    profile : dict — as returned by get_profile(), None if the fetch failed
+    coauthor_ids : list of str — the coauthors kept as edges of this node
+    error : str — why the fetch failed, None otherwise
+    """
+
+    def __init__(
+        self,
+        scholar_id: str,
+        depth: int,
+        profile: Optional[dict] = None,
+        coauthor_ids: Optional[list[str]] = None,
+        error: Optional[str] = None,
+    ):
+        self.scholar_id = scholar_id
+        self.depth = depth
+        self.profile = profile
+        self.coauthor_ids = coauthor_ids or []
+        self.error = error
+
+    @property
+    def edges(self) -> list[tuple[str, str]]:
+        return [(self.scholar_id, ca_id) for ca_id in self.coauthor_ids]
+
+    def __repr__(self) -> str:
+        name = self.profile["name"] if self.profile else None
+        return (
+            f"CoauthorNode({self.scholar_id!r}, depth={self.depth}, "
+            f"name={name!r}, coauthors={len(self.coauthor_ids)})"
+        )
+
+
+def iter_coauthor_network(
+    scholar_id: str,
+    n_coauthors: int = 20,
+    max_depth: int = 2,
+    max_nodes: int = 200,
+    max_edges: Optional[int] = None,
+) -> Iterator[CoauthorNode]:
+    """
+    Crawl the coauthor graph breadth-first, yielding nodes as they finish.
+
+    Parameters
+    ----------
+    scholar_id : str — where to start (depth 0)
+    n_coauthors : int — coauthors followed per scholar (Scholar lists <= 20)
+    max_depth : int — deepest level fetched; scholars at this depth keep
+        their edges but their coauthors are not fetched
+    max_nodes : int — most profiles fetched in total
+    max_edges : int — stop once this many edges were produced
+
+    A level is fetched concurrently under the shared scheduler and its
+    nodes come out in completion order.  The next level keeps the order in
+    which coauthors were listed, so max_nodes cuts the graph the same way
+    on every run.  Failed fetches are yielded as nodes with `error` set.
+    """
+    root = tidy_id(scholar_id)
+    visited = {root}
+    level = [root]
+    fetched = n_edges = 0
+
+    def _fetch(sid: str) -> dict:
+        return _parse_profile(_parse_html(_profile_url(sid)), sid)
+
+    for depth in range(max_depth + 1):
+        level = level[: max(0, max_nodes - fetched)]
+        if not level:
+            return
+        done: dict[str, CoauthorNode] = {}
+        for sid, result in _iter_concurrent(_fetch, level):
+            fetched += 1
+            if isinstance(result, Exception):
+                node = CoauthorNode(
+                    sid, depth, error=f"{type(result).__name__}: {result}"
+                )
+            else:
+                ids = [c["id"] for c in result["coauthors"] if c["id"]]
+                ids = list(dict.fromkeys(ids))[:n_coauthors]
+                if max_edges is not None:
+                    ids = ids[: max(0, max_edges - n_edges)]
+                n_edges += len(ids)
+                node = CoauthorNode(sid, depth, result, ids)
+            done[sid] = node
+            yield node
+
+        if max_edges is not None and n_edges >= max_edges:
+            return
+        next_level = []
+        for sid in level:
+            for ca_id in done[sid].coauthor_ids:
+                if ca_id not in visited:
+                    visited.add(ca_id)
+                    next_level.append(ca_id)
+        level = next_level
+
+
+_NETWORK_NODE_FIELDS = [
+    "name",
+    "affiliation",
+    "total_cites",
+    "h_index",
+    "i10_index",
+    "fields",
+    "homepage",
+]
+
+
+@_instrumented
+def crawl_coauthor_network(
+    scholar_id: str,
+    n_coauthors: int = 20,
+    max_depth: int = 2,
+    max_nodes: int = 200,
+    max_edges: Optional[int] = None,
+    edge_file: Optional[str] = None,
+    graph=None,
+    progress: Optional[Callable[[CoauthorNode], None]] = None,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Crawl the coauthor graph breadth-first (see iter_coauthor_network).
+
+    Parameters
+    ----------
+    scholar_id, n_coauthors, max_depth, max_nodes, max_edges — as for
+        iter_coauthor_network()
+    edge_file : str — CSV (source,target) that each node's edges are
+        appended to as soon as it is fetched
+    graph : networkx graph — filled in as nodes arrive; fetched scholars
+        carry their profile fields and depth as node attributes
+    progress : callable — called with each CoauthorNode
+
+    Returns
+    -------
+    (nodes, edges): nodes has one row per fetched scholar with id, depth,
+    the profile fields (name, affiliation, total_cites, h_index, i10_index,
+    fields, homepage) and error; edges has source, target, source_name,
+    target_name, by scholar ID.
+    """
+    fh = None
+    if edge_file is not None:
+        edge_file = os.path.expanduser(edge_file)
+        new_file = not os.path.exists(edge_file) or os.path.getsize(edge_file) == 0
+        fh = open(edge_file, "a", encoding="utf-8", newline="")
+        if new_file:
+            fh.write("source,target\n")
+
+    node_rows: list[dict] = []
+    edge_rows: list[tuple[str, str]] = []
+    names: dict[str, str] = {}
+    try:
+        for node in iter_coauthor_network(
+            scholar_id, n_coauthors, max_depth, max_nodes, max_edges
+        ):
+            profile = node.profile or {}
+            fields = {f: profile.get(f) for f in _NETWORK_NODE_FIELDS}
+            node_rows.append(
+                {
+                    "id": node.scholar_id,
+                    "depth": node.depth,
+                    **fields,
+                    "error": node.error,
+                }
+            )
+            if node.profile is not None:
+                names[node.scholar_id] = profile["name"]
+                names.update(
+                    (c["id"], c["name"]) for c in profile["coauthors"]
+                    if c["id"] and c["id"] not in names
+                )
+            edge_rows.extend(node.edges)
+
+            if fh is not None:
+                fh.writelines(f"{s},{t}\n" for s, t in node.edges)
+                fh.flush()
+            if graph is not None:
+                graph.add_node(node.scholar_id, depth=node.depth, **fields)
+                graph.add_edges_from(node.edges)
+            if progress is not None:
+                progress(node)
+    finally:
+        if fh is not None:
+            fh.close()
+
+    nodes = pd.DataFrame(
+        node_rows, columns=["id", "depth", *_NETWORK_NODE_FIELDS, "error"]
+    )
+    edges = pd.DataFrame(edge_rows, columns=["source", "target"])
+    edges["source_name"] = edges["source"].map(names)
+    edges["target_name"] = edges["target"].map(names)
+    return nodes, edges
+
+
+def plot_coauthors(
+    network: pd.DataFrame,
+    size_labels: int = 10,
+    figsize: tuple = (12, 8),
+    max_nodes: int = 500,
+    k_core: Optional[int] = None,
+    layout: str = "spring",
+    max_labels: int = 60,
+):
+    """
+    Plot a co-author network graph.
+
+    Graphs with more than max_nodes nodes are cut down to their smallest
+    k-core that fits (or to the k_core given), then to the max_nodes
+    highest-degree nodes if that core is still too big.  Node size follows
+    closeness, estimated on large graphs (see network_centrality), only
+    the max_labels most central nodes are labelled, and layouts are cached
+    per edge set, so replotting the same network is fast.
+
+    Requires: pip install networkx matplotlib (plus scipy above 256 nodes)
+    """
+    import networkx as nx
+    import matplotlib.pyplot as plt
+
+    src_col, dst_col = _edge_columns(network)
+    G = nx.from_pandas_edgelist(network, src_col, dst_col)
+    G.remove_edges_from(nx.selfloop_edges(G))
+    title_note = ""
+    if k_core is None and G.number_of_nodes() > max_nodes:
+        cores = pd.Series(nx.core_number(G))
+        # Nodes in the k-core for each k, largest k first
+        core_sizes = cores.value_counts().sort_index(ascending=False).cumsum()
+        fits = core_sizes[core_sizes <= max_nodes]
+        k_core = int(fits.index.min()) if len(fits) else int(cores.max())
+    if k_core is not None:
+        G = nx.k_core(G, k_core)
+        title_note = f" ({k_core}-core, {G.number_of_nodes()} nodes)"
+    if G.number_of_nodes() > max_nodes:
+        # Even the densest core is too big: keep its best-connected nodes
+        degree = pd.Series(dict(G.degree()))
+        keep = degree.sort_values(ascending=False, kind="stable").index[:max_nodes]
+        title_note = title_note[:-1] + f", top {max_nodes} by degree)"
+        G = G.subgraph(keep).copy()
+
+    if G.number_of_nodes() <= 256:
+        closeness = nx.closeness_centrality(G)
+    else:
+        edges = pd.DataFrame(list(G.edges()), columns=["source", "target"])
+        cent = network_centrality(edges)
+        closeness = dict(zip(cent["id"], cent["closeness"]))
+
+    pos = _cached_layout(G, layout, seed=42)
+    sizes = [closeness.get(n, 0.1) * 3000 for n in G.nodes()]
+    top = sorted(G.nodes(), key=lambda n: closeness.get(n, 0.0), reverse=True)
+    labels = {n: n for n in top[:max_labels]}
+
+    fig, ax = plt.subplots(figsize=figsize)
+    nx.draw_networkx_edges(G, pos, alpha=0.3, ax=ax)
+    nx.draw_networkx_nodes(G, pos, node_size=sizes, alpha=0.5, ax=ax)
+    nx.draw_networkx_labels(G, pos, labels=labels, font_size=size_labels, ax=ax)
+
+    author_name = network[src_col].iloc[0] if len(network) > 0 else "Unknown"
+    ax.set_title(
+        f"Co-authorship Network of {author_name}{title_note}", fontsize=16
+    )
+    ax.axis("off")
+    plt.tight_layout()
+    return fig
+
+
+# ---------------------------------------------------------------------------
+# Coauthor network analytics
+# ---------------------------------------------------------------------------
+# Works on an edge list — get_coauthors() (author, coauthors) or
+# crawl_coauthor_network() (source, target) — through one scipy.sparse
+# adjacency matrix.  Shortest paths are run from a batch of BFS sources at
+# once (one sparse product per level); on graphs larger than `samples`
+# nodes closeness and betweenness are estimated from a random sample of
+# sources, below that they are exact.
+
+
+def _require_scipy():
+    try:
+        import scipy.sparse
+    except ImportError as exc:
+        raise ImportError(
+            "Network analytics need scipy: pip install scipy"
+        ) from exc
+    return scipy.sparse
+
+
+def _edge_columns(edges: pd.DataFrame) -> tuple[str, str]:
+    if {"source", "target"} <= set(edges.columns):
+        return "source", "target"
+    if {"author", "coauthors"} <= set(edges.columns):
+        return "author", "coauthors"
+    raise ValueError(
+        "Edge list needs source/target or author/coauthors columns."
+    )
+
+
+def _edges_key(pairs: pd.DataFrame) -> tuple[int, int, int]:
+    """Order-independent fingerprint of an undirected edge list."""
+    a = pairs.iloc[:, 0].astype(str).to_numpy()
+    b = pairs.iloc[:, 1].astype(str).to_numpy()
+    lo, hi = np.minimum(a, b), np.maximum(a, b)
+    h = pd.util.hash_pandas_object(
+        pd.DataFrame({"lo": lo, "hi": hi}), index=False
+    ).to_numpy()
+    return len(h), int(h.sum()), int(np.bitwise_xor.reduce(h)) if len(h) else 0
+
+
+class _CoauthorGraph:
+    """Symmetric 0/1 CSR adjacency of an edge list; self-loops dropped."""
+
+    def __init__(self, edges: pd.DataFrame):
+        sp = _require_scipy()
+        src_col, dst_col = _edge_columns(edges)
+        src = edges[src_col].astype(str).to_numpy()
+        dst = edges[dst_col].astype(str).to_numpy()
+        codes, nodes = pd.factorize(np.concatenate([src, dst]))
+        i, j = codes[: len(src)], codes[len(src):]
+        keep = i != j
+        i, j = i[keep], j[keep]
+        n = len(nodes)
+        adj = sp.csr_matrix(
+            (np.ones(2 * len(i)), (np.concatenate([i, j]), np.concatenate([j, i]))),
+            shape=(n, n),
+        )
+        adj.data[:] = 1.0  # repeated edges were summed
+        self.nodes = pd.Index(nodes, name="id")
+        self.adj = adj
+        self.degree = np.asarray(adj.sum(axis=1)).ravel()
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def bfs(self, sources: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Hop distances (-1 if unreachable) and shortest-path counts, (k, n)."""
+        k, n = len(sources), len(self)
+        rows = np.arange(k)
+        dist = np.full((k, n), -1, dtype=np.int32)
+        sigma = np.zeros((k, n))
+        dist[rows, sources] = 0
+        sigma[rows, sources] = 1.0
+        frontier = sigma.copy()
+        d = 0
+        while frontier.any():
+            d += 1
+            reach = (self.adj @ frontier.T).T
+            new = (reach > 0) & (dist < 0)
+            dist[new] = d
+            sigma[new] = reach[new]
+            frontier = np.where(new, reach, 0.0)
+        return dist, sigma
+
+    def source_batches(self, sources: np.ndarray) -> Iterator[np.ndarray]:
+        # Keep each (k, n) work array to a few tens of MB
+        size = max(1, min(256, (1 << 22) // max(len(self), 1)))
+        for start in range(0, len(sources), size):
+            yield sources[start : start + size]
+
+    def pagerank(
+        self,
+        alpha: float = 0.85,
+        personalization: Optional[np.ndarray] = None,
+        tol: float = 1.0e-6,
+        max_iter: int = 100,
+    ) -> np.ndarray:
+        """Power iteration; dangling nodes jump by the personalization."""
+        n = len(self)
+        p = np.full(n, 1.0 / n) if personalization is None else personalization
+        inv_deg = np.divide(
+            1.0, self.degree, out=np.zeros(n), where=self.degree > 0
+        )
+        dangling = self.degree == 0
+        x = p.copy()
+        for _ in range(max_iter):
+            last = x
+            x = alpha * (self.adj @ (x * inv_deg))
+            x += (alpha * last[dangling].sum() + 1.0 - alpha) * p
+            if np.abs(x - last).sum() < n * tol:
+                break
+        return x
+
+    def core_numbers(self) -> np.ndarray:
+        """k-core number of each node, peeling all low-degree nodes at once."""
+        core = np.zeros(len(self), dtype=np.int64)
+        alive = np.ones(len(self), dtype=bool)
+        deg = self.degree.copy()
+        k = 0
+        while alive.any():
+            peel = alive & (deg <= k)
+            if not peel.any():
+                k = int(deg[alive].min())
+                continue
+            core[peel] = k
+            alive &= ~peel
+            deg -= self.adj @ peel.astype(np.float64)
+        return core
+
+
+_GRAPH_CACHE: dict[tuple, _CoauthorGraph] = {}
+_GRAPH_CACHE_SIZE = 8
+
+
+def _coauthor_graph(edges: pd.DataFrame) -> _CoauthorGraph:
+    """_CoauthorGraph for an edge list, reused while the edges are the same."""
+    key = _edges_key(edges[list(_edge_columns(edges))])
+    graph = _GRAPH_CACHE.get(key)
+    if graph is None:
+        graph = _CoauthorGraph(edges)
+        if len(_GRAPH_CACHE) >= _GRAPH_CACHE_SIZE:
+            _GRAPH_CACHE.pop(next(iter(_GRAPH_CACHE)))
+        _GRAPH_CACHE[key] = graph
+    return graph
+
+
+def network_centrality(
+    edges: pd.DataFrame, samples: int = 256, seed: int = 0
+) -> pd.DataFrame:
+    """
+    Degree, closeness, betweenness, PageRank and k-core of every node.
+
+    Parameters
+    ----------
+    edges : DataFrame — from get_coauthors() or crawl_coauthor_network()
+    samples : int — BFS sources used to estimate closeness and betweenness
+        on graphs with more nodes than this; smaller graphs are exact
+    seed : int — for the source sample
+
+    Returns
+    -------
+    DataFrame with: id, degree, closeness, betweenness, pagerank, core.
+    Closeness uses the Wasserman-Faust scaling for disconnected graphs and
+    betweenness is normalized, both as networkx computes them.
+    """
+    graph = _coauthor_graph(edges)
+    n = len(graph)
+    if n == 0:
+        return pd.DataFrame(
+            columns=["id", "degree", "closeness", "betweenness", "pagerank", "core"]
+        )
+    if n <= samples:
+        sources = np.arange(n)
+    else:
+        sources = np.sort(
+            np.random.default_rng(seed).choice(n, size=samples, replace=False)
+        )
+
+    reached = np.zeros(n)
+    dist_sum = np.zeros(n)
+    dependency = np.zeros(n)
+    for batch in graph.source_batches(sources):
+        dist, sigma = graph.bfs(batch)
+        hit = dist > 0
+        reached += hit.sum(axis=0)
+        dist_sum += np.where(hit, dist, 0).sum(axis=0)
+
+        # Brandes' dependency accumulation, deepest level first
+        delta = np.zeros_like(sigma)
+        for d in range(int(dist.max()), 0, -1):
+            coef = np.where(
+                dist == d, (1.0 + delta) / np.where(sigma > 0, sigma, 1.0), 0.0
+            )
+            back = (graph.adj @ coef.T).T
+            delta += np.where(dist == d - 1, sigma * back, 0.0)
+        delta[np.arange(len(batch)), batch] = 0.0
+        dependency += delta.sum(axis=0)
+
+    # Sources other than the node itself that it could have reached
+    in_sample = np.zeros(n, dtype=bool)
+    in_sample[sources] = True
+    others = len(sources) - in_sample
+    with np.errstate(divide="ignore", invalid="ignore"):
+        closeness = np.where(
+            dist_sum > 0, (reached / others) * (reached / dist_sum), 0.0
+        )
+    if n > 2:
+        betweenness = dependency * (n / len(sources)) / ((n - 1) * (n - 2))
+    else:
+        betweenness = np.zeros(n)
+
+    return pd.DataFrame(
+        {
+            "id": graph.nodes,
+            "degree": graph.degree.astype(np.int64),
+            "closeness": closeness,
+            "betweenness": betweenness,
+            "pagerank": graph.pagerank(),
+            "core": graph.core_numbers(),
+        }
+    )
+
+
+def network_communities(
+    edges: pd.DataFrame,
+    method: str = "auto",
+    seed: int = 0,
+    max_iter: int = 100,
+) -> pd.DataFrame:
+    """
+    Group the coauthor graph into communities.
+
+    method="louvain" uses networkx's Louvain modularity optimisation,
+    method="label_propagation" a sparse semi-synchronous label propagation
+    that scales to large graphs with scipy alone; "auto" picks Louvain when
+    networkx is installed.
+
+    Returns DataFrame with: id, community (0 is the largest).
+    """
+    graph = _coauthor_graph(edges)
+    n = len(graph)
+    if method == "auto":
+        try:
+            import networkx  # noqa: F401
+
+            method = "louvain"
+        except ImportError:
+            method = "label_propagation"
+
+    if method == "louvain":
+        import networkx as nx
+
+        src_col, dst_col = _edge_columns(edges)
+        G = nx.Graph()
+        G.add_nodes_from(graph.nodes)
+        G.add_edges_from(
+            zip(edges[src_col].astype(str), edges[dst_col].astype(str))
+        )
+        G.remove_edges_from(nx.selfloop_edges(G))
+        groups = nx.community.louvain_communities(G, seed=seed)
+        labels = np.empty(n, dtype=np.int64)
+        for label, members in enumerate(groups):
+            labels[graph.nodes.get_indexer(list(members))] = label
+    elif method == "label_propagation":
+        labels = _label_propagation(graph, seed, max_iter)
+    else:
+        raise ValueError(
+            f"Unknown method {method!r}; use 'auto', 'louvain' or "
+            "'label_propagation'."
+        )
+
+    # Renumber by size so community 0 is the largest
+    _, codes, sizes = np.unique(labels, return_inverse=True, return_counts=True)
+    rank = np.empty(len(sizes), dtype=np.int64)
+    rank[np.argsort(-sizes, kind="stable")] = np.arange(len(sizes))
+    return pd.DataFrame({"id": graph.nodes, "community": rank[codes]})
+
+
+def _label_propagation(
+    graph: _CoauthorGraph, seed: int, max_iter: int
+) -> np.ndarray:
+    sp = _require_scipy()
+    n = len(graph)
+    rng = np.random.default_rng(seed)
+    labels = np.arange(n)
+    has_nbrs = graph.degree > 0
+    rows = np.arange(n)
+    for _ in range(max_iter):
+        onehot = sp.csr_matrix((np.ones(n), (rows, labels)), shape=(n, n))
+        counts = (graph.adj @ onehot).tocsr()
+        best_count = np.asarray(counts.max(axis=1).todense()).ravel()
+        own_count = np.asarray(counts[rows, labels]).ravel()
+        unsettled = has_nbrs & (own_count < best_count)
+        if not unsettled.any():
+            break
+        # Random tie-breaking; half the nodes move per round so that
+        # neighbours do not keep swapping labels
+        counts.data += rng.random(len(counts.data)) * 0.5
+        best = np.asarray(counts.argmax(axis=1)).ravel()
+        move = unsettled & (rng.random(n) < 0.5)
+        labels = np.where(move, best, labels)
+    return labels
+
+
+def referee_independence(
+    edges: pd.DataFrame,
+    petitioner: str,
+    referees: list[str],
+    communities: Optional[pd.DataFrame] = None,
+) -> pd.DataFrame:
+    """
+    Rank referees by how independent they are of the petitioner.
+
+    Parameters
+    ----------
+    edges : DataFrame — coauthor edge list covering petitioner and referees
+        (e.g. crawl_coauthor_network() from the petitioner and from each
+        referee, concatenated); names must match the edge labels
+    petitioner : str
+    referees : list of str
+    communities : DataFrame — from network_communities(), computed if None
+
+    Returns
+    -------
+    DataFrame with: referee, in_graph, distance (coauthor hops, <NA> when
+    unconnected), direct_coauthor, shared_coauthors, same_community,
+    proximity (personalized PageRank from the petitioner) and independent
+    (no path of length <= 2), ordered most independent first, with a rank.
+    Referees missing from the edge list count as independent but rank
+    below those the crawl actually reached.
+    """
+    graph = _coauthor_graph(edges)
+    where = graph.nodes.get_indexer([petitioner])[0]
+    if where < 0:
+        raise ValueError(f"Petitioner {petitioner!r} is not in the edge list.")
+    if communities is None:
+        communities = network_communities(edges)
+
+    dist, _ = graph.bfs(np.array([where]))
+    dist = dist[0]
+    restart = np.zeros(len(graph))
+    restart[where] = 1.0
+    proximity = graph.pagerank(personalization=restart)
+    petitioner_nbrs = graph.adj[where]
+    shared = np.asarray((graph.adj @ petitioner_nbrs.T).todense()).ravel()
+    community = communities.set_index("id")["community"].reindex(graph.nodes)
+    community = community.to_numpy()
+
+    idx = graph.nodes.get_indexer(list(referees))
+    found = idx >= 0
+    safe = np.where(found, idx, 0)
+    hops = np.where(found, dist[safe], -1)
+    out = pd.DataFrame(
+        {
+            "referee": list(referees),
+            "in_graph": found,
+            "distance": pd.array(np.where(hops >= 0, hops, 0), dtype="Int32"),
+            "direct_coauthor": found & (hops == 1),
+            "shared_coauthors": np.where(found, shared[safe], 0).astype(np.int64),
+            "same_community": found & (community[safe] == community[where]),
+            "proximity": np.where(found, proximity[safe], 0.0),
+        }
+    )
+    out.loc[hops < 0, "distance"] = pd.NA
+    out["independent"] = (hops < 0) | (hops > 2)
+    out = out.sort_values(
+        ["independent", "in_graph", "distance", "proximity"],
+        ascending=[False, False, False, True],
+        na_position="first",
+        kind="stable",
+    ).reset_index(drop=True)
+    out.insert(0, "rank", np.arange(1, len(out) + 1))
+    return out
+
+
+# Layouts are the slowest part of plotting; keep the last few per edge set.
+_LAYOUT_CACHE: dict[tuple, dict] = {}
+_LAYOUT_CACHE_SIZE = 16
+
+
+def network_layout(
+    edges: pd.DataFrame, method: str = "spring", seed: int = 42
+) -> dict:
+    """
+    Node positions for the coauthor graph, cached per edge set.
+
+    method names a networkx layout ("spring", "kamada_kawai", "spectral",
+    ...).  Requires: pip install networkx (and scipy for large graphs).
+    """
+    import networkx as nx
+
+    src_col, dst_col = _edge_columns(edges)
+    G = nx.from_pandas_edgelist(edges, src_col, dst_col)
+    return _cached_layout(G, method, seed)
+
+
+def _cached_layout(G, method: str, seed: int) -> dict:
+    import networkx as nx
+
+    pairs = pd.DataFrame(list(G.edges()), columns=["a", "b"], dtype=object)
+    key = (_edges_key(pairs), G.number_of_nodes(), method, seed)
+    pos = _LAYOUT_CACHE.get(key)
+    if pos is None:
+        layout = getattr(nx, f"{method}_layout")
+        if method == "spring":
+            pos = layout(G, k=2, seed=seed)
+        elif "seed" in inspect.signature(layout).parameters:
+            pos = layout(G, seed=seed)
+        else:
+            pos = layout(G)
+        if len(_LAYOUT_CACHE) >= _LAYOUT_CACHE_SIZE:
+            _LAYOUT_CACHE.pop(next(iter(_LAYOUT_CACHE)))
+        _LAYOUT_CACHE[key] = pos
+    return pos
+
+
+# ---------------------------------------------------------------------------
+# Journal metrics
+# ---------------------------------------------------------------------------
+# The R package ships bundled datasets (impactfactor, journalrankings)
+# stored in sysdata.rda.  Their licences do not allow redistribution, so
+# here the user loads an index instead, typically a SCImago Journal Rank
+# export (https://www.scimagojr.com/journalrank.php, "Download data").
+#
+# Lookups try, in order: an ISSN, the normalized title (hash index), and a
+# trigram-similarity search for the free-text venue names Scholar shows.
+# A fuzzy hit must be close, of similar length, and clearly better than
+# the next title: "Physical Review" is as near to Physical Review A as to
+# B, C, D and E, so it matches none of them.
+
+# SCImago export header -> index column
+_SCIMAGO_COLUMNS = {
+    "Title": "title",
+    "Issn": "issn",
+    "Rank": "rank",
+    "SJR": "sjr",
+    "SJR Best Quartile": "quartile",
+    "H index": "h_index",
+    "Cites / Doc. (2years)": "impact_factor",
+    "Categories": "categories",
+}
+
+_JOURNAL_METRICS = ["rank", "sjr", "quartile", "h_index", "impact_factor"]
+
+_ISSN_RE = re.compile(r"^\s*(\d{4})-?(\d{3}[\dXx])\s*$")
+_VENUE_NOISE = re.compile(r"\([^)]*\)|\[[^\]]*\]")
+_VENUE_PUNCT = re.compile(r"[^\w\s]+")
+
+# A fuzzy match's shorter name is at least this share of the longer one
+_FUZZY_LENGTH_RATIO = 0.75
+
+
+@lru_cache(maxsize=1 << 16)
+def _normalize_venue(name: str) -> str:
+    """Case-, accent- and punctuation-insensitive form of a venue name."""
+    name = unicodedata.normalize("NFKD", name)
+    name = "".join(ch for ch in name if not unicodedata.combining(ch))
+    name = _VENUE_NOISE.sub(" ", name.lower()).replace("&", " and ")
+    words = _VENUE_PUNCT.sub(" ", name).split()
+    if words and words[0] == "the":
+        words = words[1:]
+    return " ".join(words)
+
+
+def _trigrams(text: str) -> set[str]:
+    padded = f"  {text} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class JournalIndex:
+    """
+    Journal metrics keyed by ISSN and normalized title, with fuzzy lookup.
+
+    Parameters
+    ----------
+    table : DataFrame — a SCImago export (as read by load_journal_index)
+        or any frame with a `title` column and optionally issn, rank, sjr,
+        quartile, h_index, impact_factor, categories
+    min_similarity : float — lowest trigram (Dice) similarity accepted by
+        the fuzzy fallback; 1.0 turns it off
+    min_margin : float — how far the best fuzzy title must score above any
+        other title; closer runners-up make the name ambiguous, unmatched
+
+    Attributes
+    ----------
+    table : DataFrame — one row per journal with title, issn (list) and the
+        metric columns, in the order given (SCImago: best rank first)
+    """
+
+    def __init__(
+        self,
+        table: pd.DataFrame,
+        min_similarity: float = 0.8,
+        min_margin: float = 0.05,
+    ):
+        table = table.rename(columns=_SCIMAGO_COLUMNS)
+        if "title" not in table.columns:
+            raise ValueError("Journal table needs a title column.")
+        table = table.reset_index(drop=True)
+        for col in ["issn", "categories", *_JOURNAL_METRICS]:
+            if col not in table.columns:
+                table[col] = None if col in ("issn", "categories") else np.nan
+        table["issn"] = [_split_issns(v) for v in table["issn"]]
+        table = table.astype(
+            {
+                "rank": "Int32",
+                "h_index": "Int32",
+                "sjr": "float64",
+                "impact_factor": "float64",
+            }
+        )
+        self.table = table[
+            ["title", "issn", *_JOURNAL_METRICS, "categories"]
+        ]
+        self.min_similarity = float(min_similarity)
+        self.min_margin = float(min_margin)
+
+        # Hash indexes.  On duplicate keys the first (best-ranked) row wins.
+        names = pd.Series([_normalize_venue(str(t)) for t in table["title"]])
+        first = ~names.duplicated()
+        self._names = names.to_numpy(dtype=object)
+        self._by_name = pd.Index(names[first].to_numpy(dtype=object))
+        self._by_name_row = np.flatnonzero(first.to_numpy())
+        self._by_issn: dict[str, int] = {}
+        for row, issns in enumerate(table["issn"]):
+            for issn in issns:
+                self._by_issn.setdefault(issn, row)
+
+        # Trigram postings for the fuzzy fallback
+        postings: dict[str, list[int]] = {}
+        sizes = np.zeros(len(names), dtype=np.int64)
+        for row, name in enumerate(self._names):
+            grams = _trigrams(name)
+            sizes[row] = len(grams)
+            for gram in grams:
+                postings.setdefault(gram, []).append(row)
+        self._postings = {
+            gram: np.asarray(rows, dtype=np.int64)
+            for gram, rows in postings.items()
+        }
+        self._gram_counts = sizes
+        self._lengths = np.fromiter(
+            (len(name) for name in self._names), np.int64, len(self._names)
+        )
+        self._fuzzy = lru_cache(maxsize=1 << 14)(self._fuzzy_match)
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def __repr__(self) -> str:
+        return f"JournalIndex({len(self)} journals)"
+
+    def _fuzzy_match(self, name: str) -> tuple[int, float]:
+        """(row, similarity) of the closest title, row -1 if none is close."""
+        grams = _trigrams(name)
+        hits = [self._postings[g] for g in grams if g in self._postings]
+        if not hits:
+            return -1, 0.0
+        shared = np.bincount(np.concatenate(hits), minlength=len(self._names))
+        dice = 2.0 * shared / (len(grams) + self._gram_counts)
+        shorter = np.minimum(self._lengths, len(name))
+        dice[shorter < _FUZZY_LENGTH_RATIO * np.maximum(self._lengths, len(name))] = 0
+        row = int(np.argmax(dice))  # duplicate titles: the better-ranked one
+        best = float(dice[row])
+        if best < self.min_similarity:
+            return -1, best
+        close = np.flatnonzero(dice >= best - self.min_margin)
+        if (self._names[close] != self._names[row]).any():
+            return -1, best
+        return row, best
+
+    def match(self, journals, fuzzy: bool = True) -> pd.DataFrame:
+        """
+        Match venue names (or ISSNs) to index rows.
+
+        Distinct names are resolved once: ISSN and exact-title hits through
+        the hash indexes in one vectorized pass, the rest by fuzzy search
+        (memoized across calls) unless fuzzy=False.
+
+        Returns DataFrame with: row (-1 if unmatched), match ("issn",
+        "exact", "fuzzy" or None), similarity — aligned with `journals`.
+        """
+        codes, uniques = pd.factorize(
+            pd.Series(journals, dtype=object).fillna("")
+        )
+        raw = [str(u) for u in uniques]
+        names = [_normalize_venue(u) for u in raw]
+        rows = np.full(len(raw), -1, dtype=np.int64)
+        kind = np.full(len(raw), None, dtype=object)
+        similarity = np.zeros(len(raw))
+
+        found = self._by_name.get_indexer(names)
+        exact = found >= 0
+        rows[exact] = self._by_name_row[found[exact]]
+        kind[exact] = "exact"
+        similarity[exact] = 1.0
+        for i, text in enumerate(raw):
+            m = _ISSN_RE.match(text)
+            if m and (m.group(1) + m.group(2).upper()) in self._by_issn:
+                rows[i] = self._by_issn[m.group(1) + m.group(2).upper()]
+                kind[i] = "issn"
+                similarity[i] = 1.0
+            elif rows[i] < 0 and names[i] and fuzzy and self.min_similarity < 1.0:
+                row, sim = self._fuzzy(names[i])
+                similarity[i] = sim
+                if row >= 0:
+                    rows[i] = row
+                    kind[i] = "fuzzy"
 
-    # Truncate to same length
-    n = min(len(years), len(vals))
-    return pd.DataFrame({"year": years[:n], "cites": vals[:n]})
+        return pd.DataFrame(
+            {
+                "row": rows[codes],
+                "match": kind[codes],
+                "similarity": similarity[codes],
+            }
+        )
 
+    def lookup(self, journals, fuzzy: bool = True) -> pd.DataFrame:
+        """
+        Metrics for each venue name: journal, matched_title, issn, rank,
+        sjr, quartile, h_index, impact_factor, categories, match,
+        similarity.  Unmatched names get missing values.
+        """
+        journals = pd.Series(journals, dtype=object).to_numpy()
+        matched = self.match(journals, fuzzy=fuzzy)
+        # Row -1 is not in the index, so unmatched names come out empty
+        out = self.table.reindex(matched["row"].to_numpy())
+        out = out.rename(columns={"title": "matched_title"}).reset_index(
+            drop=True
+        )
+        out.insert(0, "journal", journals)
+        out["match"] = matched["match"].to_numpy()
+        out["similarity"] = matched["similarity"].to_numpy()
+        return out
+
+
+def _split_issns(value) -> list[str]:
+    """SCImago's "15424863, 00079235" (or a list) as 8-character ISSNs."""
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return []
+    parts = value if isinstance(value, (list, tuple)) else str(value).split(",")
+    out = []
+    for part in parts:
+        issn = str(part).strip().replace("-", "").upper()
+        if len(issn) == 8:
+            out.append(issn)
+    return out
+
+
+def load_journal_index(
+    path: str, min_similarity: float = 0.8, min_margin: float = 0.05
+) -> JournalIndex:
+    """
+    Build a JournalIndex from a SCImago Journal Rank CSV export.
 
-# ---------------------------------------------------------------------------
-# Comparing scholars  (mirrors R: compare.r)
-# ---------------------------------------------------------------------------
+    The export is semicolon-separated with decimal commas; other CSVs with
+    the index column names (title, issn, rank, sjr, ...) and comma
+    separators work as well.
+    """
+    path = os.path.expanduser(path)
+    with open(path, encoding="utf-8-sig") as fh:
+        header = fh.readline()
+    if header.count(";") > header.count(","):
+        table = pd.read_csv(path, sep=";", decimal=",", dtype={"Issn": str})
+    else:
+        table = pd.read_csv(path, dtype={"issn": str, "Issn": str})
+    return JournalIndex(table, min_similarity=min_similarity, min_margin=min_margin)
 
 
-def compare_scholars(
-    ids: list[str], pagesize: int = 100
-) -> pd.DataFrame:
-    """
-    Compare citation records of multiple scholars.
+_JOURNAL_INDEX: Optional[JournalIndex] = None
 
-    Returns DataFrame with: id, name, year, cites, total (cumulative).
+
+def set_journal_index(
+    source: str | pd.DataFrame | JournalIndex | None,
+    min_similarity: float = 0.8,
+    min_margin: float = 0.05,
+) -> Optional[JournalIndex]:
     """
-    frames = []
-    names_map = {}
-    for sid in ids:
-        sid = tidy_id(sid)
-        pubs = get_publications(sid, pagesize=pagesize)
-        yearly = (
-            pubs.dropna(subset=["year"])
-            .groupby("year")["cites"]
-            .sum()
-            .reset_index()
-        )
-        yearly["id"] = sid
-        yearly = yearly.sort_values("year")
-        yearly["total"] = yearly["cites"].cumsum()
-        frames.append(yearly)
-        names_map[sid] = get_profile(sid)["name"]
+    Set the journal index behind get_impactfactor, get_journalrank and
+    add_journal_metrics.
 
-    df = pd.concat(frames, ignore_index=True)
-    df["name"] = df["id"].map(names_map)
-    return df[["id", "name", "year", "cites", "total"]]
+    Parameters
+    ----------
+    source : str, DataFrame or JournalIndex — path of a SCImago CSV export,
+        a table with the same columns, or a ready index; None unsets it
+    min_similarity, min_margin : float — see JournalIndex
+    """
+    global _JOURNAL_INDEX
+    if source is None or isinstance(source, JournalIndex):
+        _JOURNAL_INDEX = source
+    elif isinstance(source, pd.DataFrame):
+        _JOURNAL_INDEX = JournalIndex(source, min_similarity, min_margin)
+    else:
+        _JOURNAL_INDEX = load_journal_index(source, min_similarity, min_margin)
+    return _JOURNAL_INDEX
+
+
+def _journal_index(what: str) -> Optional[JournalIndex]:
+    if _JOURNAL_INDEX is None:
+        warnings.warn(
+            f"{what} data not bundled. Returning empty results. "
+            "Load a SCImago export with set_journal_index()."
+        )
+    return _JOURNAL_INDEX
 
 
-def compare_scholar_careers(
-    ids: list[str], career: bool = True
-) -> pd.DataFrame:
+def get_impactfactor(journals: list[str], fuzzy: bool = False) -> pd.DataFrame:
     """
-    Compare citation careers of multiple scholars.
+    Impact factor of each journal from the index set with set_journal_index().
 
-    If career=True, adds a career_year column relative to first citation year.
-    Returns DataFrame with: id, name, year, cites, (career_year).
+    The SCImago export's two-year cites per document stands in for the
+    impact factor.  Names are matched by ISSN or normalized title; with
+    fuzzy=True, names matching neither are also matched fuzzily (check the
+    match and similarity columns).
+
+    Returns DataFrame with: journal, impact_factor, matched_title, issn,
+    match, similarity.  Without an index, impact_factor is empty and a
+    warning is issued.
     """
-    frames = []
-    names_map = {}
-    for sid in ids:
-        sid = tidy_id(sid)
-        hist = get_citation_history(sid)
-        hist["id"] = sid
-        if career and len(hist) > 0:
-            hist["career_year"] = hist["year"] - hist["year"].min()
-        frames.append(hist)
-        names_map[sid] = get_profile(sid)["name"]
+    index = _journal_index("Impact factor")
+    if index is None:
+        return pd.DataFrame(
+            {"journal": journals, "impact_factor": [None] * len(journals)}
+        )
+    out = index.lookup(journals, fuzzy=fuzzy)
+    return out[
+        ["journal", "impact_factor", "matched_title", "issn", "match", "similarity"]
+    ]
 
-    df = pd.concat(frames, ignore_index=True)
-    df["name"] = df["id"].map(names_map)
-    cols = ["id", "name", "year", "cites"]
-    if career:
-        cols.append("career_year")
-    return df[cols]
 
+def get_journalrank(journals: list[str], fuzzy: bool = False) -> pd.DataFrame:
+    """
+    SCImago rank and indicators of each journal (see get_impactfactor()
+    for matching and `fuzzy`).
 
-# ---------------------------------------------------------------------------
-# Author position  (mirrors R: author_position)
-# ---------------------------------------------------------------------------
+    Returns DataFrame with: journal, rank, sjr, quartile, h_index,
+    categories, matched_title, match, similarity.  Without an index, rank
+    is empty and a warning is issued.
+    """
+    index = _journal_index("Journal ranking")
+    if index is None:
+        return pd.DataFrame({"journal": journals, "rank": [None] * len(journals)})
+    out = index.lookup(journals, fuzzy=fuzzy)
+    return out[
+        [
+            "journal",
+            "rank",
+            "sjr",
+            "quartile",
+            "h_index",
+            "categories",
+            "matched_title",
+            "match",
+            "similarity",
+        ]
+    ]
 
 
-def author_position(
-    author_lists: list[str] | pd.Series, author_name: str
+def add_journal_metrics(
+    pubs: pd.DataFrame,
+    metrics: Optional[list[str]] = None,
+    index: Optional[JournalIndex] = None,
+    fuzzy: bool = True,
 ) -> pd.DataFrame:
     """
-    Find the position of an author in each publication's author list.
+    Annotate a publication table with the metrics of each paper's venue.
+
+    Each distinct `journal` value is matched once and the metrics are
+    joined back by position, so large tables cost one lookup per venue.
 
     Parameters
     ----------
-    author_lists : list of str — e.g. from get_publications()['author']
-    author_name : str — the author to search for (matches on last name)
+    pubs : DataFrame — from get_publications() (needs a `journal` column)
+    metrics : list of str — columns to add, default rank, sjr, quartile,
+        h_index, impact_factor
+    index : JournalIndex — defaults to the one from set_journal_index()
+    fuzzy : bool — also match venues fuzzily; journal_match says which
+        rows were
 
     Returns
     -------
-    DataFrame with: authors, position (1-indexed), n_authors,
-    position_normalized (0=first, 1=last, NaN if unknown).
+    A copy of pubs with the metric columns and journal_match added.
     """
-    last_name = author_name.strip().split()[-1].lower()
+    index = index if index is not None else _JOURNAL_INDEX
+    if index is None:
+        raise ValueError("No journal index; call set_journal_index() first.")
+    metrics = list(metrics or _JOURNAL_METRICS)
+    matched = index.match(pubs["journal"].astype(object).to_numpy(), fuzzy=fuzzy)
+    venue = index.table[metrics].reindex(matched["row"].to_numpy())
+    out = pubs.copy()
+    for col in metrics:
+        out[col] = venue[col].array
+    out["journal_match"] = matched["match"].to_numpy()
+    return out
 
-    records = []
-    for authors_str in author_lists:
-        parts = [a.strip() for a in str(authors_str).split(",")]
-        lastnames = [p.split()[-1].lower() if p.split() else "" for p in parts]
-        n = len(parts)
-        has_ellipsis = any("..." in p for p in parts)
-
-        matches = [
-            i for i, ln in enumerate(lastnames) if last_name in ln
-        ]
-        if len(matches) == 1:
-            pos = matches[0] + 1  # 1-indexed
-            if has_ellipsis:
-                norm = None
-            elif n == 1:
-                norm = 1.0
-            else:
-                norm = (pos - 1) / (n - 1)
-            actual_n = None if has_ellipsis else n
-        else:
-            pos = None
-            norm = None
-            actual_n = None if has_ellipsis else n
 
-        records.append(
-            {
-                "authors": authors_str,
-                "position": pos,
-                "n_authors": actual_n,
-                "position_normalized": norm,
-            }
+# ---------------------------------------------------------------------------
+# Crawl jobs  (resumable batch runs)
+# ---------------------------------------------------------------------------
+
+
+class CrawlJob:
+    """
+    Resumable crawl of publication lists and per-article citation histories.
+
+    Each finished unit of work — one publication page, or one article's
+    citation history — is appended to a JSONL checkpoint straight away.
+    Running a job again with the same checkpoint skips finished units, so
+    a crash or a rate-limit stop loses only the requests in flight.
+
+    Parameters
+    ----------
+    scholar_ids : list of str
+    checkpoint : str — path of the JSONL checkpoint file
+    cite_histories : bool — also fetch get_article_cite_history per article
+    skip_uncited : bool — don't fetch histories of articles with 0 cites
+    max_retries : int — extra attempts per unit after a 429/connection error
+    pause : float — seconds to wait before each such retry
+    progress : callable — called with stats() after every finished unit
+
+    Example
+    -------
+    job = CrawlJob(ids, "crawl.jsonl").run()
+    pubs, hist = job.publications(), job.cite_histories()
+    """
+
+    def __init__(
+        self,
+        scholar_ids: list[str],
+        checkpoint: str,
+        cite_histories: bool = True,
+        skip_uncited: bool = True,
+        max_retries: int = 3,
+        pause: float = 60.0,
+        progress: Optional[Callable[[dict], None]] = None,
+    ):
+        self.scholar_ids = list(dict.fromkeys(tidy_id(s) for s in scholar_ids))
+        self.checkpoint = os.path.expanduser(checkpoint)
+        self.cite_histories_enabled = cite_histories
+        self.skip_uncited = skip_uncited
+        self.max_retries = max_retries
+        self.pause = pause
+        self.progress = progress
+        self.failed: dict[tuple, str] = {}
+
+        self._lock = threading.Lock()
+        self._pages: dict[tuple[str, int], dict] = {}
+        self._histories: dict[tuple[str, str], list[dict]] = {}
+        self._done_this_run = 0
+        self._total = 0
+        self._phase = "publications"
+        self._started = time.monotonic()
+        self._torn_tail = False
+        self._load()
+
+    # -- checkpoint --------------------------------------------------------
+
+    def _load(self) -> None:
+        if not os.path.exists(self.checkpoint):
+            return
+        line = "\n"
+        with open(self.checkpoint, encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # torn final line from an interrupted write
+                self._apply(entry)
+        # An interrupted write leaves no newline; end that line before appending
+        self._torn_tail = not line.endswith("\n")
+
+    def _apply(self, entry: dict) -> None:
+        if entry["unit"] == "page":
+            self._pages[(entry["id"], entry["cstart"])] = entry
+        elif entry["unit"] == "history":
+            self._histories[(entry["id"], entry["pubid"])] = entry["rows"]
+
+    def _record(self, entry: dict) -> None:
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        with self._lock:
+            with open(self.checkpoint, "a", encoding="utf-8") as fh:
+                fh.write("\n" + line if self._torn_tail else line)
+            self._torn_tail = False
+            self._apply(entry)
+            # Progress counts scholars (at their last page), then histories
+            if entry["unit"] == "history" or entry["last"]:
+                self._done_this_run += 1
+        if self.progress is not None:
+            self.progress(self.stats())
+
+    # -- work units --------------------------------------------------------
+
+    def _with_retries(self, key: tuple, fn: Callable):
+        for attempt in range(self.max_retries + 1):
+            try:
+                return fn()
+            except (RuntimeError, ConnectionError, requests.RequestException) as exc:
+                if attempt == self.max_retries:
+                    self.failed[key] = f"{type(exc).__name__}: {exc}"
+                    return None
+                time.sleep(self.pause)
+
+    def _crawl_pages(self, sid: str) -> None:
+        cstart = 0
+        while True:
+            entry = self._pages.get((sid, cstart))
+            if entry is None:
+                url = _publications_url(sid, cstart, 100, "citation")
+                rows = self._with_retries(
+                    ("page", sid, cstart),
+                    lambda: _parse_publication_rows(_parse_html(url)),
+                )
+                if rows is None:
+                    return
+                entry = {
+                    "unit": "page",
+                    "id": sid,
+                    "cstart": cstart,
+                    "rows": rows,
+                    "last": len(rows) < 100,
+                }
+                self._record(entry)
+            if entry["last"]:
+                return
+            cstart += 100
+
+    def _crawl_history(self, key: tuple[str, str]) -> None:
+        sid, pubid = key
+        hist = self._with_retries(
+            ("history", sid, pubid),
+            lambda: get_article_cite_history(sid, pubid),
         )
+        if hist is not None:
+            self._record(
+                {
+                    "unit": "history",
+                    "id": sid,
+                    "pubid": pubid,
+                    "rows": hist[["year", "cites"]].to_dict("records"),
+                }
+            )
+
+    # -- driver ------------------------------------------------------------
+
+    @_instrumented
+    def run(self) -> CrawlJob:
+        """Crawl everything not yet in the checkpoint; returns self."""
+        self.failed = {}
+        self._done_this_run = 0
+        self._started = time.monotonic()
 
-    return pd.DataFrame(records)
+        # Publication lists: scholars in parallel, pages in order per scholar
+        todo = [sid for sid in self.scholar_ids if not self._pages_complete(sid)]
+        self._phase, self._total = "publications", len(todo)
+        _map_concurrent(self._crawl_pages, todo)
+
+        if self.cite_histories_enabled:
+            todo = [k for k in self._history_keys() if k not in self._histories]
+            self._done_this_run = 0
+            self._started = time.monotonic()
+            self._phase, self._total = "histories", len(todo)
+            _map_concurrent(self._crawl_history, todo)
+
+        if self.failed:
+            warnings.warn(
+                f"{len(self.failed)} crawl units failed; "
+                "run the job again to retry them."
+            )
+        return self
+
+    def _pages_complete(self, sid: str) -> bool:
+        cstart = 0
+        while (sid, cstart) in self._pages:
+            if self._pages[(sid, cstart)]["last"]:
+                return True
+            cstart += 100
+        return False
+
+    def _history_keys(self) -> list[tuple[str, str]]:
+        pubs = self.publications()
+        if pubs.empty:
+            return []
+        if self.skip_uncited:
+            pubs = pubs[pubs["cites"] > 0]
+        pubs = pubs[pubs["pubid"] != ""]
+        return list(dict.fromkeys(zip(pubs["id"], pubs["pubid"])))
+
+    def stats(self) -> dict:
+        """
+        Progress of the current phase: units finished this run, throughput
+        (units/s) and ETA (seconds).  The phase is "publications", counted
+        in scholars whose list is complete, then "histories", counted in
+        articles.
+        """
+        elapsed = time.monotonic() - self._started
+        rate = self._done_this_run / elapsed if elapsed > 0 else 0.0
+        remaining = max(self._total - self._done_this_run, 0)
+        return {
+            "phase": self._phase,
+            "done": self._done_this_run,
+            "total": self._total,
+            "failed": len(self.failed),
+            "elapsed": elapsed,
+            "rate": rate,
+            "eta": remaining / rate if rate > 0 else None,
+        }
+
+    # -- results -----------------------------------------------------------
+
+    def publications(self) -> pd.DataFrame:
+        """All checkpointed publications, with an `id` column."""
+        ids: list[str] = []
+        columns: dict[str, list] = {col: [] for col in _PUBLICATION_COLUMNS}
+        for (sid, _), entry in sorted(self._pages.items()):
+            ids.extend([sid] * len(entry["rows"]))
+            for row in entry["rows"]:
+                for col in _PUBLICATION_COLUMNS:
+                    columns[col].append(row.get(col))
+        pubs = _publication_frame(columns)
+        pubs.insert(0, "id", pd.array(ids, dtype=_string_dtype()))
+        return pubs
+
+    def cite_histories(self) -> pd.DataFrame:
+        """All checkpointed article histories: id, pubid, year, cites."""
+        records = [
+            {"id": sid, "pubid": pubid, **row}
+            for (sid, pubid), rows in self._histories.items()
+            for row in rows
+        ]
+        return pd.DataFrame(records, columns=["id", "pubid", "year", "cites"])
 
 
 # ---------------------------------------------------------------------------
-# Predict h-index  (mirrors R: predict.r)
+# Incremental refresh
 # ---------------------------------------------------------------------------
+# Refreshing a stored publication list rarely needs every page: new papers
+# sit at the top of the year-sorted list, and cite count changes cluster on
+# the most cited papers, which the citation-sorted first page already shows.
+# The profile's citation total says how much change there is to find, and
+# the length of the last page says whether anything was removed.
 
+_CHANGE_COLUMNS = ["change", "pubid", "title", "cites_before", "cites_after"]
 
-def predict_h_index(
+
+def refresh_publications(
     scholar_id: str,
-    journals: Optional[list[str]] = None,
-) -> pd.DataFrame:
+    snapshot: pd.DataFrame,
+    total_cites: int,
+    bundle: Optional[ScholarProfilePage] = None,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
     """
-    Predict future h-index using Acuna et al. (Nature 489, 201-202, 2012).
+    Update a stored publication list with as few page fetches as possible.
 
-    Calibrated on neuroscience data — use with caution for other fields.
+    Fetches the profile (first 100 publications by citations), then
+    year-sorted pages until one contains a known pubid, then further
+    citation-sorted pages only until the growth in the profile's citation
+    total is accounted for.  One more page checks the end of the list: if
+    its length does not match, or a stored paper expected on it is gone,
+    the whole list is fetched and diffed instead.
 
-    Returns DataFrame with: years_ahead (0-10), h_index.
+    Cite changes on papers ranked below the pages fetched are picked up
+    only once the profile total shows growth that the fetched pages do not
+    explain; a paper added with an older year than any known paper is
+    found through the length check.  A paper removed from between the
+    pages fetched and the last page is not noticed.
+
+    Parameters
+    ----------
+    scholar_id : str
+    snapshot : DataFrame — an earlier get_publications() result
+    total_cites : int — the profile's total citations
+        (get_profile()["total_cites"]) when `snapshot` was taken; the
+        snapshot's own sum of cites is a different count and won't do
+    bundle : ScholarProfilePage — reuse an already fetched profile page
+
+    Returns
+    -------
+    (publications, changes): the refreshed table, sorted by cites like
+    get_publications() (papers with equal cites may be ordered differently),
+    and one row per new, updated or removed publication with columns
+    change, pubid, title, cites_before, cites_after.
     """
+    if total_cites is None or pd.isna(total_cites):
+        raise ValueError("total_cites (the stored profile total) is required.")
     scholar_id = tidy_id(scholar_id)
+    if bundle is None:
+        bundle = get_profile_bundle(scholar_id)
+    _check_bundle(bundle, scholar_id)
 
-    n = get_num_articles(scholar_id)
-    prof = get_profile(scholar_id)
-    h = prof["h_index"]
-    import datetime
+    old = snapshot.drop(columns=["id"], errors="ignore")
+    old_cites = dict(zip(old["pubid"], old["cites"].fillna(0).astype(int)))
+    pagesize = 100
 
-    current_year = datetime.datetime.now().year
-    oldest = get_oldest_article(scholar_id)
-    y = current_year - oldest if oldest else 0
-    j = get_num_distinct_journals(scholar_id)
-    q = get_num_top_journals(scholar_id, journals) if journals else get_num_top_journals(scholar_id)
+    # Fresh cite counts, starting with the top 100 on the bundle page
+    seen: dict[str, dict] = {}
 
-    # Regression coefficients from Acuna et al.
-    coefs = np.array(
-        [
-            [0.760, 0.373, 0.967, -0.069, 0.018, 0.033],
-            [1.413, 0.781, 0.936, -0.132, 0.018, 0.064],
-            [2.227, 1.105, 0.903, -0.193, 0.027, 0.096],
-            [3.196, 1.386, 0.871, -0.274, 0.039, 0.145],
-            [3.997, 1.578, 0.858, -0.345, 0.063, 0.198],
-            [4.752, 1.671, 0.817, -0.377, 0.117, 0.282],
-            [5.741, 1.761, 0.761, -0.420, 0.170, 0.394],
-            [6.531, 1.796, 0.669, -0.420, 0.252, 0.508],
-            [7.482, 1.653, 0.561, -0.415, 0.383, 0.629],
-            [8.734, 1.326, 0.478, -0.411, 0.522, 0.823],
-        ]
-    )
+    def _take(page: dict[str, list]) -> None:
+        for values in zip(*page.values()):
+            row = dict(zip(page, values))
+            seen[row["pubid"]] = row
 
-    x = np.array([1.0, np.sqrt(n), h, y, j, q])
-    h_pred = coefs @ x
-    h_vals = np.concatenate([[h], h_pred])
+    _take({c: bundle.publications[c].tolist() for c in _PUBLICATION_COLUMNS})
 
-    if any(np.diff(h_vals) < 0):
-        warnings.warn(
-            "Decreasing h-values predicted. "
-            "Model calibrated on neuroscientists — results may not apply."
-        )
-    if any(h_vals < 0):
-        warnings.warn("Negative h-values predicted. See above warning.")
+    # New publications: newest first until we reach the stored list
+    for page in _iter_publication_columns(scholar_id, sortby="year"):
+        _take(page)
+        if any(pid in old_cites for pid in page["pubid"]):
+            break
 
-    return pd.DataFrame(
-        {"years_ahead": list(range(11)), "h_index": h_vals}
+    def _unexplained() -> int:
+        gained = sum(
+            row["cites"] - old_cites.get(pid, 0) for pid, row in seen.items()
+        )
+        return bundle.profile["total_cites"] - total_cites - gained
+
+    fetched_to = len(bundle.publications)
+    if _unexplained() > 0 and fetched_to == pagesize:
+        for page in _iter_publication_columns(scholar_id, cstart=pagesize):
+            _take(page)
+            fetched_to += len(page["pubid"])
+            if _unexplained() <= 0:
+                break
+
+    # Length check: the last citation-sorted page must hold what's left
+    new = [pid for pid in seen if pid not in old_cites]
+    expected = len(old_cites) + len(new)
+    last_start = max(expected - 1, 0) // pagesize * pagesize
+    if last_start >= fetched_to or fetched_to % pagesize == 0:
+        # Where the known papers should fall: stored order (Scholar's own
+        # order of equal cites), re-sorted by the freshest cites seen
+        cites_now = {pid: row["cites"] for pid, row in seen.items()}
+        cites_now = {**old_cites, **cites_now}
+        predicted = sorted(cites_now, key=cites_now.get, reverse=True)
+        url = _publications_url(scholar_id, last_start, pagesize, "citation")
+        last = _parse_publication_columns(_parse_html(url))
+        _take(last)
+        # A stored paper predicted on the last page and seen nowhere was
+        # removed, unless a new paper with the same cites took its place
+        tail = predicted[last_start:]
+        missing = sum(pid in old_cites and pid not in seen for pid in tail)
+        boundary = cites_now[tail[0]] if tail else None
+        slack = sum(cites_now[pid] == boundary for pid in new)
+        complete = (
+            len(last["pubid"]) == expected - last_start and missing <= slack
+        )
+    else:  # the citation pages above already ran to the end of the list
+        complete = fetched_to == expected and all(pid in seen for pid in old_cites)
+
+    if not complete:
+        fresh = get_publications(scholar_id, bundle=bundle)
+        return fresh, _publication_changes(old, fresh)
+
+    columns = {c: old[c].tolist() for c in _PUBLICATION_COLUMNS}
+    position = {pid: i for i, pid in enumerate(columns["pubid"])}
+    for pid, row in seen.items():
+        if pid in position:
+            columns["cites"][position[pid]] = row["cites"]
+        else:
+            for c in _PUBLICATION_COLUMNS:
+                columns[c].append(row[c])
+    fresh = (
+        _publication_frame(columns)
+        .sort_values("cites", ascending=False, kind="stable")
+        .reset_index(drop=True)
+    )
+    return fresh, _publication_changes(old, fresh)
+
+
+def _publication_changes(old: pd.DataFrame, new: pd.DataFrame) -> pd.DataFrame:
+    """New, updated (cites changed) and removed rows between two tables."""
+    merged = pd.merge(
+        old[["pubid", "title", "cites"]],
+        new[["pubid", "title", "cites"]],
+        on="pubid",
+        how="outer",
+        suffixes=("_before", "_after"),
+        indicator=True,
+    )
+    change = np.select(
+        [
+            merged["_merge"] == "right_only",
+            merged["_merge"] == "left_only",
+            (merged["cites_before"] != merged["cites_after"]).to_numpy(
+                dtype=bool, na_value=False
+            ),
+        ],
+        ["new", "removed", "updated"],
+        default="",
+    )
+    merged["change"] = change
+    merged["title"] = merged["title_after"].fillna(merged["title_before"])
+    out = merged[merged["change"] != ""]
+    order = {"new": 0, "updated": 1, "removed": 2}
+    return (
+        out.assign(_order=out["change"].map(order))
+        .sort_values(["_order", "cites_after"], ascending=[True, False])
+        [_CHANGE_COLUMNS]
+        .reset_index(drop=True)
     )
 
 
 # ---------------------------------------------------------------------------
-# Co-authors & network  (mirrors R: coauthors.R)
+# Datasets  (partitioned Parquet snapshots)
 # ---------------------------------------------------------------------------
+# A dataset directory holds one Parquet table per kind of data, partitioned
+# by scholar (hive layout, e.g. publications/id=B7vSqZsAAAAJ/part-0.parquet)
+# plus a _schema.json recording the layout version.  Saving a scholar
+# replaces only that scholar's partitions, so snapshots grow incrementally.
+# Requires: pip install pyarrow
 
+_DATASET_SCHEMA_VERSION = 1
+_DATASET_TABLES = ("profiles", "publications", "citation_history", "coauthors")
 
-def _list_coauthors(
-    scholar_id: str, n_coauthors: int = 5
-) -> pd.DataFrame:
-    """List coauthors shown on a scholar's profile page."""
-    scholar_id = tidy_id(scholar_id)
-    if not scholar_id or scholar_id == "nan":
-        return pd.DataFrame(
-            columns=["author", "author_url", "coauthors", "coauthors_url"]
-        )
 
-    url = f"{_SCHOLAR_SITE}/citations?hl=en&user={scholar_id}"
-    page = _parse_html(url)
+def _require_pyarrow():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError as exc:
+        raise ImportError(
+            "Scholar datasets need pyarrow: pip install pyarrow"
+        ) from exc
+    return pyarrow
 
-    author_el = page.select_one("#gsc_prf_in")
-    author_name = author_el.text.strip() if author_el else ""
 
-    ca_links = page.select("a[tabindex='-1']")
-    records = []
-    for i, a_tag in enumerate(ca_links[:n_coauthors]):
-        ca_name = a_tag.text.strip()
-        ca_href = a_tag.get("href", "")
-        if "Sort by" in ca_name:
-            continue
-        records.append(
-            {
-                "author": author_name,
-                "author_url": url,
-                "coauthors": ca_name,
-                "coauthors_url": f"{_SCHOLAR_SITE}{ca_href}"
-                if ca_href.startswith("/")
-                else ca_href,
-            }
+@lru_cache(maxsize=None)
+def _dataset_schema(table: str):
+    """
+    Arrow schema of one dataset table, without the `id` partition column.
+
+    Fixed rather than inferred per file, so a scholar whose partition has
+    only nulls or empty lists (no coauthors, `available` unknown, ...)
+    still reads back together with everyone else.
+    """
+    pa = _require_pyarrow()
+    string = pa.string()
+    if table == "profiles":
+        coauthor = pa.struct(
+            [("name", string), ("url", string), ("id", string)]
+        )
+        fields = [
+            ("name", string),
+            ("affiliation", string),
+            ("total_cites", pa.int64()),
+            ("h_index", pa.int64()),
+            ("i10_index", pa.int64()),
+            ("fields", pa.list_(string)),
+            ("homepage", string),
+            ("coauthors", pa.list_(coauthor)),
+            ("available", pa.int64()),
+            ("not_available", pa.int64()),
+            ("fetched", pa.timestamp("us", tz="UTC")),
+        ]
+    elif table == "publications":
+        types = {
+            "journal": pa.dictionary(pa.int32(), string),
+            "cites": pa.int32(),
+            "year": pa.int32(),
+        }
+        fields = [(col, types.get(col, string)) for col in _PUBLICATION_COLUMNS]
+    elif table == "citation_history":
+        fields = [("year", pa.int64()), ("cites", pa.int64())]
+    elif table == "coauthors":
+        fields = [
+            (col, string)
+            for col in ("author", "author_url", "coauthors", "coauthors_url")
+        ]
+    else:
+        raise ValueError(f"Unknown dataset table: {table!r}")
+    return pa.schema(fields)
+
+
+def _dataset_manifest(path: str) -> dict:
+    manifest_path = os.path.join(path, "_schema.json")
+    if not os.path.exists(manifest_path):
+        raise ValueError(f"{path} is not a scholar dataset (no _schema.json).")
+    with open(manifest_path, encoding="utf-8") as fh:
+        manifest = json.load(fh)
+    if manifest.get("schema_version", 0) > _DATASET_SCHEMA_VERSION:
+        raise ValueError(
+            f"{path} uses dataset schema version {manifest['schema_version']}; "
+            f"this scholar.py reads up to {_DATASET_SCHEMA_VERSION}. Upgrade it."
         )
+    return manifest
 
-    return pd.DataFrame(records) if records else pd.DataFrame(
-        columns=["author", "author_url", "coauthors", "coauthors_url"]
+
+def _scholar_tables(
+    scholar_id: str,
+    bundle: Optional[ScholarProfilePage] = None,
+    publications: Optional[pd.DataFrame] = None,
+) -> dict[str, pd.DataFrame]:
+    """Fetch everything a dataset stores about one scholar."""
+    if bundle is None:
+        bundle = get_profile_bundle(scholar_id)
+    if publications is None:
+        publications = get_publications(scholar_id, bundle=bundle)
+    profile = dict(bundle.profile)
+    profile["fetched"] = pd.Timestamp.now(tz="UTC")
+    return {
+        "profiles": pd.DataFrame([profile]).drop(columns="id"),
+        "publications": publications,
+        "citation_history": bundle.citation_history,
+        "coauthors": bundle.coauthors,
+    }
+
+
+def _write_partition(
+    path: str, table: str, scholar_id: str, df: pd.DataFrame
+) -> None:
+    """Atomically replace one scholar's partition of `table`."""
+    pa = _require_pyarrow()
+    import pyarrow.parquet as pq
+
+    part_dir = os.path.join(path, table, f"id={scholar_id}")
+    os.makedirs(part_dir, exist_ok=True)
+    tmp = os.path.join(part_dir, f".part-0.parquet.{os.getpid()}.tmp")
+    schema = _dataset_schema(table)
+    data = pa.Table.from_pandas(
+        df[schema.names], schema=schema, preserve_index=False
     )
+    pq.write_table(data, tmp)
+    os.replace(tmp, os.path.join(part_dir, "part-0.parquet"))
 
 
-def get_coauthors(
-    scholar_id: str, n_coauthors: int = 5, n_deep: int = 1
-) -> pd.DataFrame:
+def save_scholar_dataset(
+    path: str, scholar_ids: Iterable[str], overwrite: bool = False
+) -> list[str]:
     """
-    Get a network of co-authors.
+    Fetch scholars and save them to a partitioned Parquet dataset.
+
+    Writes profiles, publications, citation_history and coauthors (edge
+    list) for each scholar.  Scholars already in the dataset are replaced,
+    others are left as they are, so a snapshot can be built up or refreshed
+    one scholar at a time.  Scholars that fail to fetch are skipped with a
+    warning.
 
     Parameters
     ----------
-    scholar_id : str
-    n_coauthors : int — how many coauthors to fetch per level
-    n_deep : int — depth of network exploration (1 recommended)
+    path : str — dataset directory (created if missing)
+    scholar_ids : list of str
+    overwrite : bool — delete any existing dataset at `path` first
 
     Returns
     -------
-    DataFrame with columns: author, coauthors.
+    The scholar IDs written.
     """
-    base = _list_coauthors(scholar_id, n_coauthors)
-    if base.empty:
-        return pd.DataFrame(columns=["author", "coauthors"])
+    _require_pyarrow()
+    path = os.path.expanduser(path)
+    if overwrite and os.path.isdir(path):
+        import shutil
+
+        _dataset_manifest(path)  # refuse to delete arbitrary directories
+        shutil.rmtree(path)
+    os.makedirs(path, exist_ok=True)
+    manifest_path = os.path.join(path, "_schema.json")
+    if os.path.exists(manifest_path):
+        _dataset_manifest(path)
+    else:
+        with open(manifest_path, "w", encoding="utf-8") as fh:
+            json.dump(
+                {
+                    "schema_version": _DATASET_SCHEMA_VERSION,
+                    "tables": list(_DATASET_TABLES),
+                    "partitioning": "hive:id",
+                },
+                fh,
+                indent=2,
+            )
 
-    all_frames = [base]
+    ids = list(dict.fromkeys(tidy_id(sid) for sid in scholar_ids))
 
-    current_urls = base["coauthors_url"].tolist()
-    for depth in range(n_deep):
-        next_frames = []
-        for ca_url in current_urls:
-            ca_id = _grab_id(ca_url)
-            if ca_id:
-                try:
-                    time.sleep(0.5)  # rate limit
-                    sub = _list_coauthors(ca_id, n_coauthors)
-                    next_frames.append(sub)
-                except Exception:
-                    continue
-        if not next_frames:
-            break
-        depth_df = pd.concat(next_frames, ignore_index=True)
-        all_frames.append(depth_df)
-        current_urls = depth_df["coauthors_url"].tolist()
+    def _save(sid: str) -> str:
+        for table, df in _scholar_tables(sid).items():
+            _write_partition(path, table, sid, df)
+        return sid
 
-    result = pd.concat(all_frames, ignore_index=True)
-    result = result[~result["coauthors"].str.contains("Sort by", na=False)]
-    result["author"] = result["author"].str.title()
-    result["coauthors"] = result["coauthors"].str.title()
-    return result[["author", "coauthors"]].reset_index(drop=True)
+    results = _map_concurrent(_save, ids, return_exceptions=True)
+    failed = [sid for sid, r in zip(ids, results) if isinstance(r, Exception)]
+    if failed:
+        warnings.warn(
+            f"Could not fetch {len(failed)} scholars; not saved: "
+            + ", ".join(failed)
+        )
+    return [sid for sid in ids if sid not in failed]
 
 
-def plot_coauthors(
-    network: pd.DataFrame, size_labels: int = 10, figsize: tuple = (12, 8)
-):
+def refresh_scholar_dataset(
+    path: str, scholar_ids: Optional[Iterable[str]] = None
+) -> pd.DataFrame:
     """
-    Plot a co-author network graph.
+    Bring stored scholars up to date with refresh_publications().
 
-    Requires: pip install networkx matplotlib
-    """
-    import networkx as nx
-    import matplotlib.pyplot as plt
+    Each scholar's partitions are rewritten with the refreshed data; the
+    stored profile total is used to decide how many pages to check.
 
-    G = nx.from_pandas_edgelist(network, "author", "coauthors")
-    closeness = nx.closeness_centrality(G)
+    Parameters
+    ----------
+    path : str — dataset directory written by save_scholar_dataset()
+    scholar_ids : list of str — default: every scholar in the dataset
 
-    pos = nx.spring_layout(G, k=2, seed=42)
-    sizes = [closeness.get(n, 0.1) * 3000 for n in G.nodes()]
+    Returns
+    -------
+    The changesets of all scholars, with an `id` column first.
+    """
+    stored = load_scholar_dataset(
+        path, scholar_ids, tables=["profiles", "publications"]
+    )
+    profiles, pubs = stored["profiles"], stored["publications"]
+    if scholar_ids is None:
+        scholar_ids = profiles["id"].tolist() if len(profiles) else []
+    ids = [tidy_id(sid) for sid in scholar_ids]
+    totals = (
+        dict(zip(profiles["id"], profiles["total_cites"])) if len(profiles) else {}
+    )
+    path = os.path.expanduser(path)
+
+    def _refresh(sid: str) -> pd.DataFrame:
+        bundle = get_profile_bundle(sid)
+        snapshot = pubs[pubs["id"] == sid].drop(columns="id")
+        if sid in totals and not pd.isna(totals[sid]):
+            fresh, changes = refresh_publications(
+                sid, snapshot, int(totals[sid]), bundle=bundle
+            )
+        else:  # no stored profile total to go by (or nothing stored yet)
+            fresh = get_publications(sid, bundle=bundle)
+            changes = _publication_changes(snapshot, fresh)
+        for table, df in _scholar_tables(sid, bundle, fresh).items():
+            _write_partition(path, table, sid, df)
+        return changes
+
+    results = _map_concurrent(_refresh, ids, return_exceptions=True)
+    frames = []
+    for sid, result in zip(ids, results):
+        if isinstance(result, Exception):
+            warnings.warn(f"Could not refresh {sid}: {result}")
+            continue
+        frames.append(result.assign(id=sid))
+    if not frames:
+        return pd.DataFrame(columns=["id"] + _CHANGE_COLUMNS)
+    out = pd.concat(frames, ignore_index=True)
+    return out[["id"] + _CHANGE_COLUMNS]
+
+
+def load_scholar_dataset(
+    path: str,
+    scholar_ids: Optional[Iterable[str]] = None,
+    tables: Optional[Iterable[str]] = None,
+    arrow: bool = False,
+) -> dict:
+    """
+    Load a dataset written by save_scholar_dataset().
 
-    fig, ax = plt.subplots(figsize=figsize)
-    nx.draw_networkx_edges(G, pos, alpha=0.3, ax=ax)
-    nx.draw_networkx_nodes(G, pos, node_size=sizes, alpha=0.5, ax=ax)
-    nx.draw_networkx_labels(G, pos, font_size=size_labels, ax=ax)
+    Files are memory-mapped; with arrow=True the Arrow tables are returned
+    as they are (zero-copy).  Otherwise each table becomes a DataFrame with
+    the same dtypes the live functions return, and an `id` column.
 
-    author_name = network["author"].iloc[0] if len(network) > 0 else "Unknown"
-    ax.set_title(f"Co-authorship Network of {author_name}", fontsize=16)
-    ax.axis("off")
-    plt.tight_layout()
-    return fig
+    Parameters
+    ----------
+    path : str — dataset directory
+    scholar_ids : list of str — only these scholars (default: all)
+    tables : list of str — subset of profiles, publications,
+        citation_history, coauthors (default: all)
+    arrow : bool — return pyarrow.Table objects instead of DataFrames
+
+    Returns
+    -------
+    dict mapping table name to DataFrame (or pyarrow.Table)
+    """
+    pa = _require_pyarrow()
+    import pyarrow.dataset as ds
+    from pyarrow import fs
+
+    path = os.path.expanduser(path)
+    _dataset_manifest(path)
+    tables = list(tables) if tables is not None else list(_DATASET_TABLES)
+    unknown = set(tables) - set(_DATASET_TABLES)
+    if unknown:
+        raise ValueError(f"Unknown dataset table(s): {sorted(unknown)}")
+
+    filesystem = fs.LocalFileSystem(use_mmap=True)
+    partitioning = ds.partitioning(pa.schema([("id", pa.string())]), flavor="hive")
+    row_filter = None
+    if scholar_ids is not None:
+        row_filter = ds.field("id").isin([tidy_id(sid) for sid in scholar_ids])
+
+    out = {}
+    for table in tables:
+        table_dir = os.path.join(path, table)
+        if not os.path.isdir(table_dir):
+            out[table] = pa.table({}) if arrow else pd.DataFrame()
+            continue
+        schema = _dataset_schema(table).append(pa.field("id", pa.string()))
+        data = ds.dataset(
+            table_dir,
+            schema=schema,
+            format="parquet",
+            partitioning=partitioning,
+            filesystem=filesystem,
+        ).to_table(filter=row_filter)
+        data = data.select(["id"] + [c for c in data.column_names if c != "id"])
+        out[table] = data if arrow else _dataset_frame(table, data)
+    return out
+
+
+def _dataset_frame(table: str, data) -> pd.DataFrame:
+    """Arrow table -> DataFrame with the dtypes of the live functions."""
+    import pyarrow as pa
+
+    string = _string_dtype()
+    df = data.to_pandas(
+        types_mapper={
+            pa.string(): string,
+            pa.large_string(): string,
+            pa.int32(): pd.Int32Dtype(),
+        }.get
+    )
+    if table == "publications":
+        df["journal"] = df["journal"].astype("category")
+    elif table == "profiles":
+        for col in ("fields", "coauthors"):
+            if col in df:
+                df[col] = df[col].map(list)
+        for col in ("available", "not_available"):
+            if col in df:
+                df[col] = df[col].astype("Int64")  # None when not shown
+    return df
 
 
 # ---------------------------------------------------------------------------
-# Journal ranking / impact factor stubs
+# Async API  (scholar.aio)
 # ---------------------------------------------------------------------------
-# The R package ships bundled datasets (impactfactor, journalrankings)
-# stored in sysdata.rda. We provide lookup via web search instead.
 
 
-def get_impactfactor(journals: list[str]) -> pd.DataFrame:
+class _AsyncScholar:
     """
-    Stub: The R package uses a bundled dataset for impact factor lookup.
-    This Python version returns a placeholder DataFrame.
+    Awaitable versions of the main functions, e.g. `await aio.get_profile(id)`.
 
-    For real data, consider using the `pybliometrics` or `scholarly` packages,
-    or load the Scimago/JCR data yourself.
+    Requests share one httpx.AsyncClient connection pool per event loop,
+    plus the same rate limiter and response cache as the sync API; pages
+    are parsed by the same helpers, and cache reads and writes run in a
+    worker thread.  Call `await aio.aclose()` before a loop ends to close
+    its connections.  Requires: pip install httpx
     """
-    warnings.warn(
-        "Impact factor data not bundled. Returning empty results. "
-        "Consider loading Scimago/JCR data manually."
-    )
-    return pd.DataFrame({"journal": journals, "impact_factor": [None] * len(journals)})
 
+    def __init__(self):
+        # Event loop -> (client, per-host semaphores).  Each loop keeps its
+        # own, so loops in different threads never share or replace one.
+        self._clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def _loop_state(self) -> tuple[Any, dict[str, asyncio.Semaphore]]:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            state = self._clients.get(loop)
+            if state is None:
+                # Clients of loops that have closed can no longer be closed
+                # from here; drop them so their connections are collected.
+                for old in [old for old in self._clients if old.is_closed()]:
+                    del self._clients[old]
+                state = self._clients[loop] = (self._new_client(), {})
+        return state
+
+    @staticmethod
+    def _new_client():
+        import httpx
+
+        return httpx.AsyncClient(
+            headers=_default_headers(),
+            timeout=30,
+            follow_redirects=True,
+            transport=httpx.AsyncHTTPTransport(
+                http2=_TRANSPORT["http2"],
+                retries=_TRANSPORT["connect_retries"],
+                limits=httpx.Limits(max_connections=_MAX_WORKERS * _PER_HOST),
+            ),
+        )
 
-def get_journalrank(journals: list[str]) -> pd.DataFrame:
-    """
-    Stub: The R package uses a bundled dataset for journal ranking lookup.
-    See get_impactfactor() note.
-    """
-    warnings.warn(
-        "Journal ranking data not bundled. Returning empty results. "
-        "Consider loading Scimago/JCR data manually."
-    )
-    return pd.DataFrame({"journal": journals, "rank": [None] * len(journals)})
+    async def aclose(self) -> None:
+        """Close the running event loop's connection pool."""
+        with self._lock:
+            state = self._clients.pop(asyncio.get_running_loop(), None)
+        if state is not None:
+            await state[0].aclose()
+
+    async def get_scholar_resp(
+        self,
+        url: str,
+        attempts_left: Optional[int] = None,
+        delay: Optional[float] = None,
+        policy: Optional[RetryPolicy] = None,
+    ):
+        """Async get_scholar_resp: cache, rate limit, retry policy, breaker."""
+        started = time.perf_counter()
+        cache = _CACHE
+        if cache is not None:
+            cached = await asyncio.to_thread(cache.get, url)
+            if cached is not None:
+                _emit_fetch(url, started, cached, cache="hit")
+                return cached
+            if cache.offline:
+                raise ConnectionError(
+                    f"Offline mode: {url} is not in the response cache."
+                )
+
+        run = _RetryRun(url, _effective_policy(policy, attempts_left, delay))
+        cache_state = "off" if cache is None else "miss"
+        try:
+            resp = await self._fetch(run)
+        except Exception as exc:
+            _emit_fetch(
+                url, started, cache=cache_state, retries=run.attempt, error=exc
+            )
+            raise
+        if cache is not None:
+            await asyncio.to_thread(cache.put, url, resp)
+        _emit_fetch(url, started, resp, cache=cache_state, retries=run.attempt)
+        return resp
+
+    async def _fetch(self, run: _RetryRun):
+        url = run.url
+        client, host_slots = self._loop_state()
+        host = urlsplit(url).netloc.lower()
+        slot = host_slots.get(host)
+        if slot is None:
+            slot = host_slots[host] = asyncio.Semaphore(_PER_HOST)
+
+        while True:
+            await asyncio.sleep(run.wait())
+            await asyncio.sleep(_RATE_LIMITER.reserve())
+            try:
+                async with slot:
+                    resp = await client.get(
+                        url, extensions={"trace": _httpx_trace(is_async=True)}
+                    )
+            except _transient_errors() as exc:
+                pause = run.record(error=exc)
+            else:
+                _CONN_STATS.add(
+                    requests=1,
+                    bytes_wire=resp.num_bytes_downloaded,
+                    bytes_body=len(resp.content),
+                )
+                pause = run.record(resp)
+                if pause is None:
+                    return resp
+            await asyncio.sleep(pause)
+
+    async def _parse_html(self, url: str, region: Optional[str] = None) -> _Node:
+        resp = await self.get_scholar_resp(url)
+        return _timed_parse(url, resp.text, region)
+
+    @_instrumented(name="aio.get_profile")
+    async def get_profile(self, scholar_id: str) -> dict:
+        """Async get_profile()."""
+        scholar_id = tidy_id(scholar_id)
+        page = await self._parse_html(_profile_url(scholar_id))
+        return _parse_profile(page, scholar_id)
+
+    @_instrumented(name="aio.get_publications")
+    async def get_publications(
+        self,
+        scholar_id: str,
+        cstart: int = 0,
+        cstop: int = float("inf"),
+        pagesize: int = 100,
+        sortby: str = "citation",
+    ) -> pd.DataFrame:
+        """Async get_publications()."""
+        scholar_id = tidy_id(scholar_id)
+        if pagesize > 100:
+            warnings.warn("pagesize exceeds 100; capping at 100.")
+            pagesize = 100
+        assert sortby in ("citation", "year"), "sortby must be 'citation' or 'year'"
+
+        columns: dict[str, list] = {col: [] for col in _PUBLICATION_COLUMNS}
+        while True:
+            url = _publications_url(scholar_id, cstart, pagesize, sortby)
+            page = _parse_publication_columns(await self._parse_html(url))
+            for col, values in page.items():
+                columns[col].extend(values)
+            if len(page["title"]) < pagesize or cstart + pagesize >= cstop:
+                break
+            cstart += pagesize
+        return _publication_frame(columns)
+
+    @_instrumented(name="aio.get_article_cite_history")
+    async def get_article_cite_history(
+        self, scholar_id: str, article_pubid: str
+    ) -> pd.DataFrame:
+        """Async get_article_cite_history()."""
+        scholar_id = tidy_id(scholar_id)
+        url = _publication_page_url(scholar_id, article_pubid)
+        page = await self._parse_html(url, region="article_history")
+        return _parse_article_cite_history(page, article_pubid)
+
+    @_instrumented(name="aio.get_complete_authors")
+    async def get_complete_authors(
+        self,
+        scholar_id: str,
+        pubid: str | list[str],
+        initials: bool = True,
+    ) -> str | list[str]:
+        """Async get_complete_authors(); pacing comes from the rate limiter."""
+        scholar_id = tidy_id(scholar_id)
+        single = isinstance(pubid, str)
+        pubids = [pubid] if single else list(pubid)
+
+        async def _one(pid: str) -> str:
+            url = _publication_page_url(scholar_id, pid)
+            page = await self._parse_html(url, region="fields")
+            text = _parse_complete_authors(page)
+            return _to_initials(text) if initials else text
+
+        results = await asyncio.gather(*(_one(pid) for pid in pubids))
+        return results[0] if single else list(results)
+
+    @_instrumented(name="aio.compare_scholars")
+    async def compare_scholars(
+        self, ids: list[str], pagesize: int = 100
+    ) -> pd.DataFrame:
+        """Async compare_scholars()."""
+
+        async def _one(sid: str) -> tuple[pd.DataFrame, str]:
+            if pagesize != 100:
+                prof, pubs = await asyncio.gather(
+                    self.get_profile(sid),
+                    self.get_publications(sid, pagesize=pagesize),
+                )
+                return _yearly_citations(pubs, sid), prof["name"]
+            # As the sync path: the pagesize=100 page carries the profile
+            page = await self._parse_html(_publications_url(sid, 0, 100, "citation"))
+            first = _publication_frame(_parse_publication_columns(page))
+            pubs = first
+            if len(first) == 100:
+                rest = await self.get_publications(sid, cstart=100)
+                pubs = pd.concat([first, rest], ignore_index=True)
+            return _yearly_citations(pubs, sid), _parse_profile(page, sid)["name"]
+
+        ids = [tidy_id(sid) for sid in ids]
+        results = await asyncio.gather(*(_one(sid) for sid in ids))
+        return _combine_comparison(ids, list(results))
+
+    async def _list_coauthors(
+        self, scholar_id: str, n_coauthors: int = 5
+    ) -> pd.DataFrame:
+        scholar_id = tidy_id(scholar_id)
+        if not scholar_id or scholar_id == "nan":
+            return pd.DataFrame(
+                columns=["author", "author_url", "coauthors", "coauthors_url"]
+            )
+        page = await self._parse_html(_profile_url(scholar_id))
+        return _parse_coauthors(page, scholar_id, n_coauthors)
+
+    @_instrumented(name="aio.get_coauthors")
+    async def get_coauthors(
+        self, scholar_id: str, n_coauthors: int = 5, n_deep: int = 1
+    ) -> pd.DataFrame:
+        """Async get_coauthors()."""
+        base = await self._list_coauthors(scholar_id, n_coauthors)
+        if base.empty:
+            return pd.DataFrame(columns=["author", "coauthors"])
+
+        all_frames = [base]
+        seen: dict[str, Any] = {tidy_id(scholar_id): base}
+        current_urls = base["coauthors_url"].tolist()
+        for depth in range(n_deep):
+            ca_ids = [i for i in map(_grab_id, current_urls) if i]
+            new_ids = [i for i in dict.fromkeys(ca_ids) if i not in seen]
+            subs = await asyncio.gather(
+                *(self._list_coauthors(ca_id, n_coauthors) for ca_id in new_ids),
+                return_exceptions=True,
+            )
+            seen.update(zip(new_ids, subs))
+            next_frames = [
+                seen[i] for i in ca_ids if not isinstance(seen[i], BaseException)
+            ]
+            if not next_frames:
+                break
+            depth_df = pd.concat(next_frames, ignore_index=True)
+            all_frames.append(depth_df)
+            current_urls = depth_df["coauthors_url"].tolist()
+
+        return _tidy_coauthor_network(all_frames)
+
+
+aio = _AsyncScholar()
 
 
 # ---------------------------------------------------------------------------
@@ -939,9 +5475,12 @@ def get_journalrank(journals: list[str]) -> pd.DataFrame:
 # ---------------------------------------------------------------------------
 
 
-def scholar_summary(scholar_id: str) -> str:
+@_instrumented
+def scholar_summary(
+    scholar_id: str, bundle: Optional[ScholarProfilePage] = None
+) -> str:
     """Print a formatted summary of a scholar's profile."""
-    prof = get_profile(scholar_id)
+    prof = get_profile(scholar_id, bundle=bundle)
     lines = [
         f"Name:        {prof['name']}",
         f"Affiliation: {prof['affiliation']}",
@@ -962,18 +5501,39 @@ def scholar_summary(scholar_id: str) -> str:
 __all__ = [
     # Config
     "set_scholar_mirror",
+    "set_scholar_cache",
+    "clear_scholar_cache",
+    "set_fetch_limits",
+    "RetryPolicy",
+    "set_retry_policy",
+    "set_transport",
+    "get_connection_stats",
+    "set_html_parser",
+    "add_instrumentation_hook",
+    "remove_instrumentation_hook",
+    "collect_metrics",
+    "MetricsCollector",
     "tidy_id",
     "get_scholar_resp",
     # Profile
     "get_profile",
     "get_scholar_id",
+    "get_profile_bundle",
+    "ScholarProfilePage",
     # Publications
     "get_publications",
+    "get_top_publications",
+    "iter_publication_pages",
+    "set_string_storage",
+    "refresh_publications",
     "get_article_cite_history",
+    "get_all_article_cite_histories",
     "get_num_articles",
     "get_oldest_article",
     "get_num_distinct_journals",
     "get_num_top_journals",
+    "set_publication_memo_ttl",
+    "clear_publication_memo",
     # Publication details
     "get_publication_abstract",
     "get_publication_url",
@@ -981,6 +5541,7 @@ __all__ = [
     "get_publication_data_extended",
     "get_article_scholar_url",
     "get_complete_authors",
+    "get_publication_details",
     # Citation history
     "get_citation_history",
     # Comparison
@@ -988,14 +5549,42 @@ __all__ = [
     "compare_scholar_careers",
     # Author analysis
     "author_position",
+    "author_positions",
+    "authorship_shares",
+    # Citation metrics
+    "citation_metrics",
+    "get_citation_metrics",
+    "windowed_h_index",
     # Prediction
     "predict_h_index",
+    "predict_h_index_batch",
+    "get_h_index_features",
     # Coauthors
     "get_coauthors",
+    "iter_coauthor_network",
+    "crawl_coauthor_network",
+    "CoauthorNode",
     "plot_coauthors",
-    # Journal metrics (stubs)
+    # Network analytics
+    "network_centrality",
+    "network_communities",
+    "referee_independence",
+    "network_layout",
+    # Journal metrics
     "get_impactfactor",
     "get_journalrank",
+    "add_journal_metrics",
+    "set_journal_index",
+    "load_journal_index",
+    "JournalIndex",
+    # Batch crawling
+    "CrawlJob",
+    # Datasets
+    "save_scholar_dataset",
+    "refresh_scholar_dataset",
+    "load_scholar_dataset",
     # Convenience
     "scholar_summary",
+    # Async API
+    "aio",
 ]